@@ -9,6 +9,7 @@ from openai import AsyncOpenAI
 
 from src.config import settings
 from src.mcp.base import MCPTool
+from src.observability.keywords_ai import keywords_ai_cache_body
 
 logger = structlog.get_logger()
 
@@ -136,15 +137,8 @@ class BaseAgent(ABC):
             kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
 
-        # Add Keywords AI caching parameters
-        if settings.keywords_ai_cache_enabled:
-            kwargs["extra_body"] = {
-                "cache_enabled": True,
-                "cache_ttl": settings.keywords_ai_cache_ttl,
-                "cache_options": {
-                    "cache_by_customer": settings.keywords_ai_cache_by_customer,
-                },
-            }
+        # Keywords AI gateway caching (empty when disabled)
+        kwargs["extra_body"] = keywords_ai_cache_body()
 
         response = await self.client.chat.completions.create(**kwargs)
         message = response.choices[0].message
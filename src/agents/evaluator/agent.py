@@ -27,6 +27,8 @@ from src.agents.evaluator.schemas import (
     EvaluatorConfig,
 )
 from src.config import settings
+from src.config_secrets import KEYWORDS_AI_API_KEY
+from src.observability.keywords_ai import keywords_ai_cache_body
 
 logger = structlog.get_logger()
 
@@ -225,8 +227,9 @@ class EvaluatorAgent(BaseAgent):
             eval_inputs=eval_inputs,
         )
 
-        # Build request body with eval_params
+        # Build request body with eval_params and gateway caching
         extra_body: dict[str, Any] = {
+            **keywords_ai_cache_body(),
             "eval_params": eval_params.model_dump(exclude_none=True),
         }
 
@@ -236,11 +239,6 @@ class EvaluatorAgent(BaseAgent):
         if metadata:
             extra_body["metadata"] = metadata
 
-        # Add caching if enabled
-        if settings.keywords_ai_cache_enabled:
-            extra_body["cache_enabled"] = True
-            extra_body["cache_ttl"] = settings.keywords_ai_cache_ttl
-
         try:
             response = await self.eval_client.chat.completions.create(
                 model=use_model,
@@ -394,7 +392,7 @@ class EvaluatorAgent(BaseAgent):
         The Logging API allows evaluating existing completions
         without making a new LLM call.
         """
-        import httpx
+        from src.http_client import http_client
 
         logging_url = f"{settings.keywords_ai_base_url}request-logs/create/"
 
@@ -413,50 +411,50 @@ class EvaluatorAgent(BaseAgent):
             payload["metadata"] = request.metadata
 
         headers = {
-            "Authorization": f"Bearer {settings.keywords_ai_api_key.get_secret_value()}",
+            "Authorization": f"Bearer {KEYWORDS_AI_API_KEY}",
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                logging_url,
-                json=payload,
-                headers=headers,
-                timeout=30.0,
-            )
-
-            if response.status_code not in (200, 201):
-                error_msg = f"Logging API error: {response.status_code} - {response.text}"
-                logger.error(error_msg)
-                return EvaluationResponse(
-                    status=EvaluationStatus.FAILED,
-                    results=[EvaluationResult(
-                        evaluator_slug="all",
-                        error=error_msg,
-                    )],
-                    model=request.model,
-                    total_evaluators=len(request.eval_params.evaluators),
-                    error_count=len(request.eval_params.evaluators),
-                )
+        client = http_client.client
+        response = await client.post(
+            logging_url,
+            json=payload,
+            headers=headers,
+            timeout=30.0,
+        )
 
-            # Evaluations are processed asynchronously by Keywords AI
-            # Results are available in the Keywords AI dashboard
+        if response.status_code not in (200, 201):
+            error_msg = f"Logging API error: {response.status_code} - {response.text}"
+            logger.error(error_msg)
             return EvaluationResponse(
-                status=EvaluationStatus.PENDING,
-                results=[
-                    EvaluationResult(
-                        evaluator_slug=e.evaluator_id,
-                        reasoning="Evaluation submitted - check Keywords AI dashboard for results",
-                    )
-                    for e in request.eval_params.evaluators
-                ],
+                status=EvaluationStatus.FAILED,
+                results=[EvaluationResult(
+                    evaluator_slug="all",
+                    error=error_msg,
+                )],
                 model=request.model,
                 total_evaluators=len(request.eval_params.evaluators),
-                metadata={
-                    "note": "Evaluations run asynchronously. View results in Keywords AI Logs.",
-                },
+                error_count=len(request.eval_params.evaluators),
             )
 
+        # Evaluations are processed asynchronously by Keywords AI
+        # Results are available in the Keywords AI dashboard
+        return EvaluationResponse(
+            status=EvaluationStatus.PENDING,
+            results=[
+                EvaluationResult(
+                    evaluator_slug=e.evaluator_id,
+                    reasoning="Evaluation submitted - check Keywords AI dashboard for results",
+                )
+                for e in request.eval_params.evaluators
+            ],
+            model=request.model,
+            total_evaluators=len(request.eval_params.evaluators),
+            metadata={
+                "note": "Evaluations run asynchronously. View results in Keywords AI Logs.",
+            },
+        )
+
     def _format_evaluation_history(
         self,
         history: list[dict[str, Any]],
@@ -189,7 +189,7 @@ Content: {content}
         contexts = await neo4j_client.get_recent_contexts(topic_id=topic_id, limit=20)
 
         # Get summaries
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.read_session() as session:
             result = await session.run(
                 """
                 MATCH (t:Topic {id: $topic_id})-[:HAS_SUMMARY]->(s:Summary)
@@ -114,7 +114,7 @@ class HybridRetriever:
         """
 
         try:
-            async with neo4j_client.driver.session() as session:
+            async with neo4j_client.read_session() as session:
                 result = await session.run(cypher, query=query, limit=limit)
                 records = await result.data()
 
@@ -181,6 +181,8 @@ async def direct_response_node(state: ConversationState) -> dict[str, Any]:
     from openai import AsyncOpenAI
 
     from src.config import settings
+    from src.config_secrets import ANTHROPIC_API_KEY, KEYWORDS_AI_API_KEY
+    from src.observability.keywords_ai import keywords_ai_cache_body
 
     query = state["current_query"]
     user_name = state.get("user_name", "there")
@@ -196,7 +198,7 @@ async def direct_response_node(state: ConversationState) -> dict[str, Any]:
 
     if settings.llm_provider == "keywords_ai":
         client = AsyncOpenAI(
-            api_key=settings.keywords_ai_api_key.get_secret_value(),
+            api_key=KEYWORDS_AI_API_KEY,
             base_url=settings.keywords_ai_base_url,
         )
 
@@ -210,20 +212,13 @@ async def direct_response_node(state: ConversationState) -> dict[str, Any]:
             ],
         }
 
-        # Add caching parameters if enabled
-        if settings.keywords_ai_cache_enabled:
-            kwargs["extra_body"] = {
-                "cache_enabled": True,
-                "cache_ttl": settings.keywords_ai_cache_ttl,
-                "cache_options": {
-                    "cache_by_customer": settings.keywords_ai_cache_by_customer,
-                },
-            }
+        # Keywords AI gateway caching (empty when disabled)
+        kwargs["extra_body"] = keywords_ai_cache_body()
 
         response = await client.chat.completions.create(**kwargs)
         response_text = response.choices[0].message.content
     else:
-        client = AsyncAnthropic(api_key=settings.anthropic_api_key.get_secret_value())
+        client = AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
         response = await client.messages.create(
             model=settings.anthropic_fast_model,
             max_tokens=500,
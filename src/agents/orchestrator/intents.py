@@ -7,6 +7,7 @@ from anthropic import AsyncAnthropic
 from openai import AsyncOpenAI
 
 from src.config import settings
+from src.observability.keywords_ai import keywords_ai_cache_body
 
 # Type alias for keyword arguments
 KwargsDict = dict[str, Any]
@@ -134,15 +135,8 @@ Response: knowledge|0.9
                 "max_tokens": 50,
             }
 
-            # Add caching parameters if enabled
-            if settings.keywords_ai_cache_enabled:
-                kwargs["extra_body"] = {
-                    "cache_enabled": True,
-                    "cache_ttl": settings.keywords_ai_cache_ttl,
-                    "cache_options": {
-                        "cache_by_customer": settings.keywords_ai_cache_by_customer,
-                    },
-                }
+            # Keywords AI gateway caching (empty when disabled)
+            kwargs["extra_body"] = keywords_ai_cache_body()
 
             response = await self.client.chat.completions.create(**kwargs)
             result = response.choices[0].message.content.strip()
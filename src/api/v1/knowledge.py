@@ -1,5 +1,6 @@
 """Knowledge API endpoints."""
 
+from collections.abc import Mapping
 from typing import Any
 from uuid import uuid4
 
@@ -405,6 +406,7 @@ async def update_node(
     if request.metadata is not None:
         updates.update(request.metadata)
 
+    node: Mapping[str, Any] | None
     if updates:
         node = await neo4j_client.update_node(node_id, updates)
     else:
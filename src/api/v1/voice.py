@@ -83,38 +83,38 @@ class DeepgramSTT:
 
     async def transcribe_audio(self, audio_data: bytes) -> str:
         """Transcribe audio data to text."""
-        import httpx
+        from src.http_client import http_client
 
         if not self.api_key:
             logger.warning("Deepgram API key not configured")
             return ""
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.deepgram.com/v1/listen",
-                headers={
-                    "Authorization": f"Token {self.api_key}",
-                    "Content-Type": "audio/wav",
-                },
-                content=audio_data,
-                params={
-                    "model": "nova-2",
-                    "smart_format": "true",
-                },
-            )
+        client = http_client.client
+        response = await client.post(
+            "https://api.deepgram.com/v1/listen",
+            headers={
+                "Authorization": f"Token {self.api_key}",
+                "Content-Type": "audio/wav",
+            },
+            content=audio_data,
+            params={
+                "model": "nova-2",
+                "smart_format": "true",
+            },
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                transcript = (
-                    data.get("results", {})
-                    .get("channels", [{}])[0]
-                    .get("alternatives", [{}])[0]
-                    .get("transcript", "")
-                )
-                return transcript
+        if response.status_code == 200:
+            data = response.json()
+            transcript = (
+                data.get("results", {})
+                .get("channels", [{}])[0]
+                .get("alternatives", [{}])[0]
+                .get("transcript", "")
+            )
+            return transcript
 
-            logger.error("Deepgram error", status=response.status_code)
-            return ""
+        logger.error("Deepgram error", status=response.status_code)
+        return ""
 
 
 class ElevenLabsTTS:
@@ -126,61 +126,61 @@ class ElevenLabsTTS:
 
     async def synthesize(self, text: str) -> bytes:
         """Synthesize text to speech audio."""
-        import httpx
+        from src.http_client import http_client
 
         if not self.api_key:
             logger.warning("ElevenLabs API key not configured")
             return b""
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"https://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}",
-                headers={
-                    "xi-api-key": self.api_key,
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "text": text,
-                    "model_id": "eleven_monolingual_v1",
-                    "voice_settings": {
-                        "stability": 0.5,
-                        "similarity_boost": 0.75,
-                    },
+        client = http_client.client
+        response = await client.post(
+            f"https://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}",
+            headers={
+                "xi-api-key": self.api_key,
+                "Content-Type": "application/json",
+            },
+            json={
+                "text": text,
+                "model_id": "eleven_monolingual_v1",
+                "voice_settings": {
+                    "stability": 0.5,
+                    "similarity_boost": 0.75,
                 },
-            )
+            },
+        )
 
-            if response.status_code == 200:
-                return response.content
+        if response.status_code == 200:
+            return response.content
 
-            logger.error("ElevenLabs error", status=response.status_code)
-            return b""
+        logger.error("ElevenLabs error", status=response.status_code)
+        return b""
 
     async def synthesize_stream(self, text: str):
         """Stream synthesized audio chunks."""
-        import httpx
+        from src.http_client import http_client
 
         if not self.api_key:
             return
 
-        async with httpx.AsyncClient() as client:
-            async with client.stream(
-                "POST",
-                f"https://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}/stream",
-                headers={
-                    "xi-api-key": self.api_key,
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "text": text,
-                    "model_id": "eleven_monolingual_v1",
-                    "voice_settings": {
-                        "stability": 0.5,
-                        "similarity_boost": 0.75,
-                    },
+        client = http_client.client
+        async with client.stream(
+            "POST",
+            f"https://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}/stream",
+            headers={
+                "xi-api-key": self.api_key,
+                "Content-Type": "application/json",
+            },
+            json={
+                "text": text,
+                "model_id": "eleven_monolingual_v1",
+                "voice_settings": {
+                    "stability": 0.5,
+                    "similarity_boost": 0.75,
                 },
-            ) as response:
-                async for chunk in response.aiter_bytes(chunk_size=1024):
-                    yield chunk
+            },
+        ) as response:
+            async for chunk in response.aiter_bytes(chunk_size=1024):
+                yield chunk
 
 
 # Initialize clients
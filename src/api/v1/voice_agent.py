@@ -10,11 +10,13 @@ import asyncio
 import base64
 import json
 from typing import Any
+from uuid import UUID
 
 import structlog
 from fastapi import APIRouter, HTTPException, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import Response
-from pydantic import BaseModel
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, Field, ValidationError
 
 import websockets
 from websockets.exceptions import ConnectionClosed
@@ -23,9 +25,9 @@ from src.voice.agent import voice_onboarding_agent
 from src.voice.elevenlabs_client import elevenlabs_client
 from src.voice.zoom_integration import zoom_integration, zoom_webhook_handler
 from src.voice.zoom_bot import zoom_meeting_bot, test_zoom_connection
-from src.voice.realtime_zoom import zoom_realtime_bot, playwright_zoom_bot
+from src.voice.realtime_zoom import BotCapacityError, zoom_realtime_bot, playwright_zoom_bot
 from src.api.v1.voice import stt_client  # Import STT client for audio transcription
-from src.config import settings
+from src.config_secrets import ELEVENLABS_API_KEY
 
 # ElevenLabs Conversational AI Agent configuration
 ELEVENLABS_AGENT_ID = "agent_4601kgc1063efqn8b3c4qea00sey"
@@ -33,7 +35,11 @@ ELEVENLABS_CONVAI_URL = f"wss://api.elevenlabs.io/v1/convai/conversation?agent_i
 
 logger = structlog.get_logger()
 
-router = APIRouter(prefix="/agent", tags=["voice-agent"])
+router = APIRouter(
+    prefix="/agent",
+    tags=["voice-agent"],
+    default_response_class=ORJSONResponse,
+)
 
 
 # Request/Response Models
@@ -264,7 +270,7 @@ async def elevenlabs_convai_websocket(websocket: WebSocket):
 
     try:
         # Get API key
-        api_key = settings.elevenlabs_api_key.get_secret_value()
+        api_key = ELEVENLABS_API_KEY
         if not api_key:
             await websocket.send_json({"type": "error", "message": "ElevenLabs API key not configured"})
             await websocket.close(code=4001, reason="API key not configured")
@@ -871,13 +877,35 @@ class BrowserBotJoinRequest(BaseModel):
     user_department: str | None = None
 
 
-@router.post("/zoom/browser/join")
-async def join_zoom_with_browser(request: BrowserBotJoinRequest):
+class BrowserBotSpeakRequest(BaseModel):
+    """Request to make the browser bot speak in the meeting."""
+    # Capped to bound ElevenLabs cost and how long playback holds the page
+    text: str = Field(..., min_length=1, max_length=1000)
+
+
+@router.post(
+    "/zoom/browser/join",
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": BrowserBotJoinRequest.model_json_schema()}},
+            "required": True,
+        },
+    },
+)
+async def join_zoom_with_browser(raw_request: Request):
     """Join a Zoom meeting using a browser-based bot.
     
     This actually opens a browser and joins the Zoom web client.
     The bot will appear as a participant in the meeting.
     """
+    # Validate the raw body in one pass instead of json.loads then model validation
+    try:
+        request = BrowserBotJoinRequest.model_validate_json(await raw_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
     try:
         result = await playwright_zoom_bot.join_meeting_browser(
             meeting_url=request.meeting_url,
@@ -886,6 +914,8 @@ async def join_zoom_with_browser(request: BrowserBotJoinRequest):
             user_department=request.user_department,
         )
         return result
+    except BotCapacityError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         logger.error("Failed to join with browser bot", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
@@ -894,35 +924,32 @@ async def join_zoom_with_browser(request: BrowserBotJoinRequest):
 @router.get("/zoom/browser/list")
 async def list_browser_bots():
     """List all active browser-based Zoom bots."""
-    return {
-        "bots": playwright_zoom_bot.list_bots(),
-        "count": len(playwright_zoom_bot.active_bots),
-    }
+    return Response(content=playwright_zoom_bot.list_bots_json(), media_type="application/json")
 
 
 @router.get("/zoom/browser/{session_id}")
-async def get_browser_bot_status(session_id: str):
+async def get_browser_bot_status(session_id: UUID):
     """Get status of a browser-based Zoom bot."""
-    status = playwright_zoom_bot.get_status(session_id)
+    status = playwright_zoom_bot.get_status(str(session_id))
     if not status:
         raise HTTPException(status_code=404, detail="Bot session not found")
     return status
 
 
 @router.post("/zoom/browser/{session_id}/speak")
-async def browser_bot_speak(session_id: str, text: str):
+async def browser_bot_speak(session_id: UUID, request: BrowserBotSpeakRequest):
     """Make the browser bot speak in the meeting.
     
     Generates audio and plays it through the browser into the meeting.
     """
-    result = await playwright_zoom_bot.speak_in_meeting(session_id, text)
+    result = await playwright_zoom_bot.speak_in_meeting(str(session_id), request.text)
     return result
 
 
 @router.delete("/zoom/browser/{session_id}")
-async def leave_zoom_browser(session_id: str):
+async def leave_zoom_browser(session_id: UUID):
     """Leave the Zoom meeting and close the browser."""
-    result = await playwright_zoom_bot.leave_meeting(session_id)
+    result = await playwright_zoom_bot.leave_meeting(str(session_id))
     if result.get("status") == "not_found":
         raise HTTPException(status_code=404, detail="Bot session not found")
     return result
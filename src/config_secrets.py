@@ -0,0 +1,16 @@
+"""Unwrapped secret values resolved once at import time.
+
+Settings keeps every credential wrapped in ``SecretStr`` so it is never
+logged by accident. Request-path code that needs the raw value imports it
+from here instead of calling ``get_secret_value()`` on every request.
+"""
+
+from src.config import settings
+
+ANTHROPIC_API_KEY = settings.anthropic_api_key.get_secret_value()
+KEYWORDS_AI_API_KEY = settings.keywords_ai_api_key.get_secret_value()
+VOYAGE_API_KEY = settings.voyage_api_key.get_secret_value()
+OPENAI_API_KEY = settings.openai_api_key.get_secret_value()
+ELEVENLABS_API_KEY = settings.elevenlabs_api_key.get_secret_value()
+ZOOM_CLIENT_SECRET = settings.zoom_client_secret.get_secret_value()
+JWT_SECRET = settings.jwt_secret_key.get_secret_value()
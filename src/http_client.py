@@ -0,0 +1,47 @@
+"""Shared outbound HTTP client for third-party provider calls."""
+
+import httpx
+import structlog
+
+logger = structlog.get_logger()
+
+
+class SharedHTTPClient:
+    """Pooled async HTTP client reused across provider integrations.
+
+    One client keeps TLS sessions and keep-alive connections to ElevenLabs,
+    Deepgram, Zoom and friends warm instead of paying a handshake per call.
+    """
+
+    def __init__(self):
+        self._client: httpx.AsyncClient | None = None
+
+    def _build(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=200),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+
+    async def connect(self) -> None:
+        """Create the pooled client."""
+        if self._client is None or self._client.is_closed:
+            self._client = self._build()
+            logger.info("Shared HTTP client created")
+
+    async def close(self) -> None:
+        """Close the pooled client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the pooled client, creating it on first use outside the app lifespan."""
+        if self._client is None or self._client.is_closed:
+            self._client = self._build()
+        return self._client
+
+
+# Singleton instance
+http_client = SharedHTTPClient()
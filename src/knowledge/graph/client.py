@@ -1,11 +1,27 @@
 """Neo4j client for knowledge graph operations."""
 
 import asyncio
-from typing import Any
+import math
+import re
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Hashable, Iterable, Mapping, Sequence
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
 import structlog
-from neo4j import AsyncGraphDatabase, AsyncDriver
+from neo4j import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncSession,
+    Record,
+    RoutingControl,
+)
 
 from src.config import settings
 from src.knowledge.graph.schema import (
@@ -15,30 +31,487 @@ from src.knowledge.graph.schema import (
     RelationshipTypes,
 )
 
+if TYPE_CHECKING:
+    from src.knowledge.graph.queries import CypherQuery
+
 logger = structlog.get_logger()
 
+# Records buffered per network fetch when streaming large result sets
+STREAM_FETCH_SIZE = 1000
+
+# Rows sent per UNWIND transaction by the bulk create methods
+BULK_BATCH_SIZE = 10_000
+
+# Longest startup will wait for newly created indexes to come online
+SCHEMA_AWAIT_SECONDS = 300
+
+# Name of the constraint or index a schema DDL statement creates; unnamed
+# statements go straight to IF NOT EXISTS or FOR
+_SCHEMA_NAME = re.compile(r"(?:CONSTRAINT|INDEX) (?!IF\b|FOR\b)(\w+)")
+
+_TAG_SEPARATORS = str.maketrans(" _", "--")
+
+# Labels and relationship types the seeding helpers may splice into Cypher
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Characters with meaning in Lucene query syntax
+_LUCENE_SPECIAL = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+
+# Deepest hierarchy traversal get_hierarchy will compile into a query
+MAX_HIERARCHY_DEPTH = 10
+
+
+# The index names are a parameter, so every combination of node types
+# shares one query text and one cached plan; the union is ranked server-side
+_FULLTEXT_SEARCH_QUERY = """
+    UNWIND $indexes AS index
+    CALL db.index.fulltext.queryNodes(index, $query_text, {limit: $limit})
+    YIELD node, score
+    RETURN properties(node) as node, score, labels(node) as labels
+    ORDER BY score DESC
+    LIMIT $limit
+    """
+
+_FULLTEXT_INDEXES: dict[NodeLabels, str] = {
+    NodeLabels.CONTEXT: "context_content",
+    NodeLabels.SUMMARY: "summary_content",
+    NodeLabels.DECISION: "decision_content",
+}
+
+_DEFAULT_FULLTEXT_INDEXES: tuple[str, ...] = tuple(_FULLTEXT_INDEXES.values())
+
+
+def _escape_lucene(text: str) -> str:
+    """Escape free text so the full-text index matches it literally."""
+    return _LUCENE_SPECIAL.sub(r"\\\1", text)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_tag(name: str) -> str:
+    """Normalize a tag name (lowercase, hyphenated)."""
+    return name.lower().translate(_TAG_SEPARATORS)
+
+
+# Query text for label/type/direction variants, built once at import so hot
+# paths do no string work and Neo4j sees identical text for its plan cache
+
+_GET_NODE_QUERIES: dict[NodeLabels | None, str] = {
+    None: "MATCH (n {id: $id}) RETURN properties(n) as n, labels(n) as labels",
+    **{
+        label: f"MATCH (n:{label.value} {{id: $id}}) RETURN properties(n) as n"
+        for label in NodeLabels
+    },
+}
+
+# Labels and relationship types are passed as parameters through APOC, so
+# every label shares one cached plan (APOC ships with the compose image)
+_CREATE_NODE_QUERY = """
+    CALL apoc.create.node([$label], apoc.map.merge($props, {created_at: $now, updated_at: $now}))
+    YIELD node
+    RETURN properties(node) as n
+    """
+
+_CREATE_RELATIONSHIP_QUERIES: dict[bool, str] = {
+    return_nodes: f"""
+    MATCH (a {{id: $source_id}})
+    MATCH (b {{id: $target_id}})
+    CALL apoc.create.relationship(a, $rel_type, apoc.map.merge($props, {{created_at: $now}}), b)
+    YIELD rel
+    RETURN properties(rel) as r{", properties(a) as a, properties(b) as b" if return_nodes else ""}
+    """
+    for return_nodes in (False, True)
+}
+
+_CREATE_NODES_BULK_QUERY = """
+    UNWIND $rows AS row
+    CALL apoc.create.node([$label], row {.*, created_at: $now, updated_at: $now}) YIELD node
+    RETURN properties(node) as n
+    """
+
+_CREATE_RELATIONSHIPS_BULK_QUERY = """
+    UNWIND $edges AS edge
+    MATCH (a {id: edge.source_id})
+    MATCH (b {id: edge.target_id})
+    CALL apoc.create.relationship(a, $rel_type, apoc.map.merge(edge.props, {created_at: $now}), b)
+    YIELD rel
+    RETURN {relationship: properties(rel), source_id: a.id, target_id: b.id} as row
+    """
+
+_UPDATE_NODE_QUERIES: dict[NodeLabels | None, str] = {
+    label: f"""
+    MATCH (n{f":{label.value}" if label else ""} {{id: $id}})
+    SET n += $props, n.updated_at = $now
+    RETURN properties(n) as n
+    """
+    for label in [None, *NodeLabels]
+}
+
+_DELETE_NODE_QUERIES: dict[NodeLabels | None, str] = {
+    label: f"""
+    MATCH (n{f":{label.value}" if label else ""} {{id: $id}})
+    DETACH DELETE n
+    RETURN count(n) as deleted
+    """
+    for label in [None, *NodeLabels]
+}
+
+_LABELS_BY_NAME: dict[str, NodeLabels] = {label.value: label for label in NodeLabels}
+
+_GET_CHILDREN_QUERIES: dict[NodeLabels | None, str] = {
+    None: """
+    MATCH (parent {id: $id})-[:HAS_SUBDEPARTMENT|HAS_TOPIC|HAS_CONTEXT]->(child)
+    RETURN properties(child) as child, labels(child) as labels
+    ORDER BY child.title
+    """,
+    **{
+        label: f"""
+        MATCH (parent {{id: $id}})-[:HAS_SUBDEPARTMENT|HAS_TOPIC|HAS_CONTEXT]->(child:{label.value})
+        RETURN properties(child) as child
+        ORDER BY child.title
+        """
+        for label in NodeLabels
+    },
+}
+
+
+def _relationships_query(rel_type: RelationshipTypes | None, direction: str) -> str:
+    rel_pattern = f":{rel_type.value}" if rel_type else ""
+    if direction == "outgoing":
+        return f"""
+        MATCH (a {{id: $id}})-[r{rel_pattern}]->(b)
+        RETURN {{relationship: properties(r), other_node: properties(b), direction: 'outgoing'}} as row
+        """
+    if direction == "incoming":
+        return f"""
+        MATCH (a {{id: $id}})<-[r{rel_pattern}]-(b)
+        RETURN {{relationship: properties(r), other_node: properties(b), direction: 'incoming'}} as row
+        """
+    return f"""
+    MATCH (a {{id: $id}})-[r{rel_pattern}]-(b)
+    RETURN {{
+        relationship: properties(r),
+        other_node: properties(b),
+        direction: CASE WHEN startNode(r).id = $id THEN 'outgoing' ELSE 'incoming' END
+    }} as row
+    """
+
+
+_GET_RELATIONSHIPS_QUERIES: dict[tuple[RelationshipTypes | None, str], str] = {
+    (rel_type, direction): _relationships_query(rel_type, direction)
+    for rel_type in [None, *RelationshipTypes]
+    for direction in ("outgoing", "incoming", "both")
+}
+
+
+# Each level is collected in its own subquery so the result rows never fan
+# out into a department x subdepartment x topic x context cross product
+_DEPARTMENT_HIERARCHY_QUERY = """
+    MATCH (d:Department)
+    CALL {
+        WITH d
+        MATCH (d)-[:HAS_SUBDEPARTMENT]->(sd:SubDepartment)
+        RETURN collect(properties(sd)) as subdepts
+    }
+    CALL {
+        WITH d
+        MATCH (d)-[:HAS_SUBDEPARTMENT]->(:SubDepartment)-[:HAS_TOPIC]->(t:Topic)
+        RETURN collect(DISTINCT properties(t)) as topics
+    }
+    CALL {
+        WITH d
+        MATCH (d)-[:HAS_SUBDEPARTMENT]->(:SubDepartment)-[:HAS_TOPIC]->(:Topic)-[:HAS_CONTEXT]->(c:Context)
+        RETURN collect(DISTINCT properties(c)) as contexts
+    }
+    CALL {
+        WITH d
+        MATCH (d)-[:HAS_SUBDEPARTMENT]->(:SubDepartment)-[:HAS_TOPIC]->(:Topic)-[:HAS_SUMMARY]->(s:Summary)
+        RETURN collect(DISTINCT properties(s)) as summaries
+    }
+    RETURN properties(d) as d, subdepts, topics, contexts, summaries
+    ORDER BY d.title
+    """
+
+
+@lru_cache(maxsize=2 * (MAX_HIERARCHY_DEPTH + 1))
+def _hierarchy_query_text(rooted: bool, max_depth: int) -> str:
+    # Cypher cannot parameterize variable-length bounds, so the validated
+    # depth is baked into the text; one cached string per depth keeps the
+    # server's plan cache warm
+    hops = f"[:HAS_SUBDEPARTMENT|HAS_TOPIC|HAS_CONTEXT*0..{max_depth}]"
+    if rooted:
+        return f"""
+        MATCH path = (root {{id: $root_id}})-{hops}->(child)
+        RETURN path
+        """
+    return f"""
+    MATCH (d:Department)
+    OPTIONAL MATCH path = (d)-{hops}->(child)
+    RETURN d, collect(path) as paths
+    """
+
+
+@lru_cache(maxsize=8)
+def _search_hierarchy_query(by_text: bool, by_tags: bool, include_breadcrumb: bool) -> str:
+    # Start from the context_content full-text index so only matching
+    # contexts flow into the graph filters below; a blank query cannot be
+    # parsed by Lucene and matches every context
+    source = (
+        "CALL db.index.fulltext.queryNodes('context_content', $query) YIELD node AS c"
+        if by_text
+        else "MATCH (c:Context)"
+    )
+    if by_tags:
+        tag_match = """
+    MATCH (c)-[:HAS_TAG]->(tag:Tag)
+    WHERE tag.name IN $tags"""
+    else:
+        tag_match = """
+    OPTIONAL MATCH (c)-[:HAS_TAG]->(tag:Tag)"""
+
+    if include_breadcrumb:
+        breadcrumb = """
+    OPTIONAL MATCH (t)<-[:HAS_TOPIC]-(sd:SubDepartment)<-[:HAS_SUBDEPARTMENT]-(d:Department)
+    WITH c, collect(DISTINCT tag.name) as tags, collect(DISTINCT t.title) as topics,
+         collect(DISTINCT d.title) as departments
+    RETURN {context: properties(c), tags: tags, topics: topics, departments: departments} as row"""
+    else:
+        breadcrumb = """
+    WITH c, collect(DISTINCT tag.name) as tags, collect(DISTINCT t.title) as topics
+    RETURN {context: properties(c), tags: tags, topics: topics} as row"""
+
+    return f"""
+    {source}
+    WHERE $source_types IS NULL OR c.source_type IN $source_types{tag_match}
+    OPTIONAL MATCH (t:Topic)-[:HAS_CONTEXT|ALSO_IN]->(c){breadcrumb}
+    ORDER BY c.importance DESC, c.created_at DESC
+    LIMIT $limit
+    """
+
+
+@lru_cache(maxsize=4)
+def _recent_contexts_query(by_topic: bool, paged: bool) -> str:
+    # Sorting on the node property before projecting lets the
+    # context_created_at index supply rows already in order. Only a page
+    # cursor filters on created_at; the first page keeps contexts without one.
+    match = (
+        "MATCH (t:Topic {id: $topic_id})-[:HAS_CONTEXT]->(c:Context)"
+        if by_topic
+        else "MATCH (c:Context)"
+    )
+    cursor = "WHERE c.created_at < $before" if paged else ""
+    return f"""
+    {match}
+    {cursor}
+    WITH c
+    ORDER BY c.created_at DESC
+    LIMIT $limit
+    RETURN properties(c) as c
+    """
+
+
+@lru_cache(maxsize=64)
+def _find_by_tags_query(node_label: str | None, match_all: bool) -> str:
+    label_filter = f":{node_label}" if node_label else ""
+    if match_all:
+        # Node must have ALL specified tags
+        return f"""
+        MATCH (n{label_filter})-[:HAS_TAG]->(t:Tag)
+        WHERE t.name IN $tags
+        WITH n, collect(DISTINCT t.name) as node_tags
+        WHERE size([tag IN $tags WHERE tag IN node_tags]) = size($tags)
+        RETURN properties(n) as n, node_tags as tags
+        LIMIT $limit
+        """
+    # Node can have ANY of the specified tags
+    return f"""
+    MATCH (n{label_filter})-[:HAS_TAG]->(t:Tag)
+    WHERE t.name IN $tags
+    WITH n, collect(DISTINCT t.name) as node_tags, count(DISTINCT t) as tag_count
+    RETURN properties(n) as n, node_tags as tags
+    ORDER BY tag_count DESC
+    LIMIT $limit
+    """
+
+
+def _check_identifier(name: str) -> str:
+    if not _IDENTIFIER.fullmatch(name):
+        raise ValueError(f"Invalid label or relationship type: {name!r}")
+    return name
+
+
+@lru_cache(maxsize=128)
+def _merge_node_query(node_type: str) -> str:
+    # Use compatible syntax for older Neo4j versions
+    return f"""
+    MERGE (n:{_check_identifier(node_type)} {{id: $id}})
+    ON CREATE SET
+        n += $props,
+        n.created_at = $now,
+        n.updated_at = $now
+    ON MATCH SET
+        n += $mutable_props,
+        n.updated_at = $now
+    RETURN properties(n) as n
+    """
+
+
+@lru_cache(maxsize=256)
+def _merge_relationship_query(
+    from_type: str,
+    to_type: str,
+    relationship_type: str,
+    return_nodes: bool,
+) -> str:
+    return f"""
+    MATCH (a:{_check_identifier(from_type)} {{id: $from_id}})
+    MATCH (b:{_check_identifier(to_type)} {{id: $to_id}})
+    MERGE (a)-[r:{_check_identifier(relationship_type)}]->(b)
+    SET r += $props, r.created_at = coalesce(r.created_at, $now)
+    RETURN properties(r) as r{", properties(a) as a, properties(b) as b" if return_nodes else ""}
+    """
+
+
+class _FrozenDict(dict):
+    """Read-only dict for cached results.
+
+    Unlike a mappingproxy it still serializes as a dict (pydantic, orjson,
+    json); copy, deepcopy and pickle give back a plain, mutable dict.
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("cached Neo4j results are read-only; copy with dict() first")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[type, tuple[dict[str, Any]]]:
+        return dict, (dict(self),)
+
+
+def _freeze(value: Any) -> Any:
+    """Snapshot a read result as read-only dicts and tuples.
+
+    Cached results are frozen once on store and then shared by every hit,
+    which costs far less than copying a nested hierarchy per read.
+    """
+    if isinstance(value, Mapping):
+        return _FrozenDict({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class _TTLCache:
+    """Bounded LRU map whose entries expire a fixed number of seconds after insertion.
+
+    A ttl of None keeps entries until they are evicted by size.
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None):
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires = math.inf if self.ttl is None else time.monotonic() + self.ttl
+        self._data[key] = (expires, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
 
 class Neo4jClient:
     """Async Neo4j client for knowledge graph operations."""
 
     def __init__(self):
         self._driver: AsyncDriver | None = None
+        # Serializes connect() so concurrent callers share one driver and pool
+        self._connect_lock = asyncio.Lock()
+        # Naming the database on every session spares the driver a
+        # home-database lookup per session
+        self._database = settings.neo4j_database
+        # Tags are append-only, so a tag seen once never needs another MERGE
+        self._tag_cache: dict[str, dict[str, Any]] = {}
+        # Hot reads skip Bolt until they expire or a write invalidates them:
+        # nodes are dropped by id, hierarchy shapes and template results on
+        # any write
+        self._node_cache = _TTLCache(settings.neo4j_read_cache_size, settings.neo4j_read_cache_ttl)
+        self._hierarchy_cache = _TTLCache(
+            settings.neo4j_read_cache_size, settings.neo4j_read_cache_ttl
+        )
+        self._query_cache = _TTLCache(settings.neo4j_read_cache_size, settings.neo4j_read_cache_ttl)
+        # Bumped as each write starts and again once it lands; a read only
+        # fills a cache if no write overlapped it
+        self._write_generation = 0
+        # Label of each node id seen by this process, so id-only calls can
+        # use the labelled (unique-constraint indexed) query instead of a scan
+        self._id_labels = _TTLCache(settings.neo4j_read_cache_size * 10, None)
 
     async def connect(self) -> None:
-        """Connect to Neo4j database."""
-        self._driver = AsyncGraphDatabase.driver(
-            settings.neo4j_uri,
-            auth=(settings.neo4j_user, settings.neo4j_password.get_secret_value()),
-        )
-        await self.verify_connectivity()
-        await self._init_schema()
-        logger.info("Neo4j connected and schema initialized")
+        """Connect to Neo4j database. Safe to call repeatedly or concurrently."""
+        async with self._connect_lock:
+            if self._driver:
+                return
+
+            driver = AsyncGraphDatabase.driver(
+                settings.neo4j_uri,
+                auth=(settings.neo4j_user, settings.neo4j_password.get_secret_value()),
+                max_connection_pool_size=settings.neo4j_max_pool_size,
+                connection_acquisition_timeout=settings.neo4j_conn_acquisition_timeout,
+                max_connection_lifetime=settings.neo4j_max_conn_lifetime,
+                keep_alive=True,
+            )
+            # Schema bootstrap opens its own session, so it need not wait for
+            # the connectivity check; both finish before the driver is dropped
+            results = await asyncio.gather(
+                driver.verify_connectivity(), self._init_schema(driver), return_exceptions=True
+            )
+            errors = [r for r in results if isinstance(r, BaseException)]
+            if errors:
+                await driver.close()
+                raise errors[0]
+            # Published only once ready: ensure_connected does not take the
+            # lock, so it must never see a driver still bootstrapping
+            self._driver = driver
+            logger.info("Neo4j connected and schema initialized")
+
+    async def ensure_connected(self) -> None:
+        """Connect on first use if the application has not connected yet."""
+        if not self._driver:
+            await self.connect()
 
     async def close(self) -> None:
         """Close Neo4j connection."""
         if self._driver:
             await self._driver.close()
             self._driver = None
+            self._tag_cache.clear()
+            self._node_cache.clear()
+            self._hierarchy_cache.clear()
+            self._query_cache.clear()
+            self._id_labels.clear()
             logger.info("Neo4j connection closed")
 
     async def verify_connectivity(self) -> bool:
@@ -48,20 +521,56 @@ class Neo4jClient:
         await self._driver.verify_connectivity()
         return True
 
-    async def _init_schema(self) -> None:
-        """Initialize database schema with constraints and indexes."""
-        async with self._driver.session() as session:
-            for constraint in SCHEMA_CONSTRAINTS:
-                try:
-                    await session.run(constraint)
-                except Exception as e:
-                    logger.warning("Constraint creation skipped", constraint=constraint, error=str(e))
-
-            for index in SCHEMA_INDEXES:
-                try:
-                    await session.run(index)
-                except Exception as e:
-                    logger.warning("Index creation skipped", index=index, error=str(e))
+    async def _init_schema(self, driver: AsyncDriver) -> None:
+        """Initialize database schema with constraints and indexes.
+
+        Only statements whose constraint or index name is missing are sent,
+        and those run together in one write transaction. Every schema
+        constraint here is a uniqueness constraint, whose backing index
+        carries the constraint's name, so SHOW INDEXES alone lists both.
+        Runs on the driver connect() is still bootstrapping.
+        """
+        async with driver.session(
+            database=self._database, default_access_mode=WRITE_ACCESS
+        ) as session:
+            result = await session.run("SHOW INDEXES YIELD name")
+            existing = set(await result.value("name"))
+            # Unnamed DDL cannot be matched against SHOW INDEXES, so it is
+            # always sent and left to IF NOT EXISTS
+            pending = []
+            for ddl in SCHEMA_CONSTRAINTS + SCHEMA_INDEXES:
+                match = _SCHEMA_NAME.search(ddl)
+                if match is None or match.group(1) not in existing:
+                    pending.append(ddl)
+            if not pending:
+                return
+
+            async def apply_ddl(tx) -> None:
+                for ddl in pending:
+                    await tx.run(ddl)
+
+            try:
+                await session.execute_write(apply_ddl)
+            except Exception as e:
+                # Fall back to one statement at a time so a single bad DDL
+                # does not block the rest
+                logger.warning("Batched schema creation failed", error=str(e))
+                for ddl in pending:
+                    try:
+                        result = await session.run(ddl)
+                        await result.consume()
+                    except Exception as e:
+                        logger.warning("Schema statement skipped", statement=ddl, error=str(e))
+
+            # New indexes populate in the background; wait so the first
+            # queries after startup do not fall back to scans
+            try:
+                result = await session.run(
+                    "CALL db.awaitIndexes($timeout)", timeout=SCHEMA_AWAIT_SECONDS
+                )
+                await result.consume()
+            except Exception as e:
+                logger.warning("Timed out waiting for schema indexes", error=str(e))
 
     @property
     def driver(self) -> AsyncDriver:
@@ -70,80 +579,203 @@ class Neo4jClient:
             raise RuntimeError("Neo4j driver not initialized. Call connect() first.")
         return self._driver
 
+    @asynccontextmanager
+    async def read_session(self, **config: Any) -> AsyncIterator[AsyncSession]:
+        """Open a session whose queries may be served by any cluster member."""
+        await self.ensure_connected()
+        async with self.driver.session(
+            database=self._database, default_access_mode=READ_ACCESS, **config
+        ) as session:
+            yield session
+
+    @asynccontextmanager
+    async def write_session(self, **config: Any) -> AsyncIterator[AsyncSession]:
+        """Open a session routed to the cluster leader for writes."""
+        await self.ensure_connected()
+        async with self.driver.session(
+            database=self._database, default_access_mode=WRITE_ACCESS, **config
+        ) as session:
+            yield session
+
+    async def _run(
+        self,
+        query: str,
+        /,
+        write: bool = False,
+        session: AsyncSession | None = None,
+        **params: Any,
+    ) -> list[Record]:
+        """Run a query through the driver's managed, retrying execute_query API.
+
+        Reads are routed to any cluster member; pass write=True for
+        statements that CREATE, MERGE, SET or DELETE. Writes get a ``$now``
+        timestamp taken once per call, so every SET in the statement (and
+        every row of an UNWIND batch) records the same instant.
+
+        Pass an open session to run on it instead, so a sequence of calls
+        reuses one pooled connection. The query still runs as a retried
+        transaction function on that session.
+        """
+        await self.ensure_connected()
+        if write:
+            params.setdefault("now", datetime.now(UTC))
+            self._write_generation += 1
+        if session is not None:
+
+            async def work(tx) -> list[Record]:
+                result = await tx.run(query, params)
+                return [record async for record in result]
+
+            execute = session.execute_write if write else session.execute_read
+            records = await execute(work)
+        else:
+            records, _, _ = await self.driver.execute_query(
+                query,
+                params,
+                routing_=RoutingControl.WRITE if write else RoutingControl.READ,
+                database_=self._database,
+            )
+        if write:
+            # Any write may reshape the hierarchy or change a cached result
+            self._write_generation += 1
+            self._hierarchy_cache.clear()
+            self._query_cache.clear()
+        return records
+
+    def _cache(self, cache: _TTLCache, key: Hashable, value: Any, generation: int) -> Any:
+        """Freeze a read result, storing it unless a write overlapped the read.
+
+        Returns the frozen snapshot so a miss hands callers the same read-only
+        shape a later hit will; hits return the stored snapshot without copying.
+        """
+        value = _freeze(value)
+        if generation == self._write_generation:
+            cache.set(key, value)
+        return value
+
+    async def _single(
+        self,
+        query: str,
+        /,
+        write: bool = False,
+        session: AsyncSession | None = None,
+        **params: Any,
+    ) -> Record | None:
+        """Run a query and return its first record, if any."""
+        records = await self._run(query, write=write, session=session, **params)
+        return records[0] if records else None
+
+    async def _stream(self, query: str, /, **params: Any) -> AsyncIterator[dict[str, Any]]:
+        """Yield records as the server sends them instead of buffering them all."""
+        async with self.read_session(fetch_size=STREAM_FETCH_SIZE) as session:
+            result = await session.run(query, params)
+            async for record in result:
+                yield record.data()
+
+    async def run_template(
+        self,
+        template: "CypherQuery",
+        write: bool = False,
+    ) -> Sequence[Mapping[str, Any]]:
+        """Run a ``QueryTemplates`` query and return its rows as mappings.
+
+        Read results are cached by query text and parameters until they
+        expire or any write goes through this client, and are returned
+        read-only.
+        """
+        if write:
+            records = await self._run(template.query, write=True, **template.params)
+            return [r.data() for r in records]
+
+        # Parameters may hold lists, so the key uses their repr
+        key = (template.query, repr(sorted(template.params.items())))
+        rows: Sequence[Mapping[str, Any]] | None = self._query_cache.get(key)
+        if rows is None:
+            generation = self._write_generation
+            records = await self._run(template.query, **template.params)
+            rows = self._cache(self._query_cache, key, [r.data() for r in records], generation)
+        return rows
+
     # Node operations
 
     async def create_node(
         self,
         label: NodeLabels,
         properties: dict[str, Any],
+        session: AsyncSession | None = None,
     ) -> dict[str, Any]:
         """Create a new node with the given label and properties."""
         if "id" not in properties:
             properties["id"] = str(uuid4())
 
-        query = f"""
-        CREATE (n:{label.value} $props)
-        SET n.created_at = datetime()
-        SET n.updated_at = datetime()
-        RETURN n
-        """
-
-        async with self.driver.session() as session:
-            result = await session.run(query, props=properties)
-            record = await result.single()
-            return dict(record["n"]) if record else {}
-
-    async def get_node(self, node_id: str, label: NodeLabels | None = None) -> dict[str, Any] | None:
-        """Get a node by ID."""
-        if label:
-            query = f"MATCH (n:{label.value} {{id: $id}}) RETURN n"
-        else:
-            query = "MATCH (n {id: $id}) RETURN n"
-
-        async with self.driver.session() as session:
-            result = await session.run(query, id=node_id)
-            record = await result.single()
-            return dict(record["n"]) if record else None
+        record = await self._single(
+            _CREATE_NODE_QUERY, label=label.value, props=properties, write=True, session=session
+        )
+        self._id_labels.set(properties["id"], label)
+        return record["n"] if record else {}
+
+    async def get_node(
+        self, node_id: str, label: NodeLabels | None = None
+    ) -> Mapping[str, Any] | None:
+        """Get a node's properties by ID, as a read-only cached mapping."""
+        label = self._resolve_label(node_id, label)
+        key = (node_id, label)
+        node: Mapping[str, Any] | None = self._node_cache.get(key)
+        if node is not None:
+            return node
+
+        generation = self._write_generation
+        record = await self._single(_GET_NODE_QUERIES[label], id=node_id)
+        if not record:
+            return None
+        if label is None:
+            self._remember_label(node_id, record["labels"])
+        node = self._cache(self._node_cache, key, record["n"], generation)
+        return node
+
+    def _resolve_label(self, node_id: str, label: NodeLabels | None) -> NodeLabels | None:
+        return label or self._id_labels.get(node_id)
+
+    def _remember_label(self, node_id: str, labels: Iterable[str]) -> None:
+        for name in labels:
+            if name in _LABELS_BY_NAME:
+                self._id_labels.set(node_id, _LABELS_BY_NAME[name])
+                return
+
+    def _invalidate_node(self, node_id: str) -> None:
+        for label in (None, *NodeLabels):
+            self._node_cache.pop((node_id, label))
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """Hit/miss counters and sizes of the in-process read caches."""
+        return {
+            "nodes": self._node_cache.stats(),
+            "hierarchy": self._hierarchy_cache.stats(),
+            "queries": self._query_cache.stats(),
+        }
 
     async def update_node(
         self,
         node_id: str,
         properties: dict[str, Any],
         label: NodeLabels | None = None,
+        session: AsyncSession | None = None,
     ) -> dict[str, Any] | None:
         """Update a node's properties."""
-        if label:
-            query = f"""
-            MATCH (n:{label.value} {{id: $id}})
-            SET n += $props
-            SET n.updated_at = datetime()
-            RETURN n
-            """
-        else:
-            query = """
-            MATCH (n {id: $id})
-            SET n += $props
-            SET n.updated_at = datetime()
-            RETURN n
-            """
-
-        async with self.driver.session() as session:
-            result = await session.run(query, id=node_id, props=properties)
-            record = await result.single()
-            return dict(record["n"]) if record else None
+        label = self._resolve_label(node_id, label)
+        record = await self._single(
+            _UPDATE_NODE_QUERIES[label], id=node_id, props=properties, write=True, session=session
+        )
+        self._invalidate_node(node_id)
+        return record["n"] if record else None
 
-    async def delete_node(self, node_id: str) -> bool:
+    async def delete_node(self, node_id: str, label: NodeLabels | None = None) -> bool:
         """Delete a node and its relationships."""
-        query = """
-        MATCH (n {id: $id})
-        DETACH DELETE n
-        RETURN count(n) as deleted
-        """
-
-        async with self.driver.session() as session:
-            result = await session.run(query, id=node_id)
-            record = await result.single()
-            return record["deleted"] > 0 if record else False
+        label = self._resolve_label(node_id, label)
+        record = await self._single(_DELETE_NODE_QUERIES[label], id=node_id, write=True)
+        self._invalidate_node(node_id)
+        self._id_labels.pop(node_id)
+        return record["deleted"] > 0 if record else False
 
     # Relationship operations
 
@@ -153,30 +785,94 @@ class Neo4jClient:
         target_id: str,
         rel_type: RelationshipTypes,
         properties: dict[str, Any] | None = None,
+        session: AsyncSession | None = None,
+        return_nodes: bool = False,
     ) -> dict[str, Any]:
-        """Create a relationship between two nodes."""
+        """Create a relationship between two nodes.
+
+        The end nodes are only sent back (as ``source`` and ``target``) when
+        return_nodes is set; callers already know their ids.
+        """
         props = properties or {}
         if "id" not in props:
             props["id"] = str(uuid4())
 
-        query = f"""
-        MATCH (a {{id: $source_id}})
-        MATCH (b {{id: $target_id}})
-        CREATE (a)-[r:{rel_type.value} $props]->(b)
-        SET r.created_at = datetime()
-        RETURN r, a, b
-        """
-
-        async with self.driver.session() as session:
-            result = await session.run(query, source_id=source_id, target_id=target_id, props=props)
-            record = await result.single()
-            if record:
-                return {
-                    "relationship": dict(record["r"]),
-                    "source": dict(record["a"]),
-                    "target": dict(record["b"]),
-                }
+        record = await self._single(
+            _CREATE_RELATIONSHIP_QUERIES[return_nodes],
+            source_id=source_id,
+            target_id=target_id,
+            rel_type=rel_type.value,
+            props=props,
+            write=True,
+            session=session,
+        )
+        return self._relationship_result(record, return_nodes)
+
+    @staticmethod
+    def _relationship_result(record: Record | None, return_nodes: bool) -> dict[str, Any]:
+        if not record:
             return {}
+        result = {"relationship": record["r"]}
+        if return_nodes:
+            result["source"] = record["a"]
+            result["target"] = record["b"]
+        return result
+
+    async def create_nodes_bulk(
+        self,
+        label: NodeLabels,
+        rows: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Create many nodes with one UNWIND statement per batch.
+
+        Rows without an ``id`` get a generated one. Each batch of
+        BULK_BATCH_SIZE rows is a single write transaction.
+        """
+        for row in rows:
+            row.setdefault("id", str(uuid4()))
+
+        nodes: list[dict[str, Any]] = []
+        for start in range(0, len(rows), BULK_BATCH_SIZE):
+            records = await self._run(
+                _CREATE_NODES_BULK_QUERY,
+                label=label.value,
+                rows=rows[start:start + BULK_BATCH_SIZE],
+                write=True,
+            )
+            nodes.extend(r["n"] for r in records)
+        for row in rows:
+            self._id_labels.set(row["id"], label)
+        return nodes
+
+    async def create_relationships_bulk(
+        self,
+        rel_type: RelationshipTypes,
+        edges: list[tuple[str, str] | tuple[str, str, dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """Create many relationships of one type with one UNWIND statement per batch.
+
+        Each edge is ``(source_id, target_id)`` or ``(source_id, target_id, properties)``.
+        Edges whose endpoints do not exist are skipped.
+        """
+        payload = [
+            {
+                "source_id": edge[0],
+                "target_id": edge[1],
+                "props": {"id": str(uuid4()), **(edge[2] if len(edge) > 2 else {})},
+            }
+            for edge in edges
+        ]
+
+        results: list[dict[str, Any]] = []
+        for start in range(0, len(payload), BULK_BATCH_SIZE):
+            records = await self._run(
+                _CREATE_RELATIONSHIPS_BULK_QUERY,
+                rel_type=rel_type.value,
+                edges=payload[start:start + BULK_BATCH_SIZE],
+                write=True,
+            )
+            results.extend(r["row"] for r in records)
+        return results
 
     async def get_relationships(
         self,
@@ -185,36 +881,25 @@ class Neo4jClient:
         direction: str = "both",  # "outgoing", "incoming", "both"
     ) -> list[dict[str, Any]]:
         """Get relationships for a node."""
-        rel_pattern = f":{rel_type.value}" if rel_type else ""
+        if direction not in ("outgoing", "incoming"):
+            direction = "both"
 
-        if direction == "outgoing":
-            query = f"""
-            MATCH (a {{id: $id}})-[r{rel_pattern}]->(b)
-            RETURN r, b as other, 'outgoing' as direction
-            """
-        elif direction == "incoming":
-            query = f"""
-            MATCH (a {{id: $id}})<-[r{rel_pattern}]-(b)
-            RETURN r, b as other, 'incoming' as direction
-            """
-        else:
-            query = f"""
-            MATCH (a {{id: $id}})-[r{rel_pattern}]-(b)
-            RETURN r, b as other,
-                   CASE WHEN startNode(r).id = $id THEN 'outgoing' ELSE 'incoming' END as direction
-            """
+        records = await self._run(_GET_RELATIONSHIPS_QUERIES[(rel_type, direction)], id=node_id)
+        return [r["row"] for r in records]
 
-        async with self.driver.session() as session:
-            result = await session.run(query, id=node_id)
-            records = await result.data()
-            return [
-                {
-                    "relationship": dict(r["r"]),
-                    "other_node": dict(r["other"]),
-                    "direction": r["direction"],
-                }
-                for r in records
-            ]
+    async def iter_relationships(
+        self,
+        node_id: str,
+        rel_type: RelationshipTypes | None = None,
+        direction: str = "both",
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream a node's relationships record by record."""
+        if direction not in ("outgoing", "incoming"):
+            direction = "both"
+
+        query = _GET_RELATIONSHIPS_QUERIES[(rel_type, direction)]
+        async for record in self._stream(query, id=node_id):
+            yield record["row"]
 
     # Hierarchy operations
 
@@ -224,63 +909,72 @@ class Neo4jClient:
         max_depth: int = 4,
     ) -> list[dict[str, Any]]:
         """Get the textbook hierarchy starting from root or all departments."""
-        if root_id:
-            query = """
-            MATCH path = (root {id: $root_id})-[:HAS_SUBDEPARTMENT|HAS_TOPIC|HAS_CONTEXT*0..$max_depth]->(child)
-            RETURN path
-            """
-            params = {"root_id": root_id, "max_depth": max_depth}
-        else:
-            query = """
-            MATCH (d:Department)
-            OPTIONAL MATCH path = (d)-[:HAS_SUBDEPARTMENT|HAS_TOPIC|HAS_CONTEXT*0..$max_depth]->(child)
-            RETURN d, collect(path) as paths
-            """
-            params = {"max_depth": max_depth}
+        query, params = self._hierarchy_query(root_id, max_depth)
+        records = await self._run(query, **params)
+        return [r.data() for r in records]
 
-        async with self.driver.session() as session:
-            result = await session.run(query, **params)
-            records = await result.data()
-            return records
+    async def iter_hierarchy(
+        self,
+        root_id: str | None = None,
+        max_depth: int = 4,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream the textbook hierarchy record by record."""
+        query, params = self._hierarchy_query(root_id, max_depth)
+        async for record in self._stream(query, **params):
+            yield record
+
+    @staticmethod
+    def _hierarchy_query(root_id: str | None, max_depth: int) -> tuple[str, dict[str, Any]]:
+        max_depth = int(max_depth)
+        if not 0 <= max_depth <= MAX_HIERARCHY_DEPTH:
+            raise ValueError(f"max_depth must be between 0 and {MAX_HIERARCHY_DEPTH}")
+
+        if root_id:
+            return _hierarchy_query_text(True, max_depth), {"root_id": root_id}
+        return _hierarchy_query_text(False, max_depth), {}
 
     async def get_children(
         self,
         node_id: str,
         child_label: NodeLabels | None = None,
-    ) -> list[dict[str, Any]]:
-        """Get direct children of a node in the hierarchy."""
-        if child_label:
-            query = f"""
-            MATCH (parent {{id: $id}})-[:HAS_SUBDEPARTMENT|HAS_TOPIC|HAS_CONTEXT]->(child:{child_label.value})
-            RETURN child
-            ORDER BY child.title
-            """
-        else:
-            query = """
-            MATCH (parent {id: $id})-[:HAS_SUBDEPARTMENT|HAS_TOPIC|HAS_CONTEXT]->(child)
-            RETURN child, labels(child) as labels
-            ORDER BY child.title
-            """
-
-        async with self.driver.session() as session:
-            result = await session.run(query, id=node_id)
-            records = await result.data()
-            return records
+    ) -> Sequence[Mapping[str, Any]]:
+        """Get direct children of a node in the hierarchy (read-only, cached)."""
+        key = ("children", node_id, child_label)
+        children: Sequence[Mapping[str, Any]] | None = self._hierarchy_cache.get(key)
+        if children is None:
+            generation = self._write_generation
+            records = await self._run(_GET_CHILDREN_QUERIES[child_label], id=node_id)
+            children = self._cache(
+                self._hierarchy_cache, key, [r.data() for r in records], generation
+            )
+        return children
 
-    async def get_path_to_root(self, node_id: str) -> list[dict[str, Any]]:
-        """Get the path from a node to its root department."""
+    async def get_path_to_root(self, node_id: str) -> Sequence[Mapping[str, Any]]:
+        """Get the path from a node to its root department (read-only, cached)."""
+        # Breadth-first climb that stops at the first Department, instead of
+        # enumerating every ancestor path and sorting them
         query = """
-        MATCH path = (node {id: $id})<-[:HAS_SUBDEPARTMENT|HAS_TOPIC|HAS_CONTEXT*]-(ancestor)
-        WHERE ancestor:Department
+        MATCH (node {id: $id})
+        CALL apoc.path.expandConfig(node, {
+            relationshipFilter: '<HAS_SUBDEPARTMENT|<HAS_TOPIC|<HAS_CONTEXT',
+            labelFilter: '/Department',
+            minLevel: 1,
+            bfs: true,
+            uniqueness: 'NODE_GLOBAL',
+            limit: 1
+        }) YIELD path
         RETURN [n in nodes(path) | {id: n.id, title: n.title, labels: labels(n)}] as path
-        ORDER BY length(path) DESC
-        LIMIT 1
         """
 
-        async with self.driver.session() as session:
-            result = await session.run(query, id=node_id)
-            record = await result.single()
-            return record["path"] if record else []
+        key = ("path", node_id)
+        path: Sequence[Mapping[str, Any]] | None = self._hierarchy_cache.get(key)
+        if path is None:
+            generation = self._write_generation
+            record = await self._single(query, id=node_id)
+            path = self._cache(
+                self._hierarchy_cache, key, record["path"] if record else [], generation
+            )
+        return path
 
     # Full-text search
 
@@ -293,42 +987,28 @@ class Neo4jClient:
         """Perform full-text search on content nodes."""
         # Default to searching context and summary nodes
         if not node_types:
-            indexes = ["context_content", "summary_content", "decision_content"]
+            indexes = _DEFAULT_FULLTEXT_INDEXES
         else:
-            index_map = {
-                NodeLabels.CONTEXT: "context_content",
-                NodeLabels.SUMMARY: "summary_content",
-                NodeLabels.DECISION: "decision_content",
-            }
-            indexes = [index_map[nt] for nt in node_types if nt in index_map]
+            indexes = tuple(_FULLTEXT_INDEXES[nt] for nt in node_types if nt in _FULLTEXT_INDEXES)
 
         if not indexes:
             return []
 
-        results = []
-        async with self.driver.session() as session:
-            for index in indexes:
-                query = f"""
-                CALL db.index.fulltext.queryNodes('{index}', $query_text)
-                YIELD node, score
-                RETURN node, score, labels(node) as labels
-                ORDER BY score DESC
-                LIMIT $limit
-                """
-                result = await session.run(query, query_text=query_text, limit=limit)
-                records = await result.data()
-                results.extend([
-                    {
-                        "node": dict(r["node"]),
-                        "score": r["score"],
-                        "labels": r["labels"],
-                    }
-                    for r in records
-                ])
-
-        # Sort by score and limit
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:limit]
+        # Merge, rank and limit across indexes server-side in one round trip
+        records = await self._run(
+            _FULLTEXT_SEARCH_QUERY,
+            indexes=indexes,
+            query_text=query_text,
+            limit=limit,
+        )
+        return [
+            {
+                "node": r["node"],
+                "score": r["score"],
+                "labels": r["labels"],
+            }
+            for r in records
+        ]
 
     # Aggregation queries
 
@@ -339,38 +1019,38 @@ class Neo4jClient:
         RETURN count(c) as count
         """
 
-        async with self.driver.session() as session:
-            result = await session.run(query, topic_id=topic_id)
-            record = await result.single()
-            return record["count"] if record else 0
+        record = await self._single(query, topic_id=topic_id)
+        return record["count"] if record else 0
 
     async def get_recent_contexts(
         self,
         topic_id: str | None = None,
         limit: int = 20,
+        before: datetime | None = None,
     ) -> list[dict[str, Any]]:
-        """Get recent context nodes, optionally filtered by topic."""
-        if topic_id:
-            query = """
-            MATCH (t:Topic {id: $topic_id})-[:HAS_CONTEXT]->(c:Context)
-            RETURN c
-            ORDER BY c.created_at DESC
-            LIMIT $limit
-            """
-            params = {"topic_id": topic_id, "limit": limit}
-        else:
-            query = """
-            MATCH (c:Context)
-            RETURN c
-            ORDER BY c.created_at DESC
-            LIMIT $limit
-            """
-            params = {"limit": limit}
+        """Get recent context nodes, optionally filtered by topic.
+
+        Pass the created_at of the last context received as ``before`` to
+        load the next page.
+        """
+        query = _recent_contexts_query(bool(topic_id), before is not None)
+        records = await self._run(query, topic_id=topic_id, before=before, limit=limit)
+        return [r["c"] for r in records]
+
+    async def iter_recent_contexts(
+        self,
+        topic_id: str | None = None,
+        before: datetime | None = None,
+        limit: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream recent context nodes newest first.
 
-        async with self.driver.session() as session:
-            result = await session.run(query, **params)
-            records = await result.data()
-            return [dict(r["c"]) for r in records]
+        Pass the created_at of the last context received as ``before`` to
+        resume with the next page.
+        """
+        query = _recent_contexts_query(bool(topic_id), before is not None)
+        async for record in self._stream(query, topic_id=topic_id, before=before, limit=limit):
+            yield record["c"]
 
     # Convenience methods for seeding and common operations
 
@@ -378,25 +1058,30 @@ class Neo4jClient:
         self,
         node_type: str,
         properties: dict[str, Any],
+        immutable_keys: set[str] | None = None,
     ) -> dict[str, Any]:
-        """Create or update a node by ID."""
+        """Create or update a node by ID.
+
+        Keys in ``immutable_keys`` (and ``id``) are only written when the node
+        is created; re-merging an existing node updates the remaining keys.
+        """
         node_id = properties.get("id")
         if not node_id:
             raise ValueError("Node properties must include 'id'")
 
-        # Use compatible syntax for older Neo4j versions
-        query = f"""
-        MERGE (n:{node_type} {{id: $id}})
-        SET n += $props
-        SET n.updated_at = datetime()
-        SET n.created_at = coalesce(n.created_at, datetime())
-        RETURN n
-        """
+        skip = {"id", *(immutable_keys or ())}
+        mutable_props = {k: v for k, v in properties.items() if k not in skip}
 
-        async with self.driver.session() as session:
-            result = await session.run(query, id=node_id, props=properties)
-            record = await result.single()
-            return dict(record["n"]) if record else {}
+        record = await self._single(
+            _merge_node_query(node_type),
+            id=node_id,
+            props=properties,
+            mutable_props=mutable_props,
+            write=True,
+        )
+        self._invalidate_node(node_id)
+        self._remember_label(node_id, [node_type])
+        return record["n"] if record else {}
 
     async def create_relationship_by_type(
         self,
@@ -406,51 +1091,30 @@ class Neo4jClient:
         to_id: str,
         relationship_type: str,
         properties: dict[str, Any] | None = None,
+        return_nodes: bool = False,
     ) -> dict[str, Any]:
         """Create a relationship between nodes specified by type and ID."""
         props = properties or {}
 
-        query = f"""
-        MATCH (a:{from_type} {{id: $from_id}})
-        MATCH (b:{to_type} {{id: $to_id}})
-        MERGE (a)-[r:{relationship_type}]->(b)
-        SET r += $props
-        SET r.created_at = coalesce(r.created_at, datetime())
-        RETURN r, a, b
-        """
-
-        async with self.driver.session() as session:
-            result = await session.run(
-                query, from_id=from_id, to_id=to_id, props=props
+        query = _merge_relationship_query(from_type, to_type, relationship_type, return_nodes)
+        record = await self._single(query, from_id=from_id, to_id=to_id, props=props, write=True)
+        return self._relationship_result(record, return_nodes)
+
+    async def get_department_hierarchy(self) -> Sequence[Mapping[str, Any]]:
+        """Get the full textbook hierarchy organized by department (read-only, cached)."""
+        hierarchy: Sequence[Mapping[str, Any]] | None = self._hierarchy_cache.get("departments")
+        if hierarchy is None:
+            generation = self._write_generation
+            records = await self._run(_DEPARTMENT_HIERARCHY_QUERY)
+            hierarchy = self._cache(
+                self._hierarchy_cache, "departments", [r.data() for r in records], generation
             )
-            record = await result.single()
-            if record:
-                return {
-                    "relationship": dict(record["r"]),
-                    "source": dict(record["a"]),
-                    "target": dict(record["b"]),
-                }
-            return {}
+        return hierarchy
 
-    async def get_department_hierarchy(self) -> list[dict[str, Any]]:
-        """Get the full textbook hierarchy organized by department."""
-        query = """
-        MATCH (d:Department)
-        OPTIONAL MATCH (d)-[:HAS_SUBDEPARTMENT]->(sd:SubDepartment)
-        OPTIONAL MATCH (sd)-[:HAS_TOPIC]->(t:Topic)
-        OPTIONAL MATCH (t)-[:HAS_CONTEXT]->(c:Context)
-        OPTIONAL MATCH (t)-[:HAS_SUMMARY]->(s:Summary)
-        RETURN d, collect(DISTINCT sd) as subdepts,
-               collect(DISTINCT t) as topics,
-               collect(DISTINCT c) as contexts,
-               collect(DISTINCT s) as summaries
-        ORDER BY d.title
-        """
-
-        async with self.driver.session() as session:
-            result = await session.run(query)
-            records = await result.data()
-            return records
+    async def iter_department_hierarchy(self) -> AsyncIterator[dict[str, Any]]:
+        """Stream the department hierarchy one department at a time."""
+        async for record in self._stream(_DEPARTMENT_HIERARCHY_QUERY):
+            yield record
 
     async def store_chat_context(
         self,
@@ -473,17 +1137,23 @@ class Neo4jClient:
             **(metadata or {}),
         }
 
-        # Create context node
-        context = await self.create_node(NodeLabels.CONTEXT, properties)
+        # Create the context and its HAS_CONTEXT edge as one pattern, so the
+        # new node is never looked up again to link it
+        query = """
+        MATCH (t:Topic {id: $topic_id})
+        CREATE (t)-[:HAS_CONTEXT {id: $rel_id, created_at: $now}]->(c:Context $props)
+        SET c.created_at = $now, c.updated_at = $now
+        RETURN properties(c) as c
+        """
 
-        # Link to topic
-        await self.create_relationship(
-            topic_id,
-            context_id,
-            RelationshipTypes.HAS_CONTEXT,
+        record = await self._single(
+            query,
+            topic_id=topic_id,
+            props=properties,
+            rel_id=str(uuid4()),
+            write=True,
         )
-
-        return context
+        return record["c"] if record else {}
 
 
     # ============================================
@@ -502,8 +1172,9 @@ class Neo4jClient:
         Tags enable knowledge organization across the hierarchy.
         Examples: "security", "performance", "api-design", "onboarding"
         """
-        # Normalize tag name (lowercase, hyphenated)
-        normalized_name = name.lower().replace(" ", "-").replace("_", "-")
+        normalized_name = _normalize_tag(name)
+        if normalized_name in self._tag_cache:
+            return dict(self._tag_cache[normalized_name])
 
         query = """
         MERGE (t:Tag {name: $name})
@@ -513,77 +1184,85 @@ class Neo4jClient:
             t.category = $category,
             t.description = $description,
             t.color = $color,
-            t.created_at = datetime(),
-            t.updated_at = datetime()
+            t.created_at = $now,
+            t.updated_at = $now
         ON MATCH SET
-            t.updated_at = datetime()
-        RETURN t
+            t.updated_at = $now
+        RETURN properties(t) as t
         """
 
-        async with self.driver.session() as session:
-            result = await session.run(
-                query,
-                name=normalized_name,
-                id=str(uuid4()),
-                title=name,
-                category=category,
-                description=description,
-                color=color,
-            )
-            record = await result.single()
-            return dict(record["t"]) if record else {}
+        record = await self._single(
+            query,
+            name=normalized_name,
+            id=str(uuid4()),
+            title=name,
+            category=category,
+            description=description,
+            color=color,
+            write=True,
+        )
+        if not record:
+            return {}
+        tag = record["t"]
+        self._tag_cache[normalized_name] = dict(tag)
+        return tag
 
     async def add_tags_to_node(
         self,
         node_id: str,
         tag_names: list[str],
+        session: AsyncSession | None = None,
     ) -> list[dict[str, Any]]:
         """Add multiple tags to a node (Context, Topic, or any other node).
 
         Creates tags if they don't exist.
         """
-        results = []
+        # Normalize once, keeping the first spelling of each tag as its title
+        tags: dict[str, dict[str, str]] = {}
         for tag_name in tag_names:
-            # Ensure tag exists
-            tag = await self.create_tag(tag_name)
+            normalized_name = _normalize_tag(tag_name)
+            if normalized_name not in tags:
+                tags[normalized_name] = {"name": normalized_name, "id": str(uuid4()), "title": tag_name}
 
-            # Create HAS_TAG relationship
-            query = """
-            MATCH (n {id: $node_id})
-            MATCH (t:Tag {name: $tag_name})
-            MERGE (n)-[r:HAS_TAG]->(t)
-            ON CREATE SET r.created_at = datetime()
-            RETURN n, t, r
-            """
+        if not tags:
+            return []
 
-            normalized_name = tag_name.lower().replace(" ", "-").replace("_", "-")
-            async with self.driver.session() as session:
-                result = await session.run(
-                    query,
-                    node_id=node_id,
-                    tag_name=normalized_name,
-                )
-                record = await result.single()
-                if record:
-                    results.append({
-                        "node": dict(record["n"]),
-                        "tag": dict(record["t"]),
-                    })
+        # Ensure every tag exists and link it in a single round trip
+        query = """
+        MATCH (n {id: $node_id})
+        UNWIND $tags AS tag
+        MERGE (t:Tag {name: tag.name})
+        ON CREATE SET
+            t.id = tag.id,
+            t.title = tag.title,
+            t.category = 'general',
+            t.created_at = $now,
+            t.updated_at = $now
+        ON MATCH SET
+            t.updated_at = $now
+        MERGE (n)-[r:HAS_TAG]->(t)
+        ON CREATE SET r.created_at = $now
+        RETURN properties(n) as n, properties(t) as t
+        """
 
+        records = await self._run(
+            query, node_id=node_id, tags=list(tags.values()), write=True, session=session
+        )
+        results = [{"node": r["n"], "tag": r["t"]} for r in records]
+        for result in results:
+            self._tag_cache[result["tag"]["name"]] = dict(result["tag"])
         return results
 
     async def get_node_tags(self, node_id: str) -> list[dict[str, Any]]:
         """Get all tags for a node."""
         query = """
         MATCH (n {id: $node_id})-[:HAS_TAG]->(t:Tag)
-        RETURN t
+        RETURN properties(t) as t
         ORDER BY t.name
         """
 
-        async with self.driver.session() as session:
-            result = await session.run(query, node_id=node_id)
-            records = await result.data()
-            return [dict(r["t"]) for r in records]
+        records = await self._run(query, node_id=node_id)
+        return [r["t"] for r in records]
 
     async def find_by_tags(
         self,
@@ -600,35 +1279,12 @@ class Neo4jClient:
             match_all: If True, node must have ALL tags. If False, ANY tag matches.
             limit: Maximum results to return
         """
-        normalized_tags = [t.lower().replace(" ", "-").replace("_", "-") for t in tag_names]
-
-        if match_all:
-            # Node must have ALL specified tags
-            label_filter = f":{node_label}" if node_label else ""
-            query = f"""
-            MATCH (n{label_filter})-[:HAS_TAG]->(t:Tag)
-            WHERE t.name IN $tags
-            WITH n, collect(DISTINCT t.name) as node_tags
-            WHERE size([tag IN $tags WHERE tag IN node_tags]) = size($tags)
-            RETURN n, node_tags as tags
-            LIMIT $limit
-            """
-        else:
-            # Node can have ANY of the specified tags
-            label_filter = f":{node_label}" if node_label else ""
-            query = f"""
-            MATCH (n{label_filter})-[:HAS_TAG]->(t:Tag)
-            WHERE t.name IN $tags
-            WITH n, collect(DISTINCT t.name) as node_tags, count(DISTINCT t) as tag_count
-            RETURN n, node_tags as tags
-            ORDER BY tag_count DESC
-            LIMIT $limit
-            """
+        normalized_tags = [_normalize_tag(t) for t in tag_names]
 
-        async with self.driver.session() as session:
-            result = await session.run(query, tags=normalized_tags, limit=limit)
-            records = await result.data()
-            return [{"node": dict(r["n"]), "tags": r["tags"]} for r in records]
+        records = await self._run(
+            _find_by_tags_query(node_label, match_all), tags=normalized_tags, limit=limit
+        )
+        return [{"node": r["n"], "tags": r["tags"]} for r in records]
 
     async def create_cross_reference(
         self,
@@ -641,6 +1297,8 @@ class Neo4jClient:
 
         This enables navigation between related topics across the hierarchy.
         """
+        # Both directions in one statement; FOREACH only adds the reverse
+        # edge when bidirectional
         query = """
         MATCH (t1:Topic {id: $topic_id_1})
         MATCH (t2:Topic {id: $topic_id_2})
@@ -648,124 +1306,140 @@ class Neo4jClient:
         ON CREATE SET
             r.id = $id,
             r.description = $description,
-            r.created_at = datetime()
-        RETURN t1, t2, r
+            r.created_at = $now
+        FOREACH (_ IN CASE WHEN $bidirectional THEN [1] ELSE [] END |
+            MERGE (t2)-[reverse:CROSS_REFERENCES]->(t1)
+            ON CREATE SET
+                reverse.id = $reverse_id,
+                reverse.description = $description,
+                reverse.created_at = $now
+        )
+        RETURN properties(t1) as t1, properties(t2) as t2, properties(r) as r
         """
 
-        async with self.driver.session() as session:
-            result = await session.run(
-                query,
-                topic_id_1=topic_id_1,
-                topic_id_2=topic_id_2,
-                id=str(uuid4()),
-                description=description,
-            )
-            record = await result.single()
-
-            # Create reverse relationship if bidirectional
-            if bidirectional:
-                reverse_query = """
-                MATCH (t1:Topic {id: $topic_id_1})
-                MATCH (t2:Topic {id: $topic_id_2})
-                MERGE (t2)-[r:CROSS_REFERENCES]->(t1)
-                ON CREATE SET
-                    r.id = $id,
-                    r.description = $description,
-                    r.created_at = datetime()
-                RETURN r
-                """
-                await session.run(
-                    reverse_query,
-                    topic_id_1=topic_id_1,
-                    topic_id_2=topic_id_2,
-                    id=str(uuid4()),
-                    description=description,
-                )
+        record = await self._single(
+            query,
+            topic_id_1=topic_id_1,
+            topic_id_2=topic_id_2,
+            id=str(uuid4()),
+            reverse_id=str(uuid4()),
+            description=description,
+            bidirectional=bidirectional,
+            write=True,
+        )
 
-            if record:
-                return {
-                    "topic_1": dict(record["t1"]),
-                    "topic_2": dict(record["t2"]),
-                    "relationship": dict(record["r"]),
-                }
-            return {}
+        if record:
+            return {
+                "topic_1": record["t1"],
+                "topic_2": record["t2"],
+                "relationship": record["r"],
+            }
+        return {}
+
+    async def get_cross_references(
+        self,
+        topic_id: str,
+        include_breadcrumb: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Get all topics that cross-reference with a given topic.
+
+        With include_breadcrumb=False the department and subdepartment
+        lookups are skipped and only the topic and description are returned.
+        """
+        if not include_breadcrumb:
+            query = """
+            MATCH (t:Topic {id: $topic_id})-[r:CROSS_REFERENCES]-(other:Topic)
+            RETURN {topic: properties(other), description: r.description} as row
+            """
+            records = await self._run(query, topic_id=topic_id)
+            return [r["row"] for r in records]
 
-    async def get_cross_references(self, topic_id: str) -> list[dict[str, Any]]:
-        """Get all topics that cross-reference with a given topic."""
         query = """
         MATCH (t:Topic {id: $topic_id})-[r:CROSS_REFERENCES]-(other:Topic)
         OPTIONAL MATCH (other)<-[:HAS_TOPIC]-(sd:SubDepartment)<-[:HAS_SUBDEPARTMENT]-(d:Department)
-        RETURN other, r.description as description, d.title as department, sd.title as subdepartment
-        """
-
-        async with self.driver.session() as session:
-            result = await session.run(query, topic_id=topic_id)
-            records = await result.data()
-            return [
-                {
-                    "topic": dict(r["other"]),
-                    "description": r["description"],
-                    "department": r["department"],
-                    "subdepartment": r["subdepartment"],
-                }
-                for r in records
-            ]
+        RETURN {
+            topic: properties(other),
+            description: r.description,
+            department: d.title,
+            subdepartment: sd.title
+        } as row
+        """
+
+        records = await self._run(query, topic_id=topic_id)
+        return [r["row"] for r in records]
 
     async def add_context_to_multiple_topics(
         self,
         context_id: str,
         topic_ids: list[str],
+        session: AsyncSession | None = None,
     ) -> list[dict[str, Any]]:
         """Link a context to multiple topics (many-to-many).
 
         The first topic uses HAS_CONTEXT, additional topics use ALSO_IN.
         """
-        results = []
-        for i, topic_id in enumerate(topic_ids):
-            rel_type = "HAS_CONTEXT" if i == 0 else "ALSO_IN"
-            query = f"""
-            MATCH (t:Topic {{id: $topic_id}})
-            MATCH (c:Context {{id: $context_id}})
-            MERGE (t)-[r:{rel_type}]->(c)
-            ON CREATE SET r.created_at = datetime()
-            RETURN t, c, r
-            """
+        if not topic_ids:
+            return []
 
-            async with self.driver.session() as session:
-                result = await session.run(
-                    query,
-                    topic_id=topic_id,
-                    context_id=context_id,
-                )
-                record = await result.single()
-                if record:
-                    results.append({
-                        "topic": dict(record["t"]),
-                        "context": dict(record["c"]),
-                        "relationship_type": rel_type,
-                    })
+        links = [
+            {"topic_id": topic_id, "rel_type": "HAS_CONTEXT" if i == 0 else "ALSO_IN"}
+            for i, topic_id in enumerate(topic_ids)
+        ]
 
-        return results
+        # One round trip; FOREACH picks the relationship type per row
+        query = """
+        MATCH (c:Context {id: $context_id})
+        UNWIND $links AS link
+        MATCH (t:Topic {id: link.topic_id})
+        FOREACH (_ IN CASE WHEN link.rel_type = 'HAS_CONTEXT' THEN [1] ELSE [] END |
+            MERGE (t)-[r:HAS_CONTEXT]->(c)
+            ON CREATE SET r.created_at = $now
+        )
+        FOREACH (_ IN CASE WHEN link.rel_type = 'ALSO_IN' THEN [1] ELSE [] END |
+            MERGE (t)-[r:ALSO_IN]->(c)
+            ON CREATE SET r.created_at = $now
+        )
+        RETURN properties(t) as t, properties(c) as c, link.rel_type as rel_type
+        """
+
+        records = await self._run(
+            query, context_id=context_id, links=links, write=True, session=session
+        )
+        return [
+            {
+                "topic": r["t"],
+                "context": r["c"],
+                "relationship_type": r["rel_type"],
+            }
+            for r in records
+        ]
+
+    async def get_context_topics(
+        self,
+        context_id: str,
+        include_breadcrumb: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Get all topics a context belongs to (including ALSO_IN relationships).
+
+        With include_breadcrumb=False the department and subdepartment
+        lookups are skipped and only the topics are returned.
+        """
+        if not include_breadcrumb:
+            query = """
+            MATCH (t:Topic)-[:HAS_CONTEXT|ALSO_IN]->(c:Context {id: $context_id})
+            RETURN {topic: properties(t)} as row
+            """
+            records = await self._run(query, context_id=context_id)
+            return [r["row"] for r in records]
 
-    async def get_context_topics(self, context_id: str) -> list[dict[str, Any]]:
-        """Get all topics a context belongs to (including ALSO_IN relationships)."""
         query = """
         MATCH (t:Topic)-[:HAS_CONTEXT|ALSO_IN]->(c:Context {id: $context_id})
         OPTIONAL MATCH (t)<-[:HAS_TOPIC]-(sd:SubDepartment)<-[:HAS_SUBDEPARTMENT]-(d:Department)
-        RETURN t, d.title as department, sd.title as subdepartment
+        RETURN {topic: properties(t), department: d.title, subdepartment: sd.title} as row
         """
 
-        async with self.driver.session() as session:
-            result = await session.run(query, context_id=context_id)
-            records = await result.data()
-            return [
-                {
-                    "topic": dict(r["t"]),
-                    "department": r["department"],
-                    "subdepartment": r["subdepartment"],
-                }
-                for r in records
-            ]
+        records = await self._run(query, context_id=context_id)
+        return [r["row"] for r in records]
 
     async def search_across_hierarchy(
         self,
@@ -773,92 +1447,42 @@ class Neo4jClient:
         tags: list[str] | None = None,
         source_types: list[str] | None = None,
         limit: int = 20,
+        include_breadcrumb: bool = True,
     ) -> list[dict[str, Any]]:
         """Search knowledge across the entire hierarchy.
 
         This bypasses the hierarchical navigation and searches directly,
-        optionally filtering by tags and source types.
+        optionally filtering by tags and source types. Pass
+        include_breadcrumb=False to skip resolving each topic's departments.
         """
-        # Build filter conditions
-        conditions = ["toLower(c.content) CONTAINS toLower($query) OR toLower(c.title) CONTAINS toLower($query)"]
-        params: dict[str, Any] = {"query": query_text, "limit": limit}
-
-        if source_types:
-            conditions.append("c.source_type IN $source_types")
-            params["source_types"] = source_types
-
-        where_clause = " AND ".join(conditions)
+        by_text = bool(query_text.strip())
+        params: dict[str, Any] = {
+            "source_types": source_types or None,
+            "limit": limit,
+        }
+        if by_text:
+            params["query"] = _escape_lucene(query_text)
 
         if tags:
-            normalized_tags = [t.lower().replace(" ", "-").replace("_", "-") for t in tags]
-            params["tags"] = normalized_tags
-            query = f"""
-            MATCH (c:Context)-[:HAS_TAG]->(tag:Tag)
-            WHERE tag.name IN $tags AND ({where_clause})
-            OPTIONAL MATCH (t:Topic)-[:HAS_CONTEXT|ALSO_IN]->(c)
-            OPTIONAL MATCH (t)<-[:HAS_TOPIC]-(sd:SubDepartment)<-[:HAS_SUBDEPARTMENT]-(d:Department)
-            WITH c, collect(DISTINCT tag.name) as tags, collect(DISTINCT t.title) as topics,
-                 collect(DISTINCT d.title) as departments
-            RETURN c, tags, topics, departments
-            ORDER BY c.importance DESC, c.created_at DESC
-            LIMIT $limit
-            """
-        else:
-            query = f"""
-            MATCH (c:Context)
-            WHERE {where_clause}
-            OPTIONAL MATCH (c)-[:HAS_TAG]->(tag:Tag)
-            OPTIONAL MATCH (t:Topic)-[:HAS_CONTEXT|ALSO_IN]->(c)
-            OPTIONAL MATCH (t)<-[:HAS_TOPIC]-(sd:SubDepartment)<-[:HAS_SUBDEPARTMENT]-(d:Department)
-            WITH c, collect(DISTINCT tag.name) as tags, collect(DISTINCT t.title) as topics,
-                 collect(DISTINCT d.title) as departments
-            RETURN c, tags, topics, departments
-            ORDER BY c.importance DESC, c.created_at DESC
-            LIMIT $limit
-            """
+            params["tags"] = [_normalize_tag(t) for t in tags]
 
-        async with self.driver.session() as session:
-            result = await session.run(query, **params)
-            records = await result.data()
-            return [
-                {
-                    "context": dict(r["c"]),
-                    "tags": r["tags"],
-                    "topics": r["topics"],
-                    "departments": r["departments"],
-                }
-                for r in records
-            ]
+        query = _search_hierarchy_query(by_text, bool(tags), include_breadcrumb)
+        records = await self._run(query, **params)
+        return [r["row"] for r in records]
 
     async def get_all_tags(self, category: str | None = None) -> list[dict[str, Any]]:
         """Get all tags, optionally filtered by category."""
-        if category:
-            query = """
-            MATCH (t:Tag {category: $category})
-            OPTIONAL MATCH (n)-[:HAS_TAG]->(t)
-            RETURN t, count(n) as usage_count
-            ORDER BY usage_count DESC, t.name
-            """
-            params = {"category": category}
-        else:
-            query = """
-            MATCH (t:Tag)
-            OPTIONAL MATCH (n)-[:HAS_TAG]->(t)
-            RETURN t, count(n) as usage_count
-            ORDER BY usage_count DESC, t.name
-            """
-            params = {}
-
-        async with self.driver.session() as session:
-            result = await session.run(query, **params)
-            records = await result.data()
-            return [
-                {
-                    "tag": dict(r["t"]),
-                    "usage_count": r["usage_count"],
-                }
-                for r in records
-            ]
+        query = """
+        MATCH (t:Tag)
+        WHERE $category IS NULL OR t.category = $category
+        OPTIONAL MATCH (n)-[:HAS_TAG]->(t)
+        WITH t, count(n) as usage_count
+        ORDER BY usage_count DESC, t.name
+        RETURN {tag: properties(t), usage_count: usage_count} as row
+        """
+
+        records = await self._run(query, category=category or None)
+        return [r["row"] for r in records]
 
 
 # Singleton instance
@@ -2,9 +2,295 @@
 
 from dataclasses import dataclass
 from typing import Any
-
-
-@dataclass
+from uuid import uuid4
+
+from src.knowledge.graph.client import _escape_lucene
+
+# Query text is built once at import, so every call hands the driver the same
+# string and Neo4j reuses its cached plan
+
+_CREATE_DEPARTMENT_QUERY = """
+    CREATE (d:Department {
+        id: $id,
+        title: $name,
+        description: $description,
+        head_id: $head_id,
+        created_at: datetime(),
+        updated_at: datetime()
+    })
+    RETURN d
+    """
+
+_GET_ALL_DEPARTMENTS_QUERY = """
+    MATCH (d:Department)
+    OPTIONAL MATCH (d)-[:HAS_SUBDEPARTMENT]->(sd:SubDepartment)
+    RETURN d, count(sd) as subdepartment_count
+    ORDER BY d.title
+    """
+
+# One row per (department, subdepartment) with its topics; a null
+# $department_id widens the same query from one department to all of them
+_GET_HIERARCHY_QUERY = """
+    MATCH (d:Department)
+    WHERE $department_id IS NULL OR d.id = $department_id
+    OPTIONAL MATCH (d)-[:HAS_SUBDEPARTMENT]->(sd:SubDepartment)
+    OPTIONAL MATCH (sd)-[:HAS_TOPIC]->(t:Topic)
+    OPTIONAL MATCH (t)-[:HAS_CONTEXT]->(c:Context)
+    WITH d, sd, t, count(c) as context_count
+    ORDER BY t.title
+    RETURN d as department,
+           sd as subdepartment,
+           collect({topic: t, context_count: context_count}) as topics
+    ORDER BY d.title, sd.title
+    """
+
+_ADD_SUBDEPARTMENT_QUERY = """
+    MATCH (d:Department {id: $department_id})
+    CREATE (sd:SubDepartment {
+        id: $id,
+        title: $name,
+        description: $description,
+        department_id: $department_id,
+        created_at: datetime(),
+        updated_at: datetime()
+    })
+    CREATE (d)-[:HAS_SUBDEPARTMENT]->(sd)
+    RETURN sd
+    """
+
+_ADD_TOPIC_QUERY = """
+    MATCH (sd:SubDepartment {id: $subdepartment_id})
+    CREATE (t:Topic {
+        id: $id,
+        title: $name,
+        description: $description,
+        sub_department_id: $subdepartment_id,
+        importance: 0.5,
+        created_at: datetime(),
+        updated_at: datetime()
+    })
+    CREATE (sd)-[:HAS_TOPIC]->(t)
+    RETURN t
+    """
+
+_ADD_CONTEXT_QUERY = """
+    MATCH (t:Topic {id: $topic_id})
+    CREATE (c:Context {
+        id: $id,
+        title: $title,
+        content: $content,
+        source_type: $source_type,
+        source_id: $source_id,
+        source_url: $source_url,
+        embedding_id: $embedding_id,
+        importance: $importance,
+        topic_id: $topic_id,
+        created_at: datetime(),
+        updated_at: datetime()
+    })
+    CREATE (t)-[:HAS_CONTEXT]->(c)
+    SET t.last_updated_context = datetime()
+    RETURN c
+    """
+
+_ADD_CONTEXTS_BATCH_QUERY = """
+    UNWIND $rows AS row
+    MATCH (t:Topic {id: row.topic_id})
+    CREATE (c:Context {
+        id: row.id,
+        title: row.title,
+        content: row.content,
+        source_type: row.source_type,
+        source_id: row.source_id,
+        source_url: row.source_url,
+        embedding_id: row.embedding_id,
+        importance: coalesce(row.importance, 0.5),
+        topic_id: row.topic_id,
+        created_at: datetime(),
+        updated_at: datetime()
+    })
+    CREATE (t)-[:HAS_CONTEXT]->(c)
+    SET t.last_updated_context = datetime()
+    RETURN c
+    """
+
+# Hinted onto the topic_id constraint and context_source index from
+# SCHEMA_CONSTRAINTS / SCHEMA_INDEXES so a degraded plan never label-scans
+_GET_TOPIC_CONTEXTS_QUERY = """
+    MATCH (t:Topic {id: $topic_id})
+    USING INDEX t:Topic(id)
+    MATCH (t)-[:HAS_CONTEXT]->(c:Context)
+    RETURN c
+    ORDER BY c.importance DESC, c.created_at DESC
+    LIMIT $limit
+    """
+
+_GET_SOURCE_CONTEXTS_QUERY = """
+    MATCH (c:Context {source_type: $source_type})
+    USING INDEX c:Context(source_type)
+    RETURN c
+    ORDER BY c.created_at DESC
+    SKIP $skip
+    LIMIT $limit
+    """
+
+_CREATE_WEEKLY_SUMMARY_QUERY = """
+    MATCH (t:Topic {id: $topic_id})
+    CREATE (s:Summary {
+        id: $id,
+        title: $title,
+        content: $content,
+        summary_type: 'weekly',
+        topic_id: $topic_id,
+        period_start: datetime($period_start),
+        period_end: datetime($period_end),
+        source_context_ids: $source_context_ids,
+        created_at: datetime(),
+        updated_at: datetime()
+    })
+    CREATE (t)-[:HAS_SUMMARY]->(s)
+    RETURN s
+    """
+
+# Optional filters are a null check on the parameter rather than a second
+# query text, so both variants share one cached plan
+_GET_TOPIC_SUMMARIES_QUERY = """
+    MATCH (t:Topic {id: $topic_id})-[:HAS_SUMMARY]->(s:Summary)
+    WHERE $summary_type IS NULL OR s.summary_type = $summary_type
+    RETURN s
+    ORDER BY s.period_end DESC
+    """
+
+_CREATE_ENTITY_QUERY = """
+    CREATE (e:Entity {
+        id: $id,
+        title: $name,
+        entity_type: $entity_type,
+        description: $description,
+        aliases: $aliases,
+        created_at: datetime(),
+        updated_at: datetime()
+    })
+    RETURN e
+    """
+
+_CREATE_ENTITIES_BATCH_QUERY = """
+    UNWIND $rows AS row
+    CREATE (e:Entity {
+        id: row.id,
+        title: row.name,
+        entity_type: row.entity_type,
+        description: row.description,
+        aliases: coalesce(row.aliases, []),
+        created_at: datetime(),
+        updated_at: datetime()
+    })
+    RETURN e
+    """
+
+_LINK_CONTEXT_ENTITY_QUERY = """
+    MATCH (c:Context {id: $context_id})
+    MATCH (e:Entity {id: $entity_id})
+    MERGE (c)-[:MENTIONS]->(e)
+    RETURN c, e
+    """
+
+_LINK_CONTEXTS_ENTITIES_BATCH_QUERY = """
+    UNWIND $pairs AS pair
+    MATCH (c:Context {id: pair.context_id})
+    MATCH (e:Entity {id: pair.entity_id})
+    MERGE (c)-[:MENTIONS]->(e)
+    RETURN c.id as context_id, e.id as entity_id
+    """
+
+_GET_ENTITY_CONTEXTS_QUERY = """
+    MATCH (c:Context)-[:MENTIONS]->(e:Entity {id: $entity_id})
+    RETURN c
+    ORDER BY c.created_at DESC
+    SKIP $skip
+    LIMIT $limit
+    """
+
+_CREATE_PERSON_QUERY = """
+    CREATE (p:Person {
+        id: $id,
+        title: $name,
+        email: $email,
+        role: $role,
+        department_id: $department_id,
+        team: $team,
+        created_at: datetime(),
+        updated_at: datetime()
+    })
+    RETURN p
+    """
+
+_GET_PERSON_BY_EMAIL_QUERY = "MATCH (p:Person {email: $email}) RETURN p"
+
+_GET_DEPARTMENT_PEOPLE_QUERY = """
+    MATCH (p:Person {department_id: $department_id})
+    RETURN p
+    ORDER BY p.title
+    """
+
+_CREATE_DECISION_QUERY = """
+    CREATE (d:Decision {
+        id: $id,
+        title: $title,
+        content: $content,
+        decision_type: $decision_type,
+        context: $context,
+        rationale: $rationale,
+        source_url: $source_url,
+        status: 'active',
+        created_at: datetime(),
+        updated_at: datetime()
+    })
+    RETURN d
+    """
+
+_GET_RECENT_DECISIONS_QUERY = """
+    MATCH (d:Decision {status: 'active'})
+    WHERE $decision_type IS NULL OR d.decision_type = $decision_type
+    RETURN d
+    ORDER BY d.created_at DESC
+    SKIP $skip
+    LIMIT $limit
+    """
+
+# Keyword search goes through the full-text index of each requested label;
+# the index names are a parameter, so every label selection shares one plan
+_SEARCH_BY_KEYWORDS_QUERY = """
+    UNWIND $indexes AS index
+    CALL db.index.fulltext.queryNodes(index, $lucene_query, {limit: $skip + $limit})
+    YIELD node, score
+    RETURN node as n, labels(node) as node_labels, score
+    ORDER BY score DESC
+    SKIP $skip
+    LIMIT $limit
+    """
+
+_KEYWORD_INDEXES = {
+    "Context": "context_content",
+    "Summary": "summary_content",
+    "Decision": "decision_content",
+    "Entity": "entity_content",
+}
+
+# Searched when no node types are given: every keyword-indexed label
+_DEFAULT_SEARCH_INDEXES: tuple[str, ...] = tuple(_KEYWORD_INDEXES.values())
+
+_FIND_RELATED_CONTEXTS_QUERY = """
+    MATCH (source:Context {id: $context_id})-[:MENTIONS]->(e:Entity)<-[:MENTIONS]-(related:Context)
+    WHERE related.id <> $context_id
+    RETURN related, e.title as shared_entity, count(e) as shared_count
+    ORDER BY shared_count DESC
+    SKIP $skip
+    LIMIT $limit
+    """
+
+
+@dataclass(slots=True)
 class CypherQuery:
     """A Cypher query with its parameters."""
 
@@ -21,30 +307,20 @@ class QueryTemplates:
     def create_department(name: str, description: str | None = None, head_id: str | None = None) -> CypherQuery:
         """Create a new department."""
         return CypherQuery(
-            query="""
-            CREATE (d:Department {
-                id: randomUUID(),
-                title: $name,
-                description: $description,
-                head_id: $head_id,
-                created_at: datetime(),
-                updated_at: datetime()
-            })
-            RETURN d
-            """,
-            params={"name": name, "description": description, "head_id": head_id},
+            query=_CREATE_DEPARTMENT_QUERY,
+            params={
+                "id": str(uuid4()),
+                "name": name,
+                "description": description,
+                "head_id": head_id,
+            },
         )
 
     @staticmethod
     def get_all_departments() -> CypherQuery:
         """Get all departments with their subdepartment counts."""
         return CypherQuery(
-            query="""
-            MATCH (d:Department)
-            OPTIONAL MATCH (d)-[:HAS_SUBDEPARTMENT]->(sd:SubDepartment)
-            RETURN d, count(sd) as subdepartment_count
-            ORDER BY d.title
-            """,
+            query=_GET_ALL_DEPARTMENTS_QUERY,
             params={},
         )
 
@@ -54,37 +330,15 @@ class QueryTemplates:
     def get_full_hierarchy() -> CypherQuery:
         """Get the complete textbook hierarchy."""
         return CypherQuery(
-            query="""
-            MATCH (d:Department)
-            OPTIONAL MATCH (d)-[:HAS_SUBDEPARTMENT]->(sd:SubDepartment)
-            OPTIONAL MATCH (sd)-[:HAS_TOPIC]->(t:Topic)
-            OPTIONAL MATCH (t)-[:HAS_CONTEXT]->(c:Context)
-            WITH d, sd, t, count(c) as context_count
-            RETURN d as department,
-                   collect(DISTINCT {
-                       subdepartment: sd,
-                       topics: collect(DISTINCT {topic: t, context_count: context_count})
-                   }) as hierarchy
-            ORDER BY d.title
-            """,
-            params={},
+            query=_GET_HIERARCHY_QUERY,
+            params={"department_id": None},
         )
 
     @staticmethod
     def get_hierarchy_for_department(department_id: str) -> CypherQuery:
         """Get hierarchy for a specific department."""
         return CypherQuery(
-            query="""
-            MATCH (d:Department {id: $department_id})
-            OPTIONAL MATCH (d)-[:HAS_SUBDEPARTMENT]->(sd:SubDepartment)
-            OPTIONAL MATCH (sd)-[:HAS_TOPIC]->(t:Topic)
-            OPTIONAL MATCH (t)-[:HAS_CONTEXT]->(c:Context)
-            WITH d, sd, t, count(c) as context_count
-            RETURN d as department,
-                   sd as subdepartment,
-                   collect({topic: t, context_count: context_count}) as topics
-            ORDER BY sd.title, t.title
-            """,
+            query=_GET_HIERARCHY_QUERY,
             params={"department_id": department_id},
         )
 
@@ -92,41 +346,26 @@ class QueryTemplates:
     def add_subdepartment(department_id: str, name: str, description: str | None = None) -> CypherQuery:
         """Add a subdepartment to a department."""
         return CypherQuery(
-            query="""
-            MATCH (d:Department {id: $department_id})
-            CREATE (sd:SubDepartment {
-                id: randomUUID(),
-                title: $name,
-                description: $description,
-                department_id: $department_id,
-                created_at: datetime(),
-                updated_at: datetime()
-            })
-            CREATE (d)-[:HAS_SUBDEPARTMENT]->(sd)
-            RETURN sd
-            """,
-            params={"department_id": department_id, "name": name, "description": description},
+            query=_ADD_SUBDEPARTMENT_QUERY,
+            params={
+                "id": str(uuid4()),
+                "department_id": department_id,
+                "name": name,
+                "description": description,
+            },
         )
 
     @staticmethod
     def add_topic(subdepartment_id: str, name: str, description: str | None = None) -> CypherQuery:
         """Add a topic to a subdepartment."""
         return CypherQuery(
-            query="""
-            MATCH (sd:SubDepartment {id: $subdepartment_id})
-            CREATE (t:Topic {
-                id: randomUUID(),
-                title: $name,
-                description: $description,
-                sub_department_id: $subdepartment_id,
-                importance: 0.5,
-                created_at: datetime(),
-                updated_at: datetime()
-            })
-            CREATE (sd)-[:HAS_TOPIC]->(t)
-            RETURN t
-            """,
-            params={"subdepartment_id": subdepartment_id, "name": name, "description": description},
+            query=_ADD_TOPIC_QUERY,
+            params={
+                "id": str(uuid4()),
+                "subdepartment_id": subdepartment_id,
+                "name": name,
+                "description": description,
+            },
         )
 
     # ========== Context queries ==========
@@ -144,26 +383,9 @@ class QueryTemplates:
     ) -> CypherQuery:
         """Add a context node to a topic."""
         return CypherQuery(
-            query="""
-            MATCH (t:Topic {id: $topic_id})
-            CREATE (c:Context {
-                id: randomUUID(),
-                title: $title,
-                content: $content,
-                source_type: $source_type,
-                source_id: $source_id,
-                source_url: $source_url,
-                embedding_id: $embedding_id,
-                importance: $importance,
-                topic_id: $topic_id,
-                created_at: datetime(),
-                updated_at: datetime()
-            })
-            CREATE (t)-[:HAS_CONTEXT]->(c)
-            SET t.last_updated_context = datetime()
-            RETURN c
-            """,
+            query=_ADD_CONTEXT_QUERY,
             params={
+                "id": str(uuid4()),
                 "topic_id": topic_id,
                 "title": title,
                 "content": content,
@@ -175,30 +397,32 @@ class QueryTemplates:
             },
         )
 
+    @staticmethod
+    def add_contexts_batch(rows: list[dict[str, Any]]) -> CypherQuery:
+        """Add many context nodes in one query.
+
+        Each row carries the ``add_context`` arguments as keys; ``source_url``,
+        ``embedding_id`` and ``importance`` may be omitted.
+        """
+        return CypherQuery(
+            query=_ADD_CONTEXTS_BATCH_QUERY,
+            params={"rows": [{"id": str(uuid4()), **row} for row in rows]},
+        )
+
     @staticmethod
     def get_contexts_for_topic(topic_id: str, limit: int = 50) -> CypherQuery:
         """Get all contexts for a topic."""
         return CypherQuery(
-            query="""
-            MATCH (t:Topic {id: $topic_id})-[:HAS_CONTEXT]->(c:Context)
-            RETURN c
-            ORDER BY c.importance DESC, c.created_at DESC
-            LIMIT $limit
-            """,
+            query=_GET_TOPIC_CONTEXTS_QUERY,
             params={"topic_id": topic_id, "limit": limit},
         )
 
     @staticmethod
-    def get_contexts_by_source(source_type: str, limit: int = 50) -> CypherQuery:
+    def get_contexts_by_source(source_type: str, limit: int = 50, skip: int = 0) -> CypherQuery:
         """Get contexts by source type."""
         return CypherQuery(
-            query="""
-            MATCH (c:Context {source_type: $source_type})
-            RETURN c
-            ORDER BY c.created_at DESC
-            LIMIT $limit
-            """,
-            params={"source_type": source_type, "limit": limit},
+            query=_GET_SOURCE_CONTEXTS_QUERY,
+            params={"source_type": source_type, "skip": skip, "limit": limit},
         )
 
     # ========== Summary queries ==========
@@ -214,24 +438,9 @@ class QueryTemplates:
     ) -> CypherQuery:
         """Create a weekly summary for a topic."""
         return CypherQuery(
-            query="""
-            MATCH (t:Topic {id: $topic_id})
-            CREATE (s:Summary {
-                id: randomUUID(),
-                title: $title,
-                content: $content,
-                summary_type: 'weekly',
-                topic_id: $topic_id,
-                period_start: datetime($period_start),
-                period_end: datetime($period_end),
-                source_context_ids: $source_context_ids,
-                created_at: datetime(),
-                updated_at: datetime()
-            })
-            CREATE (t)-[:HAS_SUMMARY]->(s)
-            RETURN s
-            """,
+            query=_CREATE_WEEKLY_SUMMARY_QUERY,
             params={
+                "id": str(uuid4()),
                 "topic_id": topic_id,
                 "title": title,
                 "content": content,
@@ -244,22 +453,9 @@ class QueryTemplates:
     @staticmethod
     def get_summaries_for_topic(topic_id: str, summary_type: str | None = None) -> CypherQuery:
         """Get summaries for a topic."""
-        if summary_type:
-            return CypherQuery(
-                query="""
-                MATCH (t:Topic {id: $topic_id})-[:HAS_SUMMARY]->(s:Summary {summary_type: $summary_type})
-                RETURN s
-                ORDER BY s.period_end DESC
-                """,
-                params={"topic_id": topic_id, "summary_type": summary_type},
-            )
         return CypherQuery(
-            query="""
-            MATCH (t:Topic {id: $topic_id})-[:HAS_SUMMARY]->(s:Summary)
-            RETURN s
-            ORDER BY s.period_end DESC
-            """,
-            params={"topic_id": topic_id},
+            query=_GET_TOPIC_SUMMARIES_QUERY,
+            params={"topic_id": topic_id, "summary_type": summary_type or None},
         )
 
     # ========== Entity queries ==========
@@ -273,19 +469,9 @@ class QueryTemplates:
     ) -> CypherQuery:
         """Create an entity node."""
         return CypherQuery(
-            query="""
-            CREATE (e:Entity {
-                id: randomUUID(),
-                title: $name,
-                entity_type: $entity_type,
-                description: $description,
-                aliases: $aliases,
-                created_at: datetime(),
-                updated_at: datetime()
-            })
-            RETURN e
-            """,
+            query=_CREATE_ENTITY_QUERY,
             params={
+                "id": str(uuid4()),
                 "name": name,
                 "entity_type": entity_type,
                 "description": description,
@@ -293,30 +479,48 @@ class QueryTemplates:
             },
         )
 
+    @staticmethod
+    def create_entities_batch(rows: list[dict[str, Any]]) -> CypherQuery:
+        """Create many entity nodes in one query.
+
+        Each row carries the ``create_entity`` arguments as keys.
+        """
+        return CypherQuery(
+            query=_CREATE_ENTITIES_BATCH_QUERY,
+            params={"rows": [{"id": str(uuid4()), **row} for row in rows]},
+        )
+
     @staticmethod
     def link_context_to_entity(context_id: str, entity_id: str) -> CypherQuery:
         """Link a context node to an entity."""
         return CypherQuery(
-            query="""
-            MATCH (c:Context {id: $context_id})
-            MATCH (e:Entity {id: $entity_id})
-            MERGE (c)-[:MENTIONS]->(e)
-            RETURN c, e
-            """,
+            query=_LINK_CONTEXT_ENTITY_QUERY,
             params={"context_id": context_id, "entity_id": entity_id},
         )
 
     @staticmethod
-    def get_contexts_mentioning_entity(entity_id: str, limit: int = 20) -> CypherQuery:
+    def link_contexts_to_entities_batch(pairs: list[tuple[str, str]]) -> CypherQuery:
+        """Link many ``(context_id, entity_id)`` pairs in one query."""
+        return CypherQuery(
+            query=_LINK_CONTEXTS_ENTITIES_BATCH_QUERY,
+            params={
+                "pairs": [
+                    {"context_id": context_id, "entity_id": entity_id}
+                    for context_id, entity_id in pairs
+                ]
+            },
+        )
+
+    @staticmethod
+    def get_contexts_mentioning_entity(
+        entity_id: str,
+        limit: int = 20,
+        skip: int = 0,
+    ) -> CypherQuery:
         """Get contexts that mention an entity."""
         return CypherQuery(
-            query="""
-            MATCH (c:Context)-[:MENTIONS]->(e:Entity {id: $entity_id})
-            RETURN c
-            ORDER BY c.created_at DESC
-            LIMIT $limit
-            """,
-            params={"entity_id": entity_id, "limit": limit},
+            query=_GET_ENTITY_CONTEXTS_QUERY,
+            params={"entity_id": entity_id, "skip": skip, "limit": limit},
         )
 
     # ========== Person queries ==========
@@ -331,20 +535,9 @@ class QueryTemplates:
     ) -> CypherQuery:
         """Create a person node."""
         return CypherQuery(
-            query="""
-            CREATE (p:Person {
-                id: randomUUID(),
-                title: $name,
-                email: $email,
-                role: $role,
-                department_id: $department_id,
-                team: $team,
-                created_at: datetime(),
-                updated_at: datetime()
-            })
-            RETURN p
-            """,
+            query=_CREATE_PERSON_QUERY,
             params={
+                "id": str(uuid4()),
                 "name": name,
                 "email": email,
                 "role": role,
@@ -357,7 +550,7 @@ class QueryTemplates:
     def get_person_by_email(email: str) -> CypherQuery:
         """Get a person by email."""
         return CypherQuery(
-            query="MATCH (p:Person {email: $email}) RETURN p",
+            query=_GET_PERSON_BY_EMAIL_QUERY,
             params={"email": email},
         )
 
@@ -365,11 +558,7 @@ class QueryTemplates:
     def get_people_in_department(department_id: str) -> CypherQuery:
         """Get all people in a department."""
         return CypherQuery(
-            query="""
-            MATCH (p:Person {department_id: $department_id})
-            RETURN p
-            ORDER BY p.title
-            """,
+            query=_GET_DEPARTMENT_PEOPLE_QUERY,
             params={"department_id": department_id},
         )
 
@@ -386,22 +575,9 @@ class QueryTemplates:
     ) -> CypherQuery:
         """Create a decision node."""
         return CypherQuery(
-            query="""
-            CREATE (d:Decision {
-                id: randomUUID(),
-                title: $title,
-                content: $content,
-                decision_type: $decision_type,
-                context: $context,
-                rationale: $rationale,
-                source_url: $source_url,
-                status: 'active',
-                created_at: datetime(),
-                updated_at: datetime()
-            })
-            RETURN d
-            """,
+            query=_CREATE_DECISION_QUERY,
             params={
+                "id": str(uuid4()),
                 "title": title,
                 "content": content,
                 "decision_type": decision_type,
@@ -412,65 +588,62 @@ class QueryTemplates:
         )
 
     @staticmethod
-    def get_recent_decisions(limit: int = 20, decision_type: str | None = None) -> CypherQuery:
+    def get_recent_decisions(
+        limit: int = 20,
+        decision_type: str | None = None,
+        skip: int = 0,
+    ) -> CypherQuery:
         """Get recent decisions."""
-        if decision_type:
-            return CypherQuery(
-                query="""
-                MATCH (d:Decision {decision_type: $decision_type, status: 'active'})
-                RETURN d
-                ORDER BY d.created_at DESC
-                LIMIT $limit
-                """,
-                params={"decision_type": decision_type, "limit": limit},
-            )
         return CypherQuery(
-            query="""
-            MATCH (d:Decision {status: 'active'})
-            RETURN d
-            ORDER BY d.created_at DESC
-            LIMIT $limit
-            """,
-            params={"limit": limit},
+            query=_GET_RECENT_DECISIONS_QUERY,
+            params={"decision_type": decision_type or None, "skip": skip, "limit": limit},
         )
 
     # ========== Search queries ==========
 
     @staticmethod
-    def search_by_keywords(keywords: list[str], node_types: list[str] | None = None) -> CypherQuery:
-        """Search for nodes containing keywords."""
-        labels = node_types if node_types else ["Context", "Summary", "Decision", "Entity"]
-        label_str = ":".join(labels)
+    def search_by_keywords(
+        keywords: list[str],
+        node_types: list[str] | None = None,
+        limit: int = 20,
+        skip: int = 0,
+    ) -> CypherQuery:
+        """Search for nodes containing keywords, best full-text score first.
+
+        Only labels with a keyword index can be searched; any other label
+        raises ValueError. No keywords gives a query that returns no rows.
+        """
+        if node_types:
+            unindexed = [label for label in node_types if label not in _KEYWORD_INDEXES]
+            if unindexed:
+                raise ValueError(f"No keyword index for node types: {', '.join(unindexed)}")
+            indexes = tuple(_KEYWORD_INDEXES[label] for label in node_types)
+        else:
+            indexes = _DEFAULT_SEARCH_INDEXES
+        if not keywords:
+            # UNWIND over no indexes never reaches the Lucene parser
+            indexes = ()
+        lucene_query = " OR ".join(f'"{_escape_lucene(keyword)}"' for keyword in keywords)
 
         return CypherQuery(
-            query=f"""
-            MATCH (n)
-            WHERE any(label IN labels(n) WHERE label IN $labels)
-            AND any(keyword IN $keywords WHERE
-                toLower(n.title) CONTAINS toLower(keyword) OR
-                toLower(coalesce(n.content, '')) CONTAINS toLower(keyword)
-            )
-            RETURN n, labels(n) as node_labels,
-                   size([keyword IN $keywords WHERE
-                       toLower(n.title) CONTAINS toLower(keyword) OR
-                       toLower(coalesce(n.content, '')) CONTAINS toLower(keyword)
-                   ]) as match_count
-            ORDER BY match_count DESC
-            LIMIT 20
-            """,
-            params={"keywords": keywords, "labels": labels},
+            query=_SEARCH_BY_KEYWORDS_QUERY,
+            params={
+                "indexes": indexes,
+                "lucene_query": lucene_query,
+                "skip": skip,
+                "limit": limit,
+            },
         )
 
     @staticmethod
-    def find_related_contexts(context_id: str, max_hops: int = 2) -> CypherQuery:
+    def find_related_contexts(
+        context_id: str,
+        max_hops: int = 2,
+        limit: int = 10,
+        skip: int = 0,
+    ) -> CypherQuery:
         """Find contexts related to a given context through shared entities."""
         return CypherQuery(
-            query="""
-            MATCH (source:Context {id: $context_id})-[:MENTIONS]->(e:Entity)<-[:MENTIONS]-(related:Context)
-            WHERE related.id <> $context_id
-            RETURN related, e.title as shared_entity, count(e) as shared_count
-            ORDER BY shared_count DESC
-            LIMIT 10
-            """,
-            params={"context_id": context_id, "max_hops": max_hops},
+            query=_FIND_RELATED_CONTEXTS_QUERY,
+            params={"context_id": context_id, "max_hops": max_hops, "skip": skip, "limit": limit},
         )
@@ -65,7 +65,7 @@ class RelationshipTypes(str, Enum):
     PRECEDED_BY = "PRECEDED_BY"
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseNode:
     """Base class for all graph nodes."""
 
@@ -76,7 +76,7 @@ class BaseNode:
     metadata: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class DepartmentNode(BaseNode):
     """Department node in the knowledge hierarchy."""
 
@@ -84,7 +84,7 @@ class DepartmentNode(BaseNode):
     head_id: str | None = None  # Person node ID
 
 
-@dataclass
+@dataclass(slots=True)
 class SubDepartmentNode(BaseNode):
     """Sub-department node."""
 
@@ -93,7 +93,7 @@ class SubDepartmentNode(BaseNode):
     lead_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TopicNode(BaseNode):
     """Topic node representing a knowledge area."""
 
@@ -103,7 +103,7 @@ class TopicNode(BaseNode):
     last_updated_context: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextNode(BaseNode):
     """Context node representing individual knowledge pieces.
 
@@ -124,7 +124,7 @@ class ContextNode(BaseNode):
     expires_at: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SummaryNode(BaseNode):
     """Summary node for consolidated knowledge.
 
@@ -142,7 +142,7 @@ class SummaryNode(BaseNode):
     embedding_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityNode(BaseNode):
     """Entity node for named entities (tools, concepts, etc.)."""
 
@@ -151,7 +151,7 @@ class EntityNode(BaseNode):
     aliases: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PersonNode(BaseNode):
     """Person node for team members."""
 
@@ -165,7 +165,7 @@ class PersonNode(BaseNode):
     expertise_areas: list[str] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectNode(BaseNode):
     """Project node for tracking projects."""
 
@@ -176,7 +176,7 @@ class ProjectNode(BaseNode):
     department_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionNode(BaseNode):
     """Decision node for documented decisions."""
 
@@ -189,7 +189,7 @@ class DecisionNode(BaseNode):
     source_url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TagNode(BaseNode):
     """Tag node for cross-cutting concerns.
 
@@ -226,12 +226,18 @@ SCHEMA_INDEXES = [
     "CREATE FULLTEXT INDEX context_content IF NOT EXISTS FOR (c:Context) ON EACH [c.content, c.title]",
     "CREATE FULLTEXT INDEX summary_content IF NOT EXISTS FOR (s:Summary) ON EACH [s.content, s.title]",
     "CREATE FULLTEXT INDEX decision_content IF NOT EXISTS FOR (d:Decision) ON EACH [d.content, d.title, d.rationale]",
+    "CREATE FULLTEXT INDEX entity_content IF NOT EXISTS FOR (e:Entity) ON EACH [e.title, e.description]",
     # Property indexes for common queries
     "CREATE INDEX context_source IF NOT EXISTS FOR (c:Context) ON (c.source_type)",
     "CREATE INDEX context_topic IF NOT EXISTS FOR (c:Context) ON (c.topic_id)",
+    "CREATE INDEX context_created_at IF NOT EXISTS FOR (c:Context) ON (c.created_at)",
     "CREATE INDEX summary_type IF NOT EXISTS FOR (s:Summary) ON (s.summary_type)",
     "CREATE INDEX person_department IF NOT EXISTS FOR (p:Person) ON (p.department_id)",
     "CREATE INDEX project_status IF NOT EXISTS FOR (p:Project) ON (p.status)",
+    # Title indexes backing hierarchy lookups and ORDER BY title
+    "CREATE INDEX department_title IF NOT EXISTS FOR (d:Department) ON (d.title)",
+    "CREATE INDEX subdepartment_title IF NOT EXISTS FOR (s:SubDepartment) ON (s.title)",
+    "CREATE INDEX topic_title IF NOT EXISTS FOR (t:Topic) ON (t.title)",
     # Tag indexes for cross-cutting searches
     "CREATE INDEX tag_name IF NOT EXISTS FOR (t:Tag) ON (t.name)",
     "CREATE INDEX tag_category IF NOT EXISTS FOR (t:Tag) ON (t.category)",
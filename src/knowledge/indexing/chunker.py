@@ -1,13 +1,25 @@
 """Document chunking for embedding generation."""
 
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import tiktoken
 
+# Semantic boundaries: paragraphs (double newlines), markdown headers and
+# horizontal rules, compiled once and shared by every chunker
+_SPLIT_RE = re.compile(r'(\n\n+)|(\n#{1,6}\s)|(\n---+\n)')
+_SEPARATOR_RE = re.compile(r'^\n+$|^---+$')
+_HEADER_RE = re.compile(r'^#{1,6}\s')
 
-@dataclass
+# Texts up to this length have their token counts memoized; recurring titles
+# and boilerplate are short, and longer texts rarely repeat
+_COUNT_CACHE_MAX_CHARS = 2048
+
+
+@dataclass(slots=True)
 class Chunk:
     """A chunk of text with metadata."""
 
@@ -33,13 +45,21 @@ class DocumentChunker:
         chunk_overlap: int = 50,
         model: str = "cl100k_base",  # Default tokenizer for OpenAI/Anthropic
     ):
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap must be at least 0 and smaller than chunk_size")
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.tokenizer = tiktoken.get_encoding(model)
+        self._cached_count = lru_cache(maxsize=4096)(self._count)
 
     def count_tokens(self, text: str) -> int:
         """Count tokens in text."""
-        return len(self.tokenizer.encode(text))
+        if len(text) <= _COUNT_CACHE_MAX_CHARS:
+            return self._cached_count(text)
+        return self._count(text)
+
+    def _count(self, text: str) -> int:
+        return len(self.tokenizer.encode_ordinary(text))
 
     def chunk_text(
         self,
@@ -50,137 +70,135 @@ class DocumentChunker:
 
         Tries semantic chunking first, falls back to token-based splitting.
         """
+        return list(self.iter_chunks(text, metadata))
+
+    def iter_chunks(
+        self,
+        text: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> Iterator[Chunk]:
+        """Yield chunks one at a time, so a pipeline can embed them as they come."""
         metadata = metadata or {}
 
         # Try semantic chunking first
-        chunks = self._semantic_chunk(text, metadata)
-
-        # If chunks are too large, split them further
-        final_chunks = []
-        for chunk in chunks:
+        for chunk in self._iter_semantic_chunks(text, metadata):
             if chunk.token_count <= self.chunk_size:
-                final_chunks.append(chunk)
+                yield chunk
             else:
-                # Split large chunks with overlap
-                sub_chunks = self._token_chunk(
-                    chunk.text,
-                    {**metadata, **chunk.metadata},
-                    chunk.start_idx,
-                )
-                final_chunks.extend(sub_chunks)
-
-        return final_chunks
+                # Split large chunks with overlap; semantic chunks already
+                # share the document's metadata dict, so pass it through
+                yield from self._iter_token_chunks(chunk.text, metadata, chunk.start_idx)
 
-    def _semantic_chunk(
+    def _iter_semantic_chunks(
         self,
         text: str,
         metadata: dict[str, Any],
-    ) -> list[Chunk]:
+    ) -> Iterator[Chunk]:
         """Split text on semantic boundaries (paragraphs, sections)."""
-        chunks = []
-
         # Split on double newlines (paragraphs) or markdown headers
-        patterns = [
-            r'\n\n+',  # Double newlines
-            r'\n#{1,6}\s',  # Markdown headers
-            r'\n---+\n',  # Horizontal rules
-        ]
-
-        combined_pattern = '|'.join(f'({p})' for p in patterns)
-        parts = re.split(combined_pattern, text)
+        parts = _SPLIT_RE.split(text)
 
-        # Filter out None and separator matches, recombine
-        clean_parts = []
+        # Filter out None and separator matches, recombine. The split pieces
+        # concatenate back to the text, so summing their lengths gives each
+        # part's offset without searching the text for it
+        clean_parts: list[tuple[int, str]] = []
         current_part = ""
+        current_start = offset = 0
         for part in parts:
-            if part is None:
+            # Unmatched groups come back as None and adjacent boundaries
+            # leave empty strings; neither moves the offset
+            if not part:
                 continue
-            if re.match(r'^\n+$|^---+$', part):
+            if _SEPARATOR_RE.match(part):
                 # This is a separator, add to current part
                 if current_part:
-                    clean_parts.append(current_part)
+                    clean_parts.append((current_start, current_part))
                     current_part = ""
-            elif re.match(r'^#{1,6}\s', part):
+            elif _HEADER_RE.match(part):
                 # This is a header, start new part
                 if current_part:
-                    clean_parts.append(current_part)
+                    clean_parts.append((current_start, current_part))
                 current_part = part
+                current_start = offset
             else:
+                if not current_part:
+                    current_start = offset
                 current_part += part
+            offset += len(part)
 
         if current_part:
-            clean_parts.append(current_part)
+            clean_parts.append((current_start, current_part))
 
-        # Create chunks
-        current_idx = 0
-        for part in clean_parts:
-            part = part.strip()
-            if not part:
+        # Trim each part, shifting its start past the leading whitespace
+        spans = []
+        for start_idx, part in clean_parts:
+            if part.isspace():
                 continue
+            lstripped = part.lstrip()
+            spans.append((start_idx + len(part) - len(lstripped), lstripped.rstrip()))
 
-            token_count = self.count_tokens(part)
-            start_idx = text.find(part, current_idx)
-            end_idx = start_idx + len(part)
-
-            chunks.append(Chunk(
+        # Create chunks, counting every part's tokens in one batched call
+        token_counts = [
+            len(tokens)
+            for tokens in self.tokenizer.encode_ordinary_batch([part for _, part in spans])
+        ]
+        for (start_idx, part), token_count in zip(spans, token_counts):
+            yield Chunk(
                 text=part,
                 metadata=metadata,
                 start_idx=start_idx,
-                end_idx=end_idx,
+                end_idx=start_idx + len(part),
                 token_count=token_count,
-            ))
-
-            current_idx = end_idx
+            )
 
-        return chunks
-
-    def _token_chunk(
+    def _iter_token_chunks(
         self,
         text: str,
         metadata: dict[str, Any],
         base_idx: int = 0,
-    ) -> list[Chunk]:
+    ) -> Iterator[Chunk]:
         """Split text based on token count with overlap."""
-        chunks = []
-        tokens = self.tokenizer.encode(text)
+        tokens = self.tokenizer.encode_ordinary(text)
 
         if len(tokens) <= self.chunk_size:
-            return [Chunk(
+            yield Chunk(
                 text=text,
                 metadata=metadata,
                 start_idx=base_idx,
                 end_idx=base_idx + len(text),
                 token_count=len(tokens),
-            )]
+            )
+            return
+
+        # Character offset of every token, from a single pass over the
+        # tokens, so each window is a slice of the text rather than a decode
+        _, offsets = self.tokenizer.decode_with_offsets(tokens)
+        offsets.append(len(text))
 
         # Split with overlap
-        start = 0
-        while start < len(tokens):
-            end = min(start + self.chunk_size, len(tokens))
-            chunk_tokens = tokens[start:end]
-            chunk_text = self.tokenizer.decode(chunk_tokens)
-
-            # Find the actual position in the original text
-            chunk_start_idx = base_idx + text.find(chunk_text[:50])
-            chunk_end_idx = chunk_start_idx + len(chunk_text)
-
-            chunks.append(Chunk(
-                text=chunk_text,
+        for chunk_index, (start, end) in enumerate(self._windows(len(tokens))):
+            chunk_start, chunk_end = offsets[start], offsets[end]
+
+            yield Chunk(
+                text=text[chunk_start:chunk_end],
                 metadata={
                     **metadata,
-                    "chunk_index": len(chunks),
+                    "chunk_index": chunk_index,
                 },
-                start_idx=chunk_start_idx,
-                end_idx=chunk_end_idx,
-                token_count=len(chunk_tokens),
-            ))
-
-            # Move start with overlap
-            start = end - self.chunk_overlap
-            if start <= 0 and end < len(tokens):
-                start = end  # Prevent infinite loop
-
-        return chunks
+                start_idx=base_idx + chunk_start,
+                end_idx=base_idx + chunk_end,
+                token_count=end - start,
+            )
+
+    def _windows(self, n_tokens: int) -> list[tuple[int, int]]:
+        """Compute the overlapping ``(start, end)`` token windows up front."""
+        # Each window starts chunk_overlap tokens before the previous one
+        # ended, so a new window is needed while that point is short of the end
+        step = self.chunk_size - self.chunk_overlap
+        return [
+            (start, min(start + self.chunk_size, n_tokens))
+            for start in range(0, max(n_tokens - self.chunk_overlap, 1), step)
+        ]
 
     def chunk_with_context(
         self,
@@ -210,11 +228,13 @@ class DocumentChunker:
         if context_prefix:
             context_prefix += "\n"
 
-        # Update chunks with context
-        for chunk in chunks:
-            if context_prefix:
+        # Update chunks with context; the prefix ends in a blank line, so its
+        # tokens never merge with the chunk's and can be counted once
+        if context_prefix:
+            prefix_tokens = self.count_tokens(context_prefix)
+            for chunk in chunks:
                 chunk.text = context_prefix + chunk.text
-                chunk.token_count = self.count_tokens(chunk.text)
+                chunk.token_count += prefix_tokens
 
         return chunks
 
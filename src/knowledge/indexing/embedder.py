@@ -1,8 +1,15 @@
 """Embedding generation and vector storage with Qdrant."""
 
+import asyncio
+import base64
+import hashlib
+from collections import OrderedDict
+from collections.abc import Hashable
 from typing import Any
 from uuid import uuid4
 
+import httpx
+import numpy as np
 import structlog
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import (
@@ -11,20 +18,115 @@ from qdrant_client.models import (
     Filter,
     MatchValue,
     PointStruct,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
     VectorParams,
 )
 
 from src.config import settings
+from src.config_secrets import OPENAI_API_KEY, VOYAGE_API_KEY
 
 logger = structlog.get_logger()
 
+# Texts sent per embedding API call; both providers accept lists well past this
+EMBEDDING_BATCH_SIZE = 128
+
+_TAG_SEPARATORS = str.maketrans(" _", "--")
+
+
+def _normalize_tag(name: str) -> str:
+    """Normalize a tag name (lowercase, hyphenated)."""
+    return name.lower().translate(_TAG_SEPARATORS)
+
+
+def _boost_scores(
+    scores: np.ndarray, keyword_counts: np.ndarray, tag_counts: np.ndarray
+) -> np.ndarray:
+    """Scale scores up by up to 20% for keyword and 30% for tag matches."""
+    boost = np.minimum(keyword_counts * 0.05, 0.2)
+    boost += np.minimum(tag_counts * 0.1, 0.3)
+    boost += 1
+    boost *= scores
+    return boost
+
+
+def _unit(vector: np.ndarray) -> np.ndarray | None:
+    """Return the vector scaled to unit length, or None for a zero vector."""
+    v = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(v)
+    return v / norm if norm else None
+
+
+class _SemanticCache:
+    """Ring buffer of recent query embeddings and the results they returned.
+
+    Vectors are unit-normalized on insert, so one matrix-vector product gives
+    the cosine similarity between a new query and every cached one.
+    """
+
+    def __init__(self, size: int, dimension: int, threshold: float):
+        self._vectors = np.zeros((size, dimension), dtype=np.float32)
+        self._entries: list[tuple[int, Hashable, list[dict[str, Any]]] | None] = [None] * size
+        self._next = 0
+        # Bumped by clear(), so invalidation never touches the vectors
+        self._generation = 0
+        self.threshold = threshold
+
+    def get(self, scope: Hashable, vector: np.ndarray) -> list[dict[str, Any]] | None:
+        query = _unit(vector)
+        if query is None:
+            return None
+        similarities = self._vectors @ query
+        candidates = np.flatnonzero(similarities >= self.threshold)
+        for i in candidates[np.argsort(-similarities[candidates])]:
+            entry = self._entries[i]
+            if entry is not None and entry[0] == self._generation and entry[1] == scope:
+                return entry[2]
+        return None
+
+    def set(self, scope: Hashable, vector: np.ndarray, results: list[dict[str, Any]]) -> None:
+        query = _unit(vector)
+        if query is None:
+            return
+        i = self._next
+        self._vectors[i] = query
+        self._entries[i] = (self._generation, scope, results)
+        self._next = (i + 1) % len(self._entries)
+
+    def clear(self) -> None:
+        self._generation += 1
+
 
 class EmbeddingService:
     """Service for generating embeddings and storing them in Qdrant."""
 
     def __init__(self):
         self._client: AsyncQdrantClient | None = None
+        self._http_client: httpx.AsyncClient | None = None
         self._embedding_client = None
+        # Embeddings by content hash: an in-process LRU in front of Redis, so
+        # repeated and re-indexed texts skip the provider API
+        self._embedding_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        model = (
+            settings.voyage_model
+            if settings.embedding_provider == "voyage"
+            else settings.openai_embedding_model
+        )
+        self._cache_prefix = (
+            f"emb:{settings.embedding_dimension}:{settings.embedding_provider}:{model}:"
+        )
+        # Results of recent searches, reused for near-identical queries until
+        # any write to the vector store
+        self._semantic_cache = (
+            _SemanticCache(
+                settings.semantic_cache_size,
+                settings.embedding_dimension,
+                settings.semantic_cache_threshold,
+            )
+            if settings.semantic_cache_enabled
+            else None
+        )
 
         # Collection names
         self.collections = {
@@ -34,6 +136,9 @@ class EmbeddingService:
             "knowledge": f"{settings.qdrant_collection_prefix}_knowledge",
         }
 
+        # Qdrant REST base URL for the pooled HTTP client
+        self._qdrant_url = f"http://{settings.qdrant_host}:{settings.qdrant_port}"
+
     @property
     def client(self) -> AsyncQdrantClient:
         """Get the Qdrant client."""
@@ -45,50 +150,224 @@ class EmbeddingService:
             )
         return self._client
 
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Get the pooled client for Qdrant's REST API."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                base_url=self._qdrant_url,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=30.0,
+            )
+        return self._http_client
+
+    async def close(self) -> None:
+        """Close the Qdrant clients."""
+        if self._http_client:
+            await self._http_client.aclose()
+            self._http_client = None
+        if self._client:
+            await self._client.close()
+            self._client = None
+
     async def init_collections(self) -> None:
         """Initialize all Qdrant collections."""
+        # One listing call instead of a get_collection probe per collection;
+        # collection_exists needs a newer server than we can assume
+        try:
+            response = await self.client.get_collections()
+        except Exception as e:
+            logger.error("Failed to list collections", error=str(e))
+            return
+        existing = {collection.name for collection in response.collections}
+
+        missing = []
         for collection_name in self.collections.values():
-            try:
-                # Try to get collection info to check if it exists
-                # This works with both old and new Qdrant versions
-                try:
-                    await self.client.get_collection(collection_name)
-                    logger.info("Collection exists", collection=collection_name)
-                    continue  # Collection already exists
-                except Exception:
-                    pass  # Collection doesn't exist, create it
-
-                await self.client.create_collection(
+            if collection_name in existing:
+                logger.info("Collection exists", collection=collection_name)
+            else:
+                missing.append(collection_name)
+
+        # Search runs on int8 copies held in RAM and rescores against the
+        # float32 originals, which can then stay on disk
+        quantization_config = (
+            ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True),
+            )
+            if settings.qdrant_quantization
+            else None
+        )
+        results = await asyncio.gather(
+            *(
+                self.client.create_collection(
                     collection_name=collection_name,
                     vectors_config=VectorParams(
                         size=settings.embedding_dimension,
                         distance=Distance.COSINE,
+                        on_disk=settings.qdrant_quantization,
                     ),
+                    quantization_config=quantization_config,
                 )
+                for collection_name in missing
+            ),
+            return_exceptions=True,
+        )
+        for collection_name, result in zip(missing, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to create collection", collection=collection_name, error=str(result))
+            else:
                 logger.info("Created collection", collection=collection_name)
-            except Exception as e:
-                logger.error("Failed to create collection", collection=collection_name, error=str(e))
 
-    async def generate_embedding(self, text: str) -> list[float]:
-        """Generate embedding for text using configured provider."""
+    async def generate_embedding(self, text: str) -> np.ndarray:
+        """Generate a float32 embedding for text using configured provider."""
+        key = self._cache_key(text)
+        embedding = await self._get_cached_embedding(key)
+        if embedding is not None:
+            return embedding
+
         try:
             if settings.embedding_provider == "voyage":
-                return await self._generate_voyage_embedding(text)
+                embedding = await self._generate_voyage_embedding(text)
             else:
-                return await self._generate_openai_embedding(text)
+                embedding = await self._generate_openai_embedding(text)
         except Exception as e:
             logger.warning("Embedding generation failed, using dummy", error=str(e))
             # Return random unit vector or zero vector
-            return [0.0] * settings.embedding_dimension
+            return np.zeros(settings.embedding_dimension, dtype=np.float32)
+
+        await self._cache_embedding(key, embedding)
+        return embedding
+
+    async def generate_embeddings(self, texts: list[str]) -> list[np.ndarray]:
+        """Generate embeddings for many texts, one API call per batch.
+
+        Cached texts are not sent. Texts from a batch call that fails, or
+        that returns the wrong number of rows, are embedded one by one.
+        """
+        keys = [self._cache_key(text) for text in texts]
+        embeddings = await self._get_cached_embeddings(keys)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        for start in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+            batch = missing[start:start + EMBEDDING_BATCH_SIZE]
+            batch_texts = [texts[i] for i in batch]
+            try:
+                if settings.embedding_provider == "voyage":
+                    generated = await self._generate_voyage_embeddings(batch_texts)
+                else:
+                    generated = await self._generate_openai_embeddings(batch_texts)
+            except Exception as e:
+                logger.warning("Batch embedding failed, embedding texts one by one", error=str(e))
+                continue
+            if len(generated) != len(batch):
+                # Rows cannot be matched to texts, so none of them are used
+                logger.warning(
+                    "Batch embedding returned wrong row count, embedding texts one by one",
+                    requested=len(batch),
+                    returned=len(generated),
+                )
+                continue
+            for i, embedding in zip(batch, generated):
+                embeddings[i] = embedding
+            await self._cache_embeddings(
+                [(keys[i], embedding) for i, embedding in zip(batch, generated)]
+            )
 
-    async def _generate_voyage_embedding(self, text: str) -> list[float]:
+        results: list[np.ndarray] = []
+        for text, embedding in zip(texts, embeddings):
+            if embedding is None:
+                embedding = await self.generate_embedding(text)
+            results.append(embedding)
+        return results
+
+    def _cache_key(self, text: str) -> str:
+        return self._cache_prefix + hashlib.sha256(text.encode()).hexdigest()
+
+    async def _get_cached_embedding(self, key: str) -> np.ndarray | None:
+        return (await self._get_cached_embeddings([key]))[0]
+
+    async def _get_cached_embeddings(self, keys: list[str]) -> list[np.ndarray | None]:
+        """Look keys up in process first, then fetch the rest with one MGET."""
+        embeddings: list[np.ndarray | None] = []
+        for key in keys:
+            embedding = self._embedding_cache.get(key)
+            if embedding is not None:
+                self._embedding_cache.move_to_end(key)
+            embeddings.append(embedding)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        redis = self._redis()
+        if redis is None or not missing:
+            return embeddings
+        try:
+            raws = await redis.mget([keys[i] for i in missing])
+        except Exception as e:
+            logger.warning("Embedding cache read failed", error=str(e))
+            return embeddings
+
+        for i, raw in zip(missing, raws):
+            if raw is None:
+                continue
+            embedding = np.frombuffer(base64.b64decode(raw), dtype=np.float32)
+            self._remember_embedding(keys[i], embedding)
+            embeddings[i] = embedding
+        return embeddings
+
+    async def _cache_embedding(self, key: str, embedding: np.ndarray) -> None:
+        await self._cache_embeddings([(key, embedding)])
+
+    async def _cache_embeddings(self, items: list[tuple[str, np.ndarray]]) -> None:
+        """Remember embeddings in process and write them to Redis in one pipeline."""
+        # Placeholder keys yield zero vectors; never let those outlive the process
+        items = [(key, embedding) for key, embedding in items if embedding.any()]
+        for key, embedding in items:
+            self._remember_embedding(key, embedding)
+
+        redis = self._redis()
+        if redis is None or not items:
+            return
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                for key, embedding in items:
+                    # float32 bytes, base64'd for the client's decode_responses mode
+                    pipe.set(
+                        key,
+                        base64.b64encode(embedding.tobytes()).decode(),
+                        ex=settings.embedding_cache_ttl,
+                    )
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Embedding cache write failed", error=str(e))
+
+    def _invalidate_searches(self) -> None:
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+
+    @staticmethod
+    def _redis():
+        # Imported lazily: src.memory imports this module
+        from src.memory.short_term import redis_client
+
+        return redis_client.client
+
+    def _remember_embedding(self, key: str, embedding: np.ndarray) -> None:
+        self._embedding_cache[key] = embedding
+        self._embedding_cache.move_to_end(key)
+        if len(self._embedding_cache) > settings.embedding_cache_size:
+            self._embedding_cache.popitem(last=False)
+
+    async def _generate_voyage_embedding(self, text: str) -> np.ndarray:
         """Generate embedding using Voyage AI."""
+        return (await self._generate_voyage_embeddings([text]))[0]
+
+    async def _generate_voyage_embeddings(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings for a batch of texts using Voyage AI."""
         import voyageai
         
-        api_key = settings.voyage_api_key.get_secret_value()
+        api_key = VOYAGE_API_KEY
         if not api_key or api_key == "placeholder":
-             # Return dummy vector if no key
-            return [0.0] * settings.embedding_dimension
+             # Return dummy vectors if no key
+            return np.zeros((len(texts), settings.embedding_dimension), dtype=np.float32)
 
         if not self._embedding_client:
             self._embedding_client = voyageai.AsyncClient(
@@ -96,19 +375,23 @@ class EmbeddingService:
             )
 
         result = await self._embedding_client.embed(
-            texts=[text],
+            texts=texts,
             model=settings.voyage_model,
             input_type="document",
         )
-        return result.embeddings[0]
+        return np.asarray(result.embeddings, dtype=np.float32)
 
-    async def _generate_openai_embedding(self, text: str) -> list[float]:
+    async def _generate_openai_embedding(self, text: str) -> np.ndarray:
         """Generate embedding using OpenAI."""
+        return (await self._generate_openai_embeddings([text]))[0]
+
+    async def _generate_openai_embeddings(self, texts: list[str]) -> np.ndarray:
+        """Generate embeddings for a batch of texts using OpenAI."""
         from openai import AsyncOpenAI
         
-        api_key = settings.openai_api_key.get_secret_value()
+        api_key = OPENAI_API_KEY
         if not api_key or api_key == "placeholder":
-            return [0.0] * settings.embedding_dimension
+            return np.zeros((len(texts), settings.embedding_dimension), dtype=np.float32)
 
         if not self._embedding_client:
             self._embedding_client = AsyncOpenAI(
@@ -117,9 +400,9 @@ class EmbeddingService:
 
         response = await self._embedding_client.embeddings.create(
             model=settings.openai_embedding_model,
-            input=text,
+            input=texts,
         )
-        return response.data[0].embedding
+        return np.asarray([item.embedding for item in response.data], dtype=np.float32)
 
     async def store_embedding(
         self,
@@ -156,12 +439,12 @@ class EmbeddingService:
 
             # Add tags as a list field for filtering
             if tags:
-                payload["tags"] = [t.lower().replace(" ", "-").replace("_", "-") for t in tags]
+                payload["tags"] = [_normalize_tag(t) for t in tags]
 
             # Create point
             point = PointStruct(
                 id=point_id,
-                vector=embedding,
+                vector=embedding.tolist(),
                 payload=payload,
             )
 
@@ -170,6 +453,7 @@ class EmbeddingService:
                 collection_name=collection_name,
                 points=[point],
             )
+            self._invalidate_searches()
 
             logger.debug(
                 "Stored embedding",
@@ -199,61 +483,109 @@ class EmbeddingService:
             # Generate query embedding
             query_embedding = await self.generate_embedding(query)
 
-            # Build filter if provided
-            qdrant_filter = None
-            if filters:
-                conditions = []
-                for key, value in filters.items():
-                    conditions.append(
-                        FieldCondition(
-                            key=key,
-                            match=MatchValue(value=value),
-                        )
-                    )
-                qdrant_filter = Filter(must=conditions)
+            # A near-identical earlier query with the same scope answers this one
+            scope = (collection_name, limit, score_threshold, repr(sorted((filters or {}).items())))
+            if self._semantic_cache is not None:
+                cached = self._semantic_cache.get(scope, query_embedding)
+                if cached is not None:
+                    # Callers such as hybrid_search rescore hits in place
+                    return [dict(hit) for hit in cached]
 
             # Use HTTP API directly for compatibility with older Qdrant versions
-            import httpx
-
-            search_body: dict[str, Any] = {
-                "vector": query_embedding,
-                "limit": limit,
-                "with_payload": True,
-            }
-            if score_threshold > 0:
-                search_body["score_threshold"] = score_threshold
-            if qdrant_filter:
-                search_body["filter"] = {
-                    "must": [
-                        {"key": cond.key, "match": {"value": cond.match.value}}
-                        for cond in qdrant_filter.must
-                    ]
-                }
-
-            async with httpx.AsyncClient() as http_client:
-                response = await http_client.post(
-                    f"http://{settings.qdrant_host}:{settings.qdrant_port}/collections/{collection_name}/points/search",
-                    json=search_body,
-                    timeout=30.0,
-                )
-                data = response.json()
+            response = await self.http_client.post(
+                f"/collections/{collection_name}/points/search",
+                json=self._search_body(query_embedding, limit, filters, score_threshold),
+            )
+            data = response.json()
 
             if "result" not in data:
                 logger.warning("Search returned no results", collection=collection, data=data)
                 return []
 
-            return [
-                {
-                    "score": hit.get("score", 0),
-                    "payload": hit.get("payload", {}),
-                    "id": hit.get("id"),
-                }
-                for hit in data["result"]
-            ]
+            results = self._hits(data["result"])
+            if self._semantic_cache is not None:
+                self._semantic_cache.set(scope, query_embedding, [dict(hit) for hit in results])
+            return results
         except Exception as e:
             logger.warning("Search failed", collection=collection, error=str(e))
             return []
 
+    async def batch_search(
+        self,
+        collection: str,
+        queries: list[str],
+        limit: int = 10,
+        filters: list[dict[str, Any] | None] | None = None,
+        score_threshold: float = 0.0,
+    ) -> list[list[dict[str, Any]]]:
+        """Search a collection for several queries in one request.
+
+        Queries are embedded together and sent to Qdrant's batch search
+        endpoint. ``filters``, when given, holds one filter per query.
+        """
+        collection_name = self.collections.get(collection)
+        if not collection_name:
+            raise ValueError(f"Unknown collection: {collection}")
+        if not queries:
+            return []
+        filters = filters or [None] * len(queries)
+
+        try:
+            embeddings = await self.generate_embeddings(queries)
+            response = await self.http_client.post(
+                f"/collections/{collection_name}/points/search/batch",
+                json={
+                    "searches": [
+                        self._search_body(embedding, limit, query_filters, score_threshold)
+                        for embedding, query_filters in zip(embeddings, filters)
+                    ]
+                },
+            )
+            data = response.json()
+
+            if "result" not in data:
+                logger.warning("Batch search returned no results", collection=collection, data=data)
+                return [[] for _ in queries]
+
+            return [self._hits(result) for result in data["result"]]
+        except Exception as e:
+            logger.warning("Batch search failed", collection=collection, error=str(e))
+            return [[] for _ in queries]
+
+    @staticmethod
+    def _search_body(
+        query_embedding: np.ndarray,
+        limit: int,
+        filters: dict[str, Any] | None,
+        score_threshold: float,
+    ) -> dict[str, Any]:
+        search_body: dict[str, Any] = {
+            "vector": query_embedding.tolist(),
+            "limit": limit,
+            "with_payload": True,
+        }
+        if score_threshold > 0:
+            search_body["score_threshold"] = score_threshold
+        if filters:
+            search_body["filter"] = {
+                "must": [
+                    {"key": key, "match": {"value": value}}
+                    for key, value in filters.items()
+                ]
+            }
+        return search_body
+
+    @staticmethod
+    def _hits(result: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        return [
+            {
+                "score": hit.get("score", 0),
+                "payload": hit.get("payload", {}),
+                "id": hit.get("id"),
+            }
+            for hit in result
+        ]
+
     async def hybrid_search(
         self,
         collection: str,
@@ -280,39 +612,44 @@ class EmbeddingService:
             filters=search_filters,
         )
 
-        if not keywords and not tags:
+        if not vector_results or (not keywords and not tags):
             return vector_results[:limit]
 
         # Process results
         keywords_lower = [k.lower() for k in keywords] if keywords else []
-        tags_normalized = [t.lower().replace(" ", "-").replace("_", "-") for t in tags] if tags else []
-
-        for result in vector_results:
-            payload = result.get("payload", {})
-            text = payload.get("text", "").lower()
-            result_tags = payload.get("tags", [])
-
-            # Keyword boost (up to 20%)
-            if keywords_lower:
-                keyword_matches = sum(1 for k in keywords_lower if k in text)
-                keyword_boost = min(0.2, keyword_matches * 0.05)
-            else:
-                keyword_boost = 0
-
-            # Tag boost (up to 30% for matching tags)
-            if tags_normalized:
-                tag_matches = sum(1 for t in tags_normalized if t in result_tags)
-                tag_boost = min(0.3, tag_matches * 0.1)
-            else:
-                tag_boost = 0
+        tags_normalized = frozenset(_normalize_tag(t) for t in tags) if tags else frozenset()
+
+        n = len(vector_results)
+        payloads = [result.get("payload", {}) for result in vector_results]
+        scores = np.fromiter((result["score"] for result in vector_results), dtype=np.float64, count=n)
+
+        # Keyword boost (up to 20%): one vectorized substring scan per keyword
+        keyword_counts = np.zeros(n, dtype=np.int32)
+        if keywords_lower:
+            texts = np.array([payload.get("text", "").lower() for payload in payloads], dtype=str)
+            for k in keywords_lower:
+                keyword_counts += np.char.find(texts, k) >= 0
+
+        # Tag boost (up to 30% for matching tags)
+        tag_counts = np.zeros(n, dtype=np.int32)
+        if tags_normalized:
+            tag_counts = np.fromiter(
+                (len(tags_normalized.intersection(payload.get("tags", ()))) for payload in payloads),
+                dtype=np.int32,
+                count=n,
+            )
 
-            result["score"] = result["score"] * (1 + keyword_boost + tag_boost)
-            result["keyword_matches"] = keyword_matches if keywords_lower else 0
-            result["tag_matches"] = tag_matches if tags_normalized else 0
+        scores = _boost_scores(scores, keyword_counts, tag_counts)
 
         # Re-sort by boosted score
-        vector_results.sort(key=lambda x: x["score"], reverse=True)
-        return vector_results[:limit]
+        boosted = []
+        for i in np.argsort(-scores, kind="stable")[:limit]:
+            result = vector_results[i]
+            result["score"] = float(scores[i])
+            result["keyword_matches"] = int(keyword_counts[i])
+            result["tag_matches"] = int(tag_counts[i])
+            boosted.append(result)
+        return boosted
 
     async def search_by_tags(
         self,
@@ -326,14 +663,12 @@ class EmbeddingService:
 
         This allows bypassing hierarchy-based navigation entirely.
         """
-        tags_normalized = [t.lower().replace(" ", "-").replace("_", "-") for t in tags]
+        tags_normalized = [_normalize_tag(t) for t in tags]
         collection_name = self.collections.get(collection)
         if not collection_name:
             raise ValueError(f"Unknown collection: {collection}")
 
         try:
-            import httpx
-
             # Build the search body
             search_body: dict[str, Any] = {
                 "limit": limit * 2 if query else limit,
@@ -343,7 +678,7 @@ class EmbeddingService:
             # If we have a query, do vector search with tag filter
             if query:
                 query_embedding = await self.generate_embedding(query)
-                search_body["vector"] = query_embedding
+                search_body["vector"] = query_embedding.tolist()
 
             # Build tag filter
             if require_all_tags:
@@ -359,17 +694,16 @@ class EmbeddingService:
                     "must": [{"key": "tags", "match": {"any": tags_normalized}}]
                 }
 
-            async with httpx.AsyncClient() as http_client:
-                if query:
-                    # Vector search with filter
-                    endpoint = f"http://{settings.qdrant_host}:{settings.qdrant_port}/collections/{collection_name}/points/search"
-                else:
-                    # Scroll with filter (no vector)
-                    endpoint = f"http://{settings.qdrant_host}:{settings.qdrant_port}/collections/{collection_name}/points/scroll"
-                    search_body["limit"] = limit
+            if query:
+                # Vector search with filter
+                endpoint = f"/collections/{collection_name}/points/search"
+            else:
+                # Scroll with filter (no vector)
+                endpoint = f"/collections/{collection_name}/points/scroll"
+                search_body["limit"] = limit
 
-                response = await http_client.post(endpoint, json=search_body, timeout=30.0)
-                data = response.json()
+            response = await self.http_client.post(endpoint, json=search_body)
+            data = response.json()
 
             results_key = "result" if query else "result"
             if results_key not in data:
@@ -402,6 +736,7 @@ class EmbeddingService:
             collection_name=collection_name,
             points_selector=[point_id],
         )
+        self._invalidate_searches()
         return True
 
     async def delete_by_filter(
@@ -439,6 +774,7 @@ class EmbeddingService:
             collection_name=collection_name,
             points_selector=qdrant_filter,
         )
+        self._invalidate_searches()
 
         return count_before.count
 
@@ -453,33 +789,54 @@ class EmbeddingService:
         - collection: Which collection to store in ('knowledge', 'org_memory', etc.)
         - Additional metadata fields
 
+        Documents are grouped by collection; each group is embedded in
+        batched API calls and written with a single upsert.
+
         Returns list of stored point IDs.
         """
-        stored_ids = []
-
+        by_collection: dict[str, list[dict[str, Any]]] = {}
         for doc in documents:
-            text = doc.get("text", "")
+            if not doc.get("text", ""):
+                continue
             collection = doc.get("collection", "knowledge")
-
-            if not text:
+            if collection not in self.collections:
+                logger.warning(
+                    "Failed to embed document",
+                    title=doc.get("title", "untitled"),
+                    error=f"Unknown collection: {collection}",
+                )
                 continue
-
-            # Build metadata (exclude text and collection)
-            metadata = {k: v for k, v in doc.items() if k not in ("text", "collection")}
+            by_collection.setdefault(collection, []).append(doc)
+
+        stored_ids: list[str] = []
+        for collection, docs in by_collection.items():
+            texts = [doc["text"] for doc in docs]
+            embeddings = await self.generate_embeddings(texts)
+            point_ids = [str(uuid4()) for _ in docs]
+
+            # Payload is the text plus metadata (everything but text and collection)
+            points = [
+                PointStruct(
+                    id=point_id,
+                    vector=embedding.tolist(),
+                    payload={
+                        "text": doc["text"],
+                        **{k: v for k, v in doc.items() if k not in ("text", "collection")},
+                    },
+                )
+                for point_id, doc, embedding in zip(point_ids, docs, embeddings)
+            ]
 
             try:
-                point_id = await self.store_embedding(
-                    collection=collection,
-                    text=text,
-                    metadata=metadata,
+                await self.client.upsert(
+                    collection_name=self.collections[collection],
+                    points=points,
                 )
-                stored_ids.append(point_id)
             except Exception as e:
-                logger.warning(
-                    "Failed to embed document",
-                    title=doc.get("title", "untitled"),
-                    error=str(e),
-                )
+                logger.warning("Failed to store embeddings", collection=collection, error=str(e))
+                continue
+            self._invalidate_searches()
+            stored_ids.extend(point_ids)
 
         return stored_ids
 
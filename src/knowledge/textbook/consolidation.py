@@ -161,7 +161,7 @@ class ConsolidationService:
         ORDER BY c.created_at
         """
 
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.read_session() as session:
             result = await session.run(
                 query,
                 topic_id=topic_id,
@@ -169,7 +169,7 @@ class ConsolidationService:
                 end_date=end_date.isoformat(),
             )
             records = await result.data()
-            return [dict(r["c"]) for r in records]
+            return [r["c"] for r in records]
 
     async def _get_summaries_in_period(
         self,
@@ -188,7 +188,7 @@ class ConsolidationService:
         ORDER BY s.period_end
         """
 
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.read_session() as session:
             result = await session.run(
                 query,
                 topic_id=topic_id,
@@ -197,7 +197,7 @@ class ConsolidationService:
                 end_date=end_date.isoformat(),
             )
             records = await result.data()
-            return [dict(r["s"]) for r in records]
+            return [r["s"] for r in records]
 
     async def _generate_summary_with_llm(
         self,
@@ -326,7 +326,7 @@ Monthly Summary:"""
         RETURN t.id as topic_id, t.title as title
         """
 
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.read_session() as session:
             result = await session.run(query)
             topics = await result.data()
 
@@ -371,7 +371,7 @@ Monthly Summary:"""
         RETURN count(e) as updated_count
         """
 
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.write_session() as session:
             result = await session.run(query)
             record = await result.single()
             count = record["updated_count"] if record else 0
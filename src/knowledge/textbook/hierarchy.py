@@ -9,6 +9,7 @@ Department (e.g., "Engineering")
                     └── Summary (weekly/monthly consolidations)
 """
 
+from collections.abc import Mapping, Sequence
 from datetime import datetime
 from typing import Any
 from uuid import uuid4
@@ -56,14 +57,18 @@ class HierarchyManager:
             "department_id": department_id,
             "lead_id": lead_id,
         }
-        node = await neo4j_client.create_node(NodeLabels.SUB_DEPARTMENT, properties)
+        async with neo4j_client.write_session() as session:
+            node = await neo4j_client.create_node(
+                NodeLabels.SUB_DEPARTMENT, properties, session=session
+            )
 
-        # Create relationship
-        await neo4j_client.create_relationship(
-            department_id,
-            node["id"],
-            RelationshipTypes.HAS_SUBDEPARTMENT,
-        )
+            # Create relationship
+            await neo4j_client.create_relationship(
+                department_id,
+                node["id"],
+                RelationshipTypes.HAS_SUBDEPARTMENT,
+                session=session,
+            )
 
         logger.info(
             "Created subdepartment",
@@ -88,14 +93,16 @@ class HierarchyManager:
             "sub_department_id": subdepartment_id,
             "importance": importance,
         }
-        node = await neo4j_client.create_node(NodeLabels.TOPIC, properties)
+        async with neo4j_client.write_session() as session:
+            node = await neo4j_client.create_node(NodeLabels.TOPIC, properties, session=session)
 
-        # Create relationship
-        await neo4j_client.create_relationship(
-            subdepartment_id,
-            node["id"],
-            RelationshipTypes.HAS_TOPIC,
-        )
+            # Create relationship
+            await neo4j_client.create_relationship(
+                subdepartment_id,
+                node["id"],
+                RelationshipTypes.HAS_TOPIC,
+                session=session,
+            )
 
         logger.info(
             "Created topic",
@@ -146,32 +153,37 @@ class HierarchyManager:
             "topic_id": topic_id,
             "metadata": metadata or {},
         }
-        node = await neo4j_client.create_node(NodeLabels.CONTEXT, properties)
-
-        # Create primary relationship
-        await neo4j_client.create_relationship(
-            topic_id,
-            node["id"],
-            RelationshipTypes.HAS_CONTEXT,
-        )
+        # Every write below shares one session and pooled connection
+        async with neo4j_client.write_session() as session:
+            node = await neo4j_client.create_node(NodeLabels.CONTEXT, properties, session=session)
 
-        # Add to additional topics (many-to-many)
-        if additional_topic_ids:
-            await neo4j_client.add_context_to_multiple_topics(
+            # Create primary relationship
+            await neo4j_client.create_relationship(
+                topic_id,
                 node["id"],
-                [topic_id] + additional_topic_ids,
+                RelationshipTypes.HAS_CONTEXT,
+                session=session,
             )
 
-        # Add tags for cross-cutting concerns
-        if tags:
-            await neo4j_client.add_tags_to_node(node["id"], tags)
-
-        # Update topic's last_updated_context
-        await neo4j_client.update_node(
-            topic_id,
-            {"last_updated_context": datetime.utcnow().isoformat()},
-            NodeLabels.TOPIC,
-        )
+            # Add to additional topics (many-to-many)
+            if additional_topic_ids:
+                await neo4j_client.add_context_to_multiple_topics(
+                    node["id"],
+                    [topic_id] + additional_topic_ids,
+                    session=session,
+                )
+
+            # Add tags for cross-cutting concerns
+            if tags:
+                await neo4j_client.add_tags_to_node(node["id"], tags, session=session)
+
+            # Update topic's last_updated_context
+            await neo4j_client.update_node(
+                topic_id,
+                {"last_updated_context": datetime.utcnow().isoformat()},
+                NodeLabels.TOPIC,
+                session=session,
+            )
 
         logger.info(
             "Added context",
@@ -194,17 +206,18 @@ class HierarchyManager:
 
     async def _get_full_hierarchy(self) -> dict[str, Any]:
         """Get the complete textbook hierarchy."""
+        # Context counts come from relationship degrees, so contexts are
+        # never expanded into rows
         query = """
         MATCH (d:Department)
         OPTIONAL MATCH (d)-[:HAS_SUBDEPARTMENT]->(sd:SubDepartment)
         OPTIONAL MATCH (sd)-[:HAS_TOPIC]->(t:Topic)
-        OPTIONAL MATCH (t)-[:HAS_CONTEXT]->(c:Context)
-        WITH d, sd, t, count(c) as context_count
-        RETURN d, sd, t, context_count
+        RETURN d, sd, t,
+               CASE WHEN t IS NULL THEN 0 ELSE COUNT { (t)-[:HAS_CONTEXT]->() } END as context_count
         ORDER BY d.title, sd.title, t.title
         """
 
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.read_session() as session:
             result = await session.run(query)
             records = await result.data()
 
@@ -272,13 +285,12 @@ class HierarchyManager:
         MATCH (d:Department {id: $department_id})
         OPTIONAL MATCH (d)-[:HAS_SUBDEPARTMENT]->(sd:SubDepartment)
         OPTIONAL MATCH (sd)-[:HAS_TOPIC]->(t:Topic)
-        OPTIONAL MATCH (t)-[:HAS_CONTEXT]->(c:Context)
-        WITH d, sd, t, count(c) as context_count
-        RETURN d, sd, t, context_count
+        RETURN d, sd, t,
+               CASE WHEN t IS NULL THEN 0 ELSE COUNT { (t)-[:HAS_CONTEXT]->() } END as context_count
         ORDER BY sd.title, t.title
         """
 
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.read_session() as session:
             result = await session.run(query, department_id=department_id)
             records = await result.data()
 
@@ -323,7 +335,7 @@ class HierarchyManager:
         department["subdepartments"] = list(department["subdepartments"].values())
         return department
 
-    async def get_path_to_root(self, node_id: str) -> list[dict[str, Any]]:
+    async def get_path_to_root(self, node_id: str) -> Sequence[Mapping[str, Any]]:
         """Get the hierarchy path from a node to its root department."""
         return await neo4j_client.get_path_to_root(node_id)
 
@@ -339,9 +351,10 @@ class HierarchyManager:
         """
         result = {}
 
-        # Find or create department
+        # Find or create department. Lookups here use write sessions so
+        # they hit the leader and never miss (and duplicate) a fresh node.
         query = "MATCH (d:Department {title: $name}) RETURN d"
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.write_session() as session:
             dept_result = await session.run(query, name=department_name)
             dept_record = await dept_result.single()
 
@@ -359,7 +372,7 @@ class HierarchyManager:
         MATCH (d:Department {id: $dept_id})-[:HAS_SUBDEPARTMENT]->(sd:SubDepartment {title: $name})
         RETURN sd
         """
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.write_session() as session:
             subdept_result = await session.run(
                 query,
                 dept_id=result["department_id"],
@@ -384,7 +397,7 @@ class HierarchyManager:
         MATCH (sd:SubDepartment {id: $subdept_id})-[:HAS_TOPIC]->(t:Topic {title: $name})
         RETURN t
         """
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.write_session() as session:
             topic_result = await session.run(
                 query,
                 subdept_id=result["subdepartment_id"],
@@ -424,10 +437,10 @@ class HierarchyManager:
             """
             params = {"topic_id": topic_id, "limit": limit}
 
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.read_session() as session:
             result = await session.run(query, **params)
             records = await result.data()
-            return [dict(r["c"]) for r in records]
+            return [r["c"] for r in records]
 
     async def search_topics(
         self,
@@ -439,28 +452,28 @@ class HierarchyManager:
         if department_id:
             query = """
             MATCH (d:Department {id: $department_id})-[:HAS_SUBDEPARTMENT]->(sd)-[:HAS_TOPIC]->(t:Topic)
-            WHERE toLower(t.title) CONTAINS toLower($query_text)
-               OR toLower(coalesce(t.description, '')) CONTAINS toLower($query_text)
+            WHERE toLower(t.title) CONTAINS $query_text
+               OR toLower(coalesce(t.description, '')) CONTAINS $query_text
             RETURN t, sd.title as subdepartment
             LIMIT $limit
             """
-            params = {"department_id": department_id, "query_text": query_text, "limit": limit}
+            params = {"department_id": department_id, "query_text": query_text.lower(), "limit": limit}
         else:
             query = """
             MATCH (t:Topic)
-            WHERE toLower(t.title) CONTAINS toLower($query_text)
-               OR toLower(coalesce(t.description, '')) CONTAINS toLower($query_text)
+            WHERE toLower(t.title) CONTAINS $query_text
+               OR toLower(coalesce(t.description, '')) CONTAINS $query_text
             OPTIONAL MATCH (sd:SubDepartment)-[:HAS_TOPIC]->(t)
             RETURN t, sd.title as subdepartment
             LIMIT $limit
             """
-            params = {"query_text": query_text, "limit": limit}
+            params = {"query_text": query_text.lower(), "limit": limit}
 
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.read_session() as session:
             result = await session.run(query, **params)
             records = await result.data()
             return [
-                {**dict(r["t"]), "subdepartment": r.get("subdepartment")}
+                {**r["t"], "subdepartment": r.get("subdepartment")}
                 for r in records
             ]
 
@@ -64,6 +64,10 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("Failed to connect to Redis", error=str(e))
 
+    # Initialize shared outbound HTTP client
+    from src.http_client import http_client
+    await http_client.connect()
+
     # Initialize MCP connectors
     try:
         from src.mcp.registry import mcp_registry
@@ -88,6 +92,20 @@ async def lifespan(app: FastAPI):
         await redis_client.close()
     except Exception:
         pass
+    try:
+        await http_client.close()
+    except Exception:
+        pass
+    try:
+        from src.knowledge.indexing.embedder import embedder
+        await embedder.close()
+    except Exception:
+        pass
+    try:
+        from src.voice.realtime_zoom import playwright_zoom_bot
+        await playwright_zoom_bot.close()
+    except Exception:
+        pass
 
 
 app = FastAPI(
@@ -164,3 +182,19 @@ async def readiness_check():
         "status": "ready" if all_ok else "degraded",
         "checks": checks,
     }
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # C-accelerated HTTP parser, and uvloop wherever it is installed (it is
+    # not on Windows); access logs only in debug
+    uvicorn.run(
+        "src.main:app",
+        host=settings.api_host,
+        port=settings.api_port,
+        workers=settings.api_workers,
+        loop="auto",
+        http="httptools",
+        access_log=settings.debug,
+    )
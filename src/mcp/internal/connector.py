@@ -30,8 +30,7 @@ class InternalAnalyticsConnector(BaseMCPConnector):
 
     async def connect(self) -> None:
         """Connect to Neo4j."""
-        if not neo4j_client._driver:
-            await neo4j_client.connect()
+        await neo4j_client.ensure_connected()
         self._connected = True
         logger.info("Internal analytics connector connected to Neo4j")
 
@@ -50,10 +49,13 @@ class InternalAnalyticsConnector(BaseMCPConnector):
     async def _run_query(self, query: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """Run a Cypher query and return results as list of dicts."""
         params = params or {}
-        async with neo4j_client.driver.session() as session:
-            result = await session.run(query, **params)
-            records = await result.data()
-            return records
+
+        async def work(tx) -> list[dict[str, Any]]:
+            result = await tx.run(query, params)
+            return await result.data()
+
+        async with neo4j_client.read_session() as session:
+            return await session.execute_read(work)
 
     @property
     def is_connected(self) -> bool:
@@ -164,13 +166,13 @@ class InternalAnalyticsConnector(BaseMCPConnector):
         if team_name:
             query = """
             MATCH (tm:TeamMetrics)
-            WHERE toLower(tm.team) CONTAINS toLower($team_name)
+            WHERE toLower(tm.team) CONTAINS $team_name
             RETURN tm.team as team, tm.sprint as sprint, tm.velocity as velocity,
                    tm.completed_points as completed_points, tm.committed_points as committed_points
             ORDER BY tm.sprint DESC
             LIMIT $limit
             """
-            params = {"team_name": team_name, "limit": num_sprints}
+            params = {"team_name": team_name.lower(), "limit": num_sprints}
         else:
             query = """
             MATCH (tm:TeamMetrics)
@@ -235,7 +237,7 @@ class InternalAnalyticsConnector(BaseMCPConnector):
         if team_name:
             query = """
             MATCH (tm:TeamMetrics)
-            WHERE toLower(tm.team) CONTAINS toLower($team_name)
+            WHERE toLower(tm.team) CONTAINS $team_name
             RETURN tm.team as team, tm.sprint as sprint, tm.velocity as velocity,
                    tm.completed_points as completed_points, tm.committed_points as committed_points,
                    tm.bugs_fixed as bugs_fixed, tm.prs_merged as prs_merged,
@@ -244,7 +246,7 @@ class InternalAnalyticsConnector(BaseMCPConnector):
                    tm.incident_count as incident_count
             ORDER BY tm.sprint DESC
             """
-            params = {"team_name": team_name}
+            params = {"team_name": team_name.lower()}
         else:
             query = """
             MATCH (tm:TeamMetrics)
@@ -316,13 +318,13 @@ class InternalAnalyticsConnector(BaseMCPConnector):
         if channel:
             query = """
             MATCH (c:SlackChannel)-[:CONTAINS_MESSAGE]->(m:SlackMessage)
-            WHERE toLower(c.name) CONTAINS toLower($channel)
+            WHERE toLower(c.name) CONTAINS $channel
             RETURN c.name as channel, m.author as author, m.content as content,
                    m.timestamp as timestamp, m.is_incident as is_incident
             ORDER BY m.timestamp DESC
             LIMIT 20
             """
-            params = {"channel": channel}
+            params = {"channel": channel.lower()}
         else:
             query = """
             MATCH (c:SlackChannel)-[:CONTAINS_MESSAGE]->(m:SlackMessage)
@@ -14,6 +14,8 @@ engine = create_async_engine(
     settings.database_url,
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
+    pool_pre_ping=settings.database_pool_pre_ping,
+    pool_recycle=settings.database_pool_recycle,
     echo=settings.debug,
     connect_args={"statement_cache_size": 0},
 )
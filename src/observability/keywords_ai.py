@@ -3,14 +3,40 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
+from types import MappingProxyType
 
-import httpx
 import structlog
 
 from src.config import settings
+from src.http_client import http_client
 
 logger = structlog.get_logger()
 
+# Gateway cache parameters, built once and sent with every chat completion.
+# Empty when caching is disabled so call sites never branch on the setting.
+# Read-only, so nothing that touches a request's extra_body can change them
+# for the whole process; send them through keywords_ai_cache_body().
+KEYWORDS_AI_CACHE_PARAMS: Mapping[str, object] = MappingProxyType(
+    {
+        "cache_enabled": True,
+        "cache_ttl": settings.keywords_ai_cache_ttl,
+        "cache_options": MappingProxyType({
+            "cache_by_customer": settings.keywords_ai_cache_by_customer,
+        }),
+    }
+    if settings.keywords_ai_cache_enabled
+    else {}
+)
+
+
+def keywords_ai_cache_body() -> dict[str, object]:
+    """Return the gateway cache parameters as a fresh, JSON-serializable dict."""
+    return {
+        key: dict(value) if isinstance(value, Mapping) else value
+        for key, value in KEYWORDS_AI_CACHE_PARAMS.items()
+    }
+
 
 def _build_request_log_url() -> str:
     base_url = settings.keywords_ai_base_url.rstrip("/")
@@ -46,17 +72,18 @@ async def log_keywords_ai_chat(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.post(
-                _build_request_log_url(),
-                headers=headers,
-                json=payload,
+        client = http_client.client
+        response = await client.post(
+            _build_request_log_url(),
+            headers=headers,
+            json=payload,
+            timeout=5.0,
+        )
+        if response.status_code >= 300:
+            logger.warning(
+                "Keywords AI log request failed",
+                status_code=response.status_code,
+                response_text=response.text[:500],
             )
-            if response.status_code >= 300:
-                logger.warning(
-                    "Keywords AI log request failed",
-                    status_code=response.status_code,
-                    response_text=response.text[:500],
-                )
     except Exception as exc:
         logger.warning("Keywords AI log request error", error=str(exc))
\ No newline at end of file
@@ -17,6 +17,7 @@ from jose import jwt, JWTError
 import structlog
 
 from src.config import settings
+from src.config_secrets import JWT_SECRET
 from src.rbac.models import UserContext, ResourceType, AccessLevel
 from src.rbac.guards import rbac_guard
 from src.security.context import get_user_context
@@ -48,7 +49,7 @@ async def get_current_user(
         # Decode JWT token
         payload = jwt.decode(
             credentials.credentials,
-            settings.jwt_secret_key,
+            JWT_SECRET,
             algorithms=[settings.jwt_algorithm],
         )
 
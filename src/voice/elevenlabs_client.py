@@ -14,12 +14,12 @@ import json
 from typing import Any, AsyncGenerator, Callable
 from uuid import uuid4
 
-import httpx
 import structlog
 import websockets
 from websockets.exceptions import ConnectionClosed
 
 from src.config import settings
+from src.http_client import http_client
 
 logger = structlog.get_logger()
 
@@ -51,15 +51,15 @@ class ElevenLabsClient:
 
     async def get_voices(self) -> list[dict[str, Any]]:
         """Get available voices."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/voices",
-                headers=self.headers,
-            )
-            if response.status_code == 200:
-                return response.json().get("voices", [])
-            logger.error("Failed to get voices", status=response.status_code)
-            return []
+        client = http_client.client
+        response = await client.get(
+            f"{self.base_url}/voices",
+            headers=self.headers,
+        )
+        if response.status_code == 200:
+            return response.json().get("voices", [])
+        logger.error("Failed to get voices", status=response.status_code)
+        return []
 
     async def synthesize(
         self,
@@ -91,32 +91,32 @@ class ElevenLabsClient:
             logger.warning("ElevenLabs API key not configured")
             return b""
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.base_url}/text-to-speech/{voice}",
-                headers=self.headers,
-                json={
-                    "text": text,
-                    "model_id": model_id,
-                    "voice_settings": {
-                        "stability": stability,
-                        "similarity_boost": similarity_boost,
-                        "style": style,
-                        "use_speaker_boost": use_speaker_boost,
-                    },
+        client = http_client.client
+        response = await client.post(
+            f"{self.base_url}/text-to-speech/{voice}",
+            headers=self.headers,
+            json={
+                "text": text,
+                "model_id": model_id,
+                "voice_settings": {
+                    "stability": stability,
+                    "similarity_boost": similarity_boost,
+                    "style": style,
+                    "use_speaker_boost": use_speaker_boost,
                 },
-            )
+            },
+        )
 
-            if response.status_code == 200:
-                logger.info("Audio synthesized", text_length=len(text), voice=voice)
-                return response.content
-
-            logger.error(
-                "ElevenLabs synthesis error",
-                status=response.status_code,
-                response=response.text,
-            )
-            return b""
+        if response.status_code == 200:
+            logger.info("Audio synthesized", text_length=len(text), voice=voice)
+            return response.content
+
+        logger.error(
+            "ElevenLabs synthesis error",
+            status=response.status_code,
+            response=response.text,
+        )
+        return b""
 
     async def synthesize_stream(
         self,
@@ -134,26 +134,27 @@ class ElevenLabsClient:
         if not self.api_key:
             return
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            async with client.stream(
-                "POST",
-                f"{self.base_url}/text-to-speech/{voice}/stream",
-                headers=self.headers,
-                json={
-                    "text": text,
-                    "model_id": model_id,
-                    "voice_settings": {
-                        "stability": 0.5,
-                        "similarity_boost": 0.75,
-                    },
-                    "optimize_streaming_latency": 3,  # Maximum optimization
+        client = http_client.client
+        async with client.stream(
+            "POST",
+            f"{self.base_url}/text-to-speech/{voice}/stream",
+            headers=self.headers,
+            json={
+                "text": text,
+                "model_id": model_id,
+                "voice_settings": {
+                    "stability": 0.5,
+                    "similarity_boost": 0.75,
                 },
-            ) as response:
-                if response.status_code == 200:
-                    async for chunk in response.aiter_bytes(chunk_size=chunk_size):
-                        yield chunk
-                else:
-                    logger.error("Stream synthesis failed", status=response.status_code)
+                "optimize_streaming_latency": 3,  # Maximum optimization
+            },
+            timeout=60.0,
+        ) as response:
+            if response.status_code == 200:
+                async for chunk in response.aiter_bytes(chunk_size=chunk_size):
+                    yield chunk
+            else:
+                logger.error("Stream synthesis failed", status=response.status_code)
 
     async def input_streaming(
         self,
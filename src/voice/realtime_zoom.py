@@ -21,18 +21,77 @@ import tempfile
 import wave
 from datetime import datetime
 from pathlib import Path
-from typing import Any, AsyncGenerator, Callable
+from typing import Any, AsyncGenerator, Awaitable, Callable
 from uuid import uuid4
 
-import httpx
+import orjson
 import structlog
 
 from src.config import settings
+from src.http_client import http_client
 from src.voice.agent import voice_onboarding_agent
 from src.voice.elevenlabs_client import elevenlabs_client
 
 logger = structlog.get_logger()
 
+# Speech requests queued for the same browser bot are drained by one worker,
+# up to this many at a time, and streamed into the page one after another.
+SPEECH_BATCH_SIZE = 8
+
+# Seconds between memory trims of an idle in-meeting page
+BOT_MEMORY_TRIM_INTERVAL = 60
+
+# Chromium flags for the shared browser that hosts every bot context
+_BROWSER_ARGS = [
+    "--use-fake-ui-for-media-stream",
+    "--use-fake-device-for-media-stream",
+    "--auto-accept-camera-and-microphone-capture",
+    "--disable-web-security",
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+]
+
+# Bytes of streamed TTS audio pushed to the page per browser call
+SPEECH_STREAM_CHUNK = 16 * 1024
+
+# Per-page MediaSource player fed with base64 MP3 chunks as they arrive.
+# Installed as a context init script, so every top-level document a bot loads
+# has it before the first chunk; playback starts with the first appended chunk
+# and resumes automatically whenever more audio is appended after a pause.
+_AUDIO_STREAM_JS = """
+() => {
+    if (window.top !== window || window.__botAudioStream) return;
+    const mediaSource = new MediaSource();
+    const audio = new Audio(URL.createObjectURL(mediaSource));
+    audio.volume = 1.0;
+    const pending = [];
+    let buffer = null;
+    const flush = () => {
+        if (!buffer || buffer.updating) return;
+        if (audio.currentTime > 30 && buffer.buffered.length && buffer.buffered.start(0) < audio.currentTime - 30) {
+            buffer.remove(0, audio.currentTime - 10);
+        } else if (pending.length) {
+            buffer.appendBuffer(pending.shift());
+        }
+    };
+    mediaSource.addEventListener('sourceopen', () => {
+        buffer = mediaSource.addSourceBuffer('audio/mpeg');
+        buffer.mode = 'sequence';
+        buffer.addEventListener('updateend', flush);
+        flush();
+    }, {once: true});
+    window.__botAudioStream = {
+        push(chunk) {
+            pending.push(Uint8Array.from(atob(chunk), (c) => c.charCodeAt(0)));
+            flush();
+            if (audio.paused) audio.play().catch(() => {});
+        },
+    };
+}
+"""
+
 
 class DeepgramRealTimeTranscriber:
     """Real-time speech-to-text using Deepgram."""
@@ -47,33 +106,33 @@ class DeepgramRealTimeTranscriber:
             logger.warning("Deepgram API key not configured")
             return ""
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://api.deepgram.com/v1/listen",
-                headers={
-                    "Authorization": f"Token {self.api_key}",
-                    "Content-Type": "audio/wav",
-                },
-                content=audio_data,
-                params={
-                    "model": "nova-2",
-                    "smart_format": "true",
-                    "language": "en",
-                },
-            )
+        client = http_client.client
+        response = await client.post(
+            "https://api.deepgram.com/v1/listen",
+            headers={
+                "Authorization": f"Token {self.api_key}",
+                "Content-Type": "audio/wav",
+            },
+            content=audio_data,
+            params={
+                "model": "nova-2",
+                "smart_format": "true",
+                "language": "en",
+            },
+        )
             
-            if response.status_code == 200:
-                data = response.json()
-                transcript = (
-                    data.get("results", {})
-                    .get("channels", [{}])[0]
-                    .get("alternatives", [{}])[0]
-                    .get("transcript", "")
-                )
-                return transcript
+        if response.status_code == 200:
+            data = response.json()
+            transcript = (
+                data.get("results", {})
+                .get("channels", [{}])[0]
+                .get("alternatives", [{}])[0]
+                .get("transcript", "")
+            )
+            return transcript
             
-            logger.error("Deepgram transcription failed", status=response.status_code)
-            return ""
+        logger.error("Deepgram transcription failed", status=response.status_code)
+        return ""
 
 
 class ZoomRealTimeBot:
@@ -99,33 +158,33 @@ class ZoomRealTimeBot:
             if datetime.utcnow() < self._token_expires:
                 return self._access_token
 
-        async with httpx.AsyncClient() as client:
-            auth = base64.b64encode(
-                f"{self.client_id}:{self.client_secret}".encode()
-            ).decode()
+        client = http_client.client
+        auth = base64.b64encode(
+            f"{self.client_id}:{self.client_secret}".encode()
+        ).decode()
             
-            response = await client.post(
-                "https://zoom.us/oauth/token",
-                headers={
-                    "Authorization": f"Basic {auth}",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                },
-                data={
-                    "grant_type": "account_credentials",
-                    "account_id": self.account_id,
-                },
-            )
+        response = await client.post(
+            "https://zoom.us/oauth/token",
+            headers={
+                "Authorization": f"Basic {auth}",
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+            data={
+                "grant_type": "account_credentials",
+                "account_id": self.account_id,
+            },
+        )
             
-            if response.status_code == 200:
-                data = response.json()
-                self._access_token = data["access_token"]
-                from datetime import timedelta
-                self._token_expires = datetime.utcnow() + timedelta(
-                    seconds=data.get("expires_in", 3600) - 60
-                )
-                return self._access_token
+        if response.status_code == 200:
+            data = response.json()
+            self._access_token = data["access_token"]
+            from datetime import timedelta
+            self._token_expires = datetime.utcnow() + timedelta(
+                seconds=data.get("expires_in", 3600) - 60
+            )
+            return self._access_token
             
-            raise Exception(f"Zoom auth failed: {response.text}")
+        raise Exception(f"Zoom auth failed: {response.text}")
 
     def parse_meeting_url(self, url: str) -> dict[str, str]:
         """Parse a Zoom meeting URL to extract meeting ID and password."""
@@ -436,15 +495,42 @@ class ZoomRealTimeBot:
         ]
 
 
+class BotCapacityError(Exception):
+    """Raised when every browser bot slot is taken."""
+
+
 class PlaywrightZoomBot:
     """Zoom bot that joins meetings via browser using Playwright.
     
     This bot can actually join Zoom meetings via the web client
     and interact with the meeting.
+
+    All bots share one Chromium instance; each meeting gets its own
+    incognito context. The browser is replaced after a number of joins to
+    bound memory growth, and retired browsers close once their last
+    context does.
     """
 
     def __init__(self):
         self.active_bots: dict[str, dict] = {}
+        self._join_tasks: dict[str, asyncio.Task] = {}
+        # session_id -> (status, orjson-encoded list entry)
+        self._bot_json_cache: dict[str, tuple[str | None, bytes]] = {}
+        self._speech_queues: dict[str, asyncio.Queue] = {}
+        self._speech_workers: dict[str, asyncio.Task] = {}
+        # Bots whose worker is synthesizing or playing a dequeued batch
+        self._speaking: set[str] = set()
+        self._playwright = None
+        self._browser = None
+        self._browser_lock = asyncio.Lock()
+        self._browser_joins = 0
+        self._browser_users: dict[Any, int] = {}
+        # Bots holding a slot under the concurrency cap; failed joins give
+        # theirs back while staying listed with their error
+        self._bots_in_use = 0
+        # Bound once; settings are frozen after startup
+        self._max_bots = settings.zoom_max_concurrent_bots
+        self._browser_recycle_after = settings.zoom_browser_recycle_after
 
     async def join_meeting_browser(
         self,
@@ -458,7 +544,10 @@ class PlaywrightZoomBot:
         Opens a Chromium browser and joins the Zoom web client.
         """
         import re
-        from playwright.async_api import async_playwright
+        # Take the slot before the first await so concurrent joins cannot
+        # all pass the check
+        if self._bots_in_use >= self._max_bots:
+            raise BotCapacityError("Maximum number of concurrent browser bots reached")
 
         session_id = str(uuid4())
         
@@ -471,33 +560,41 @@ class PlaywrightZoomBot:
             pwd_match = re.search(r'pwd=([^&\s]+)', meeting_url)
             passcode = pwd_match.group(1) if pwd_match else None
 
-        # Start voice agent session
-        agent_session = await voice_onboarding_agent.start_voice_session(
-            user_id=f"playwright_zoom_{session_id}",
-            user_name=bot_name,
-            user_department=user_department,
-            session_type="zoom_browser",
-            zoom_meeting_id=meeting_id,
-        )
-
         session = {
             "session_id": session_id,
             "meeting_id": meeting_id,
             "meeting_url": meeting_url,
             "passcode": passcode,
             "bot_name": bot_name,
-            "agent_session_id": agent_session["session_id"],
+            "agent_session_id": None,
             "status": "launching",
             "created_at": datetime.utcnow().isoformat(),
             "browser": None,
+            "context": None,
             "page": None,
-            "playwright": None,
+            "holds_slot": True,
         }
-
+        self._bots_in_use += 1
         self.active_bots[session_id] = session
 
-        # Launch browser in background task
-        asyncio.create_task(self._launch_and_join(session_id))
+        # Start voice agent session
+        try:
+            agent_session = await voice_onboarding_agent.start_voice_session(
+                user_id=f"playwright_zoom_{session_id}",
+                user_name=bot_name,
+                user_department=user_department,
+                session_type="zoom_browser",
+                zoom_meeting_id=meeting_id,
+            )
+        except BaseException:
+            self.active_bots.pop(session_id, None)
+            self._free_slot(session)
+            raise
+        session["agent_session_id"] = agent_session["session_id"]
+
+        # Launch browser in background task; keep a reference so the join and
+        # keep-alive loop cannot be garbage collected mid-meeting
+        self._join_tasks[session_id] = asyncio.create_task(self._launch_and_join(session_id))
 
         return {
             "session_id": session_id,
@@ -508,50 +605,125 @@ class PlaywrightZoomBot:
             "agent_session": agent_session,
         }
 
-    async def _launch_and_join(self, session_id: str):
-        """Background task to launch browser and join meeting."""
+    def _free_slot(self, session: dict) -> None:
+        """Give a bot's slot under the concurrency cap back, at most once."""
+        if session.pop("holds_slot", False):
+            self._bots_in_use -= 1
+
+    @staticmethod
+    async def _await_or_clean_up(
+        creating: Awaitable[Any], clean_up: Callable[[Any], Awaitable[Any]]
+    ) -> Any:
+        """Await a browser resource, cleaning it up if the join is cancelled first.
+
+        leave_meeting cancels an in-progress join; without this, a browser
+        hold or context created while the cancel lands would never reach the
+        session and would leak in the shared browser.
+        """
+        task = asyncio.ensure_future(creating)
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            try:
+                await clean_up(await task)
+            except Exception as e:
+                logger.debug("Could not clean up after cancelled join", error=str(e))
+            raise
+
+    async def _acquire_browser(self):
+        """Get the shared browser, launching or recycling it as needed."""
         from playwright.async_api import async_playwright
 
+        async with self._browser_lock:
+            if self._browser and self._browser_joins >= self._browser_recycle_after:
+                # Retire the current browser; it closes when its last bot leaves
+                retired = self._browser
+                self._browser = None
+                if not self._browser_users.get(retired):
+                    await self._close_browser(retired)
+
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+
+                # Use headless=True for server environments, False for interactive use
+                # Set ZOOM_BOT_HEADLESS=false to see the browser
+                import os
+                headless = os.environ.get("ZOOM_BOT_HEADLESS", "true").lower() != "false"
+
+                logger.info("Launching shared browser for Zoom bots")
+                self._browser = await self._playwright.chromium.launch(
+                    headless=headless,
+                    args=_BROWSER_ARGS,
+                )
+                self._browser_joins = 0
+
+            self._browser_joins += 1
+            self._browser_users[self._browser] = self._browser_users.get(self._browser, 0) + 1
+            return self._browser
+
+    async def _release_browser(self, browser) -> None:
+        """Drop a bot's hold on a browser, closing it if it was retired."""
+        async with self._browser_lock:
+            remaining = self._browser_users.get(browser, 1) - 1
+            if remaining > 0:
+                self._browser_users[browser] = remaining
+                return
+            self._browser_users.pop(browser, None)
+            if browser is not self._browser:
+                await self._close_browser(browser)
+
+    async def _close_browser(self, browser) -> None:
+        """Close a browser, ignoring errors from an already-dead process."""
+        self._browser_users.pop(browser, None)
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.warning("Error closing browser", error=str(e))
+
+    async def close(self) -> None:
+        """Leave all meetings and shut down the shared browser."""
+        for session_id in list(self.active_bots):
+            await self.leave_meeting(session_id)
+        if self._browser:
+            await self._close_browser(self._browser)
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _launch_and_join(self, session_id: str):
+        """Background task to open a browser context and join meeting."""
         session = self.active_bots.get(session_id)
         if not session:
             return
 
         try:
-            logger.info("Launching browser for Zoom", session_id=session_id)
-            
-            playwright = await async_playwright().start()
-            session["playwright"] = playwright
-
-            # Launch browser
-            # Use headless=True for server environments, False for interactive use
-            # Set ZOOM_BOT_HEADLESS=false to see the browser
-            import os
-            headless = os.environ.get("ZOOM_BOT_HEADLESS", "true").lower() != "false"
-
-            browser = await playwright.chromium.launch(
-                headless=headless,
-                args=[
-                    "--use-fake-ui-for-media-stream",
-                    "--use-fake-device-for-media-stream",
-                    "--auto-accept-camera-and-microphone-capture",
-                    "--disable-web-security",
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                ]
+            logger.info("Opening browser context for Zoom", session_id=session_id)
+
+            browser = await self._await_or_clean_up(
+                self._acquire_browser(), self._release_browser
             )
             session["browser"] = browser
             session["status"] = "browser_launched"
 
-            # Create context with permissions
-            context = await browser.new_context(
-                permissions=["microphone", "camera"],
-                viewport={"width": 1280, "height": 720},
+            # Create an isolated context with permissions. Once it is on the
+            # session, leave_meeting owns closing it.
+            context = await self._await_or_clean_up(
+                browser.new_context(
+                    permissions=["microphone", "camera"],
+                    viewport={"width": 1280, "height": 720},
+                ),
+                lambda context: context.close(),
             )
+            session["context"] = context
+            await context.add_init_script(f"({_AUDIO_STREAM_JS})();")
 
             page = await context.new_page()
             session["page"] = page
+            # Raw CDP channel for in-meeting actions, bypassing Playwright's
+            # evaluate() wrapper on the hot path
+            session["cdp"] = await context.new_cdp_session(page)
             session["status"] = "navigating"
 
             # Convert to web client URL
@@ -622,17 +794,44 @@ class PlaywrightZoomBot:
             session["status"] = "in_meeting"
             logger.info("Bot joined meeting successfully", session_id=session_id)
 
-            # Keep session alive
+            # The meeting UI is loaded; stop the page from growing an HTTP cache
+            try:
+                await session["cdp"].send("Network.setCacheDisabled", {"cacheDisabled": True})
+            except Exception as e:
+                logger.debug("Could not disable page cache", error=str(e))
+
+            # Keep session alive, trimming page memory while idle
+            idle_seconds = 0
             while session_id in self.active_bots:
                 await asyncio.sleep(1)
+                idle_seconds += 1
+                if idle_seconds >= BOT_MEMORY_TRIM_INTERVAL:
+                    idle_seconds = 0
+                    await self._trim_page_memory(session_id)
 
         except Exception as e:
             logger.error("Failed to join meeting", error=str(e), session_id=session_id)
             session["status"] = "error"
             session["error"] = str(e)
+            # Keep the entry for status polling but free its slot and browser
+            context, session["context"] = session.get("context"), None
+            session["page"] = session["cdp"] = None
+            if context:
+                try:
+                    await context.close()
+                except Exception as close_error:
+                    logger.warning("Error closing browser context", error=str(close_error))
+            browser, session["browser"] = session.get("browser"), None
+            if browser:
+                await self._release_browser(browser)
+            self._free_slot(session)
 
     async def speak_in_meeting(self, session_id: str, text: str) -> dict[str, Any]:
-        """Make the bot speak in the meeting by playing audio."""
+        """Make the bot speak in the meeting by playing audio.
+
+        Requests are queued per bot; a single worker drains whatever is
+        pending and streams each reply into the page's audio player in order.
+        """
         session = self.active_bots.get(session_id)
         if not session:
             return {"status": "error", "error": "Session not found"}
@@ -640,28 +839,119 @@ class PlaywrightZoomBot:
         if not session.get("page"):
             return {"status": "error", "error": "Browser not ready"}
 
-        # Generate audio
-        audio = await elevenlabs_client.synthesize(
-            text=text,
-            model_id="eleven_turbo_v2_5",
-        )
+        queue = self._speech_queues.get(session_id)
+        if queue is None:
+            queue = self._speech_queues[session_id] = asyncio.Queue()
+            self._speech_workers[session_id] = asyncio.create_task(
+                self._speech_worker(session_id, queue)
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((text, future))
+        return await future
+
+    async def _speech_worker(self, session_id: str, queue: asyncio.Queue) -> None:
+        """Drain queued speech requests for a bot in batches."""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < SPEECH_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
 
-        if audio:
-            # Play audio through browser
-            audio_b64 = base64.b64encode(audio).decode()
+            error = {"status": "error", "error": "Session ended"}
+            self._speaking.add(session_id)
             try:
-                await session["page"].evaluate(f"""
-                    (async () => {{
-                        const audio = new Audio('data:audio/mp3;base64,{audio_b64}');
-                        audio.volume = 1.0;
-                        await audio.play();
-                    }})();
-                """)
-                return {"status": "spoken", "text": text}
+                await self._speak_batch(session_id, batch)
             except Exception as e:
-                return {"status": "error", "error": str(e), "audio_available": True}
-        
-        return {"status": "error", "error": "Failed to generate audio"}
+                error = {"status": "error", "error": str(e)}
+            finally:
+                self._speaking.discard(session_id)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(error)
+
+    async def _speak_batch(
+        self, session_id: str, batch: list[tuple[str, asyncio.Future]]
+    ) -> None:
+        """Stream synthesized audio for a batch of texts into the page in order.
+
+        Each caller's future is resolved as soon as its own text has played.
+        """
+        session = self.active_bots.get(session_id)
+        if not session or not session.get("page"):
+            raise RuntimeError("Session not found")
+
+        for text, future in batch:
+            try:
+                streamed = await self._stream_speech(session, text)
+            except Exception as e:
+                result = {"status": "error", "error": str(e)}
+            else:
+                result = (
+                    {"status": "spoken", "text": text}
+                    if streamed
+                    else {"status": "error", "error": "Failed to generate audio"}
+                )
+            if not future.done():
+                future.set_result(result)
+
+    async def _stream_speech(self, session: dict, text: str) -> bool:
+        """Push TTS audio to the page while ElevenLabs is still synthesizing it.
+
+        Returns whether any audio was produced.
+        """
+        chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+
+        async def synthesize() -> None:
+            try:
+                async for chunk in elevenlabs_client.synthesize_stream(
+                    text=text,
+                    model_id="eleven_turbo_v2_5",
+                    chunk_size=SPEECH_STREAM_CHUNK,
+                ):
+                    await chunks.put(chunk)
+            finally:
+                await chunks.put(None)
+
+        async def play() -> bool:
+            streamed = False
+            while (chunk := await chunks.get()) is not None:
+                await self._push_audio(session, base64.b64encode(chunk).decode())
+                streamed = True
+            return streamed
+
+        _, streamed = await asyncio.gather(synthesize(), play())
+        return streamed
+
+    async def _trim_page_memory(self, session_id: str) -> None:
+        """Release page memory for a bot with no speech queued or in flight."""
+        queue = self._speech_queues.get(session_id)
+        session = self.active_bots.get(session_id)
+        if not session or not session.get("cdp") or (queue and not queue.empty()):
+            return
+        if session_id in self._speaking:
+            return
+
+        try:
+            await session["cdp"].send("HeapProfiler.collectGarbage")
+            # Ask Chromium to drop decoded-image and other purgeable caches
+            await session["cdp"].send("Memory.simulatePressureNotification", {"level": "moderate"})
+        except Exception as e:
+            logger.debug("Page memory trim failed", session_id=session_id, error=str(e))
+
+    async def _push_audio(self, session: dict, chunk: str) -> None:
+        """Append an audio chunk to the page player, via raw CDP when available."""
+        cdp = session.get("cdp")
+        if cdp is None:
+            await session["page"].evaluate("(chunk) => window.__botAudioStream.push(chunk)", chunk)
+            return
+
+        result = await cdp.send("Runtime.evaluate", {
+            "expression": f"window.__botAudioStream.push({json.dumps(chunk)})",
+            "returnByValue": True,
+        })
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            raise RuntimeError(details.get("exception", {}).get("description") or details.get("text"))
 
     async def leave_meeting(self, session_id: str) -> dict[str, Any]:
         """Leave the meeting and close browser."""
@@ -670,20 +960,39 @@ class PlaywrightZoomBot:
         if not session:
             return {"status": "not_found"}
 
-        # Close browser
+        self._free_slot(session)
+        self._bot_json_cache.pop(session_id, None)
+
+        # Abort a join still in progress so it cannot open a context after we leave
+        join_task = self._join_tasks.pop(session_id, None)
+        if join_task and join_task is not asyncio.current_task():
+            join_task.cancel()
+
+        # Stop the speech worker and fail any requests still queued
+        worker = self._speech_workers.pop(session_id, None)
+        if worker:
+            worker.cancel()
+        queue = self._speech_queues.pop(session_id, None)
+        while queue is not None and not queue.empty():
+            _, future = queue.get_nowait()
+            if not future.done():
+                future.set_result({"status": "error", "error": "Session ended"})
+
+        # Close this bot's context; the shared browser stays up
         try:
-            if session.get("browser"):
-                await session["browser"].close()
-            if session.get("playwright"):
-                await session["playwright"].stop()
+            if session.get("context"):
+                await session["context"].close()
         except Exception as e:
-            logger.warning("Error closing browser", error=str(e))
+            logger.warning("Error closing browser context", error=str(e))
+        if session.get("browser"):
+            await self._release_browser(session["browser"])
 
         # End voice agent session
-        try:
-            await voice_onboarding_agent.end_session(session["agent_session_id"])
-        except Exception:
-            pass
+        if session.get("agent_session_id"):
+            try:
+                await voice_onboarding_agent.end_session(session["agent_session_id"])
+            except Exception:
+                pass
 
         return {
             "session_id": session_id,
@@ -717,6 +1026,26 @@ class PlaywrightZoomBot:
             for s in self.active_bots.values()
         ]
 
+    def list_bots_json(self) -> bytes:
+        """Serialized ``{"bots": [...], "count": N}`` body for the list endpoint.
+
+        Each bot's entry is encoded once and reused until its status changes.
+        """
+        entries = []
+        for session_id, session in self.active_bots.items():
+            status = session.get("status")
+            cached = self._bot_json_cache.get(session_id)
+            if cached is None or cached[0] != status:
+                cached = (status, orjson.dumps({
+                    "session_id": session_id,
+                    "meeting_id": session.get("meeting_id"),
+                    "status": status,
+                    "bot_name": session.get("bot_name"),
+                }))
+                self._bot_json_cache[session_id] = cached
+            entries.append(cached[1])
+        return b'{"bots":[' + b",".join(entries) + b'],"count":' + str(len(entries)).encode() + b"}"
+
 
 # Singleton instances
 zoom_realtime_bot = ZoomRealTimeBot()
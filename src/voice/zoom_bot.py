@@ -19,10 +19,10 @@ from datetime import datetime
 from typing import Any, Callable
 from uuid import uuid4
 
-import httpx
 import structlog
 
 from src.config import settings
+from src.http_client import http_client
 from src.voice.agent import voice_onboarding_agent
 from src.voice.elevenlabs_client import elevenlabs_client
 
@@ -51,39 +51,39 @@ class ZoomMeetingBot:
             if datetime.utcnow() < self._token_expires:
                 return self._access_token
 
-        async with httpx.AsyncClient() as client:
-            auth = base64.b64encode(
-                f"{self.client_id}:{self.client_secret}".encode()
-            ).decode()
+        client = http_client.client
+        auth = base64.b64encode(
+            f"{self.client_id}:{self.client_secret}".encode()
+        ).decode()
             
-            response = await client.post(
-                "https://zoom.us/oauth/token",
-                headers={
-                    "Authorization": f"Basic {auth}",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                },
-                data={
-                    "grant_type": "account_credentials",
-                    "account_id": self.account_id,
-                },
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                self._access_token = data["access_token"]
-                from datetime import timedelta
-                self._token_expires = datetime.utcnow() + timedelta(
-                    seconds=data.get("expires_in", 3600) - 60
-                )
-                logger.info("Zoom access token obtained")
-                return self._access_token
+        response = await client.post(
+            "https://zoom.us/oauth/token",
+            headers={
+                "Authorization": f"Basic {auth}",
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+            data={
+                "grant_type": "account_credentials",
+                "account_id": self.account_id,
+            },
+        )
             
-            logger.error(
-                "Failed to get Zoom access token",
-                status=response.status_code,
-                error=response.text,
+        if response.status_code == 200:
+            data = response.json()
+            self._access_token = data["access_token"]
+            from datetime import timedelta
+            self._token_expires = datetime.utcnow() + timedelta(
+                seconds=data.get("expires_in", 3600) - 60
             )
-            raise Exception(f"Zoom auth failed: {response.text}")
+            logger.info("Zoom access token obtained")
+            return self._access_token
+            
+        logger.error(
+            "Failed to get Zoom access token",
+            status=response.status_code,
+            error=response.text,
+        )
+        raise Exception(f"Zoom auth failed: {response.text}")
 
     async def get_meeting_info(self, meeting_id: str) -> dict[str, Any]:
         """Get information about a Zoom meeting."""
@@ -92,22 +92,22 @@ class ZoomMeetingBot:
         # Clean meeting ID (remove spaces and dashes)
         clean_id = meeting_id.replace(" ", "").replace("-", "")
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/meetings/{clean_id}",
-                headers={"Authorization": f"Bearer {token}"},
-            )
+        client = http_client.client
+        response = await client.get(
+            f"{self.base_url}/meetings/{clean_id}",
+            headers={"Authorization": f"Bearer {token}"},
+        )
             
-            if response.status_code == 200:
-                return response.json()
+        if response.status_code == 200:
+            return response.json()
             
-            logger.error(
-                "Failed to get meeting info",
-                meeting_id=meeting_id,
-                status=response.status_code,
-                error=response.text,
-            )
-            return {}
+        logger.error(
+            "Failed to get meeting info",
+            meeting_id=meeting_id,
+            status=response.status_code,
+            error=response.text,
+        )
+        return {}
 
     async def create_meeting(
         self,
@@ -118,42 +118,42 @@ class ZoomMeetingBot:
         """Create a new Zoom meeting for onboarding."""
         token = await self.get_access_token()
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/users/{user_id}/meetings",
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json",
+        client = http_client.client
+        response = await client.post(
+            f"{self.base_url}/users/{user_id}/meetings",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "topic": topic,
+                "type": 2,  # Scheduled meeting
+                "duration": duration,
+                "settings": {
+                    "host_video": True,
+                    "participant_video": True,
+                    "join_before_host": True,
+                    "mute_upon_entry": False,
+                    "auto_recording": "none",
                 },
-                json={
-                    "topic": topic,
-                    "type": 2,  # Scheduled meeting
-                    "duration": duration,
-                    "settings": {
-                        "host_video": True,
-                        "participant_video": True,
-                        "join_before_host": True,
-                        "mute_upon_entry": False,
-                        "auto_recording": "none",
-                    },
-                },
-            )
-            
-            if response.status_code == 201:
-                meeting = response.json()
-                logger.info(
-                    "Meeting created",
-                    meeting_id=meeting.get("id"),
-                    join_url=meeting.get("join_url"),
-                )
-                return meeting
+            },
+        )
             
-            logger.error(
-                "Failed to create meeting",
-                status=response.status_code,
-                error=response.text,
+        if response.status_code == 201:
+            meeting = response.json()
+            logger.info(
+                "Meeting created",
+                meeting_id=meeting.get("id"),
+                join_url=meeting.get("join_url"),
             )
-            return {}
+            return meeting
+            
+        logger.error(
+            "Failed to create meeting",
+            status=response.status_code,
+            error=response.text,
+        )
+        return {}
 
     async def start_bot_session(
         self,
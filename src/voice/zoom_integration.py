@@ -16,12 +16,12 @@ from datetime import datetime
 from typing import Any, Callable
 from uuid import uuid4
 
-import httpx
 import structlog
 import websockets
 from websockets.exceptions import ConnectionClosed
 
 from src.config import settings
+from src.http_client import http_client
 from src.voice.agent import voice_onboarding_agent
 from src.voice.elevenlabs_client import elevenlabs_client
 
@@ -50,33 +50,33 @@ class ZoomCredentials:
         if self._access_token and self._token_expires and datetime.utcnow() < self._token_expires:
             return self._access_token
 
-        async with httpx.AsyncClient() as client:
-            auth = base64.b64encode(
-                f"{self.client_id}:{self.client_secret}".encode()
-            ).decode()
+        client = http_client.client
+        auth = base64.b64encode(
+            f"{self.client_id}:{self.client_secret}".encode()
+        ).decode()
             
-            response = await client.post(
-                "https://zoom.us/oauth/token",
-                headers={
-                    "Authorization": f"Basic {auth}",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                },
-                data={
-                    "grant_type": "account_credentials",
-                    "account_id": self.account_id,
-                },
-            )
+        response = await client.post(
+            "https://zoom.us/oauth/token",
+            headers={
+                "Authorization": f"Basic {auth}",
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+            data={
+                "grant_type": "account_credentials",
+                "account_id": self.account_id,
+            },
+        )
             
-            if response.status_code == 200:
-                data = response.json()
-                self._access_token = data["access_token"]
-                # Token typically valid for 1 hour
-                from datetime import timedelta
-                self._token_expires = datetime.utcnow() + timedelta(seconds=data.get("expires_in", 3600) - 60)
-                return self._access_token
+        if response.status_code == 200:
+            data = response.json()
+            self._access_token = data["access_token"]
+            # Token typically valid for 1 hour
+            from datetime import timedelta
+            self._token_expires = datetime.utcnow() + timedelta(seconds=data.get("expires_in", 3600) - 60)
+            return self._access_token
             
-            logger.error("Failed to get Zoom access token", status=response.status_code)
-            raise Exception("Failed to authenticate with Zoom")
+        logger.error("Failed to get Zoom access token", status=response.status_code)
+        raise Exception("Failed to authenticate with Zoom")
 
 
 class ZoomVoiceIntegration:
@@ -98,17 +98,17 @@ class ZoomVoiceIntegration:
         """Get information about a Zoom meeting."""
         token = await self.credentials.get_access_token()
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/meetings/{meeting_id}",
-                headers={"Authorization": f"Bearer {token}"},
-            )
+        client = http_client.client
+        response = await client.get(
+            f"{self.base_url}/meetings/{meeting_id}",
+            headers={"Authorization": f"Bearer {token}"},
+        )
             
-            if response.status_code == 200:
-                return response.json()
+        if response.status_code == 200:
+            return response.json()
             
-            logger.error("Failed to get meeting info", meeting_id=meeting_id)
-            return {}
+        logger.error("Failed to get meeting info", meeting_id=meeting_id)
+        return {}
 
     async def join_meeting(
         self,
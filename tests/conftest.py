@@ -35,7 +35,8 @@ def test_settings() -> Settings:
 @pytest.fixture(autouse=True)
 def force_anthropic_provider(monkeypatch):
     """Force anthropic provider for deterministic unit tests."""
-    monkeypatch.setattr(settings, "llm_provider", "anthropic", raising=False)
+    # Settings is frozen, so patch the field value directly
+    monkeypatch.setitem(settings.__dict__, "llm_provider", "anthropic")
 
 
 @pytest.fixture(autouse=True)
@@ -345,3 +345,26 @@ class TestEvaluatorSchemas:
         )
         assert len(params.evaluators) == 2
         assert params.eval_inputs.ideal_output == "test"
+
+
+class TestKeywordsAICacheParams:
+    """Tests for the shared gateway cache parameters."""
+
+    def test_cache_params_are_read_only(self):
+        """Test that the process-wide cache parameters cannot be changed."""
+        from src.observability.keywords_ai import KEYWORDS_AI_CACHE_PARAMS
+
+        with pytest.raises(TypeError):
+            KEYWORDS_AI_CACHE_PARAMS["cache_enabled"] = False  # type: ignore[index]
+
+    def test_cache_body_is_a_fresh_copy(self):
+        """Test that mutating one request's extra_body leaves the next untouched."""
+        from src.observability.keywords_ai import keywords_ai_cache_body
+
+        body = keywords_ai_cache_body()
+        body["cache_enabled"] = False
+        for value in body.values():
+            if isinstance(value, dict):
+                value["mutated"] = True
+
+        assert keywords_ai_cache_body() != body
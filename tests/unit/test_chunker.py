@@ -0,0 +1,74 @@
+"""Unit tests for document chunking."""
+
+import pytest
+from unittest.mock import patch
+
+
+class _CharEncoding:
+    """Offline stand-in for a tiktoken encoding: one token per character."""
+
+    def encode_ordinary(self, text):
+        return [ord(c) for c in text]
+
+    def encode_ordinary_batch(self, texts):
+        return [self.encode_ordinary(text) for text in texts]
+
+    def decode_with_offsets(self, tokens):
+        return "".join(map(chr, tokens)), list(range(len(tokens)))
+
+
+@pytest.fixture
+def make_chunker():
+    """Build chunkers without downloading a tokenizer."""
+    with patch("tiktoken.get_encoding", return_value=_CharEncoding()):
+        from src.knowledge.indexing.chunker import DocumentChunker
+
+        yield lambda **kwargs: DocumentChunker(**kwargs)
+
+
+class TestDocumentChunker:
+    """Tests for the document chunker."""
+
+    def test_windows_cover_text_and_stop(self, make_chunker):
+        """Test that token windows overlap, end at the text's end and terminate."""
+        chunker = make_chunker(chunk_size=10, chunk_overlap=3)
+
+        assert chunker._windows(10) == [(0, 10)]
+        assert chunker._windows(25) == [(0, 10), (7, 17), (14, 24), (21, 25)]
+
+    @pytest.mark.parametrize("overlap", [-1, 10, 11])
+    def test_invalid_overlap_raises(self, make_chunker, overlap):
+        """Test that overlap must be non-negative and smaller than the chunk size."""
+        with pytest.raises(ValueError, match="chunk_overlap"):
+            make_chunker(chunk_size=10, chunk_overlap=overlap)
+
+    def test_semantic_chunk_offsets_slice_the_text(self, make_chunker):
+        """Test that each semantic chunk's offsets point at its own text."""
+        chunker = make_chunker(chunk_size=100, chunk_overlap=10)
+        text = "Intro para\n\n## Header\nbody text\n\n   \n\n  spaced out  \n\nTail"
+
+        chunks = chunker.chunk_text(text)
+
+        assert [c.text for c in chunks] == [
+            "Intro para", "## Header\nbody text", "spaced out", "Tail",
+        ]
+        for chunk in chunks:
+            assert text[chunk.start_idx:chunk.end_idx] == chunk.text
+            assert chunk.token_count == len(chunk.text)
+
+    def test_token_chunk_offsets_slice_the_text(self, make_chunker):
+        """Test that oversized parts split into overlapping windows at the right offsets."""
+        chunker = make_chunker(chunk_size=10, chunk_overlap=3)
+        paragraph = "abcdefghijklmnopqrstuvwxy"
+        text = "Short\n\n" + paragraph
+
+        chunks = chunker.chunk_text(text)
+
+        assert chunks[0].text == "Short"
+        windows = chunks[1:]
+        assert [c.text for c in windows] == [
+            "abcdefghij", "hijklmnopq", "opqrstuvwx", "vwxy",
+        ]
+        assert [c.metadata["chunk_index"] for c in windows] == [0, 1, 2, 3]
+        for chunk in chunks:
+            assert text[chunk.start_idx:chunk.end_idx] == chunk.text
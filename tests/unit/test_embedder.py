@@ -0,0 +1,127 @@
+"""Unit tests for the embedding service."""
+
+import base64
+
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.knowledge.indexing.embedder import EmbeddingService
+
+
+@pytest.fixture
+def redis_mock():
+    """Redis client with MGET and a pipeline."""
+    client = MagicMock()
+    client.mget = AsyncMock(return_value=[])
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    client.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    client.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    client.pipe = pipe
+    with patch.object(EmbeddingService, "_redis", return_value=client):
+        yield client
+
+
+class TestEmbeddingCache:
+    """Tests for the content-hash embedding cache."""
+
+    @pytest.fixture
+    def service(self, redis_mock):
+        service = EmbeddingService()
+        service._generate_openai_embeddings = AsyncMock(
+            side_effect=lambda texts: np.ones((len(texts), 4), dtype=np.float32)
+        )
+        service._generate_voyage_embeddings = service._generate_openai_embeddings
+        return service
+
+    @pytest.mark.asyncio
+    async def test_miss_generates_and_writes_in_one_pipeline(self, service, redis_mock):
+        """Test that uncached texts are embedded together and cached together."""
+        redis_mock.mget.return_value = [None, None]
+
+        embeddings = await service.generate_embeddings(["a", "b"])
+
+        assert [e.tolist() for e in embeddings] == [[1.0] * 4] * 2
+        redis_mock.mget.assert_awaited_once()
+        assert redis_mock.pipe.set.call_count == 2
+        redis_mock.pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_hits_skip_the_provider(self, service, redis_mock):
+        """Test that in-process and Redis hits are not sent to the provider."""
+        await service.generate_embeddings(["a"])
+        cached = base64.b64encode(np.full(4, 2.0, dtype=np.float32).tobytes()).decode()
+        redis_mock.mget.reset_mock()
+        redis_mock.mget.return_value = [cached]
+        service._generate_openai_embeddings.reset_mock()
+
+        embeddings = await service.generate_embeddings(["a", "b"])
+
+        assert embeddings[0].tolist() == [1.0] * 4
+        assert embeddings[1].tolist() == [2.0] * 4
+        redis_mock.mget.assert_awaited_once_with([service._cache_key("b")])
+        service._generate_openai_embeddings.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_zero_vectors_are_not_cached(self, service, redis_mock):
+        """Test that placeholder embeddings never reach the caches."""
+        service._generate_openai_embeddings.side_effect = (
+            lambda texts: np.zeros((len(texts), 4), dtype=np.float32)
+        )
+        redis_mock.mget.return_value = [None]
+
+        await service.generate_embeddings(["a"])
+
+        assert not service._embedding_cache
+        redis_mock.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_short_batch_falls_back_per_text(self, service, redis_mock):
+        """Test that a batch missing rows is re-embedded text by text."""
+        redis_mock.mget.return_value = [None, None]
+        service._generate_openai_embeddings.side_effect = [
+            np.ones((1, 4), dtype=np.float32),  # one row for two texts
+            np.full((1, 4), 3.0, dtype=np.float32),
+            np.full((1, 4), 4.0, dtype=np.float32),
+        ]
+
+        embeddings = await service.generate_embeddings(["a", "b"])
+
+        assert [e.tolist() for e in embeddings] == [[3.0] * 4, [4.0] * 4]
+
+
+class TestBatchSearch:
+    """Tests for batched vector search."""
+
+    @pytest.mark.asyncio
+    async def test_one_request_for_all_queries(self):
+        """Test that every query goes out in a single batch request."""
+        service = EmbeddingService()
+        service.generate_embeddings = AsyncMock(
+            return_value=[np.ones(4, dtype=np.float32), np.zeros(4, dtype=np.float32)]
+        )
+        response = MagicMock()
+        response.json.return_value = {"result": [[{"id": 1, "score": 0.9}], []]}
+        http_client = MagicMock(is_closed=False)
+        http_client.post = AsyncMock(return_value=response)
+        service._http_client = http_client
+
+        results = await service.batch_search(
+            "knowledge", ["a", "b"], limit=5, filters=[{"team": "x"}, None]
+        )
+
+        assert results == [[{"score": 0.9, "payload": {}, "id": 1}], []]
+        http_client.post.assert_awaited_once()
+        path = http_client.post.call_args.args[0]
+        searches = http_client.post.call_args.kwargs["json"]["searches"]
+        assert path.endswith("/points/search/batch")
+        assert searches[0]["filter"] == {"must": [{"key": "team", "match": {"value": "x"}}]}
+        assert "filter" not in searches[1]
+        assert all(search["limit"] == 5 for search in searches)
+
+    @pytest.mark.asyncio
+    async def test_unknown_collection_raises(self):
+        """Test that an unknown collection name is rejected."""
+        with pytest.raises(ValueError, match="Unknown collection"):
+            await EmbeddingService().batch_search("nope", ["a"])
@@ -0,0 +1,162 @@
+"""Unit tests for the Neo4j client and query templates."""
+
+import ast
+import asyncio
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.knowledge.graph.client import Neo4jClient
+from src.knowledge.graph.queries import QueryTemplates
+
+
+def _record(data: dict) -> MagicMock:
+    record = MagicMock()
+    record.data.return_value = data
+    return record
+
+
+class TestNeo4jClient:
+    """Tests for the client read caches and hierarchy search."""
+
+    @pytest.fixture
+    def client(self):
+        client = Neo4jClient()
+        client.ensure_connected = AsyncMock()
+        return client
+
+    @pytest.mark.asyncio
+    async def test_cached_result_is_read_only(self, client):
+        """Test that cached results are shared read-only snapshots."""
+        client._run = AsyncMock(return_value=[_record({"id": "d1", "children": []})])
+
+        first = await client.get_department_hierarchy()
+        with pytest.raises(TypeError):
+            first[0]["children"] = ["mutated"]
+        second = await client.get_department_hierarchy()
+
+        assert second is first
+        assert second[0]["id"] == "d1"
+        assert second[0]["children"] == ()
+        assert client._run.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_read_overlapping_write_is_not_cached(self, client):
+        """Test that a read a write raced past does not repopulate the cache."""
+        release = asyncio.Event()
+
+        async def slow_read(query, **params):
+            await release.wait()
+            return [_record({"id": "d1"})]
+
+        client._run = AsyncMock(side_effect=slow_read)
+        read = asyncio.create_task(client.get_department_hierarchy())
+        await asyncio.sleep(0)
+        client._write_generation += 2  # a write started and finished meanwhile
+        release.set()
+        await read
+
+        assert client._hierarchy_cache.get("departments") is None
+
+    @pytest.mark.asyncio
+    async def test_blank_hierarchy_search_skips_fulltext_index(self, client):
+        """Test that a blank query filters contexts without the Lucene parser."""
+        client._run = AsyncMock(return_value=[])
+
+        await client.search_across_hierarchy("  ", tags=["Security"])
+
+        query = client._run.call_args.args[0]
+        assert "queryNodes" not in query
+        assert "query" not in client._run.call_args.kwargs
+        assert client._run.call_args.kwargs["tags"] == ["security"]
+
+    @pytest.mark.asyncio
+    async def test_first_page_of_recent_contexts_keeps_undated_rows(self, client):
+        """Test that only a page cursor filters recent contexts on created_at."""
+        client._run = AsyncMock(return_value=[])
+
+        await client.get_recent_contexts()
+        assert "created_at <" not in client._run.call_args.args[0]
+        assert "IS NOT NULL" not in client._run.call_args.args[0]
+
+        await client.get_recent_contexts(before=datetime(2026, 1, 1, tzinfo=UTC))
+        assert "c.created_at < $before" in client._run.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_driver_published_only_after_bootstrap(self):
+        """Test that a half-initialized driver is never visible to callers."""
+        client = Neo4jClient()
+        release = asyncio.Event()
+        driver = MagicMock()
+        driver.verify_connectivity = AsyncMock(side_effect=release.wait)
+        driver.close = AsyncMock()
+
+        with patch("src.knowledge.graph.client.AsyncGraphDatabase.driver", return_value=driver), \
+                patch.object(client, "_init_schema", AsyncMock()):
+            connecting = asyncio.create_task(client.connect())
+            await asyncio.sleep(0)
+            assert client._driver is None
+            release.set()
+            await connecting
+
+        assert client._driver is driver
+
+    @pytest.mark.asyncio
+    async def test_sessions_connect_on_first_use(self):
+        """Test that opening a session lazily connects a disconnected client."""
+        client = Neo4jClient()
+        driver = MagicMock()
+        driver.session.return_value.__aenter__ = AsyncMock(return_value="session")
+        driver.session.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        async def connect():
+            client._driver = driver
+
+        with patch.object(client, "connect", AsyncMock(side_effect=connect)):
+            async with client.write_session() as session:
+                assert session == "session"
+
+        assert driver.session.call_args.kwargs["database"] == client._database
+
+
+class TestSessionDatabase:
+    """Tests that every driver session is pinned to the configured database."""
+
+    def test_driver_sessions_pass_database(self):
+        """Test that no code opens a driver session without database=."""
+        root = Path(__file__).resolve().parents[2]
+        unpinned = []
+        for path in [*root.joinpath("src").rglob("*.py"), *root.joinpath("workers").rglob("*.py")]:
+            for node in ast.walk(ast.parse(path.read_text())):
+                if (
+                    isinstance(node, ast.Call)
+                    and isinstance(node.func, ast.Attribute)
+                    and node.func.attr == "session"
+                    and "driver" in ast.unparse(node.func.value)
+                    and not any(kw.arg == "database" for kw in node.keywords)
+                ):
+                    unpinned.append(f"{path.relative_to(root)}:{node.lineno}")
+
+        assert unpinned == []
+
+
+class TestSearchByKeywords:
+    """Tests for the keyword search template."""
+
+    def test_no_keywords_searches_no_indexes(self):
+        """Test that an empty keyword list never reaches the Lucene parser."""
+        template = QueryTemplates.search_by_keywords([])
+        assert list(template.params["indexes"]) == []
+
+    def test_unindexed_node_type_raises(self):
+        """Test that labels without a keyword index are rejected."""
+        with pytest.raises(ValueError, match="Person"):
+            QueryTemplates.search_by_keywords(["deploy"], node_types=["Context", "Person"])
+
+    def test_keywords_are_quoted_and_escaped(self):
+        """Test that keywords are matched as escaped phrases."""
+        template = QueryTemplates.search_by_keywords(["ci/cd", "deploy"], node_types=["Context"])
+        assert template.params["lucene_query"] == '"ci\\/cd" OR "deploy"'
+        assert list(template.params["indexes"]) == ["context_content"]
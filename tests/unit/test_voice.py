@@ -0,0 +1,189 @@
+"""Unit tests for the browser-based Zoom bot."""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.voice.realtime_zoom import BotCapacityError, PlaywrightZoomBot
+
+
+class TestPlaywrightZoomBotCapacity:
+    """Tests for the concurrent browser bot cap."""
+
+    @pytest.fixture
+    def bot(self):
+        bot = PlaywrightZoomBot()
+        bot._max_bots = 1
+        return bot
+
+    @pytest.fixture
+    def mock_agent(self):
+        async def start_voice_session(**kwargs):
+            await asyncio.sleep(0)
+            return {"session_id": "agent-1"}
+
+        with patch("src.voice.realtime_zoom.voice_onboarding_agent") as agent:
+            agent.start_voice_session = AsyncMock(side_effect=start_voice_session)
+            agent.end_session = AsyncMock()
+            yield agent
+
+    @pytest.mark.asyncio
+    async def test_concurrent_joins_respect_cap(self, bot, mock_agent):
+        """Test that joins racing past the first await cannot exceed the cap."""
+        with patch.object(bot, "_launch_and_join", AsyncMock()):
+            results = await asyncio.gather(
+                bot.join_meeting_browser("https://zoom.us/j/111"),
+                bot.join_meeting_browser("https://zoom.us/j/222"),
+                return_exceptions=True,
+            )
+
+        assert sum(isinstance(r, BotCapacityError) for r in results) == 1
+        assert len(bot.active_bots) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_launch_frees_slot(self, bot, mock_agent):
+        """Test that a failed browser launch no longer counts against the cap."""
+        with patch.object(bot, "_launch_and_join", AsyncMock()):
+            joined = await bot.join_meeting_browser("https://zoom.us/j/111")
+
+        with patch.object(bot, "_acquire_browser", AsyncMock(side_effect=RuntimeError("boom"))):
+            await bot._launch_and_join(joined["session_id"])
+
+        assert bot.get_status(joined["session_id"])["status"] == "error"
+        with patch.object(bot, "_launch_and_join", AsyncMock()):
+            await bot.join_meeting_browser("https://zoom.us/j/222")
+        assert len(bot.active_bots) == 2
+
+    @pytest.mark.asyncio
+    async def test_leave_frees_slot_once(self, bot, mock_agent):
+        """Test that leaving a failed bot does not release its slot twice."""
+        with patch.object(bot, "_launch_and_join", AsyncMock()):
+            joined = await bot.join_meeting_browser("https://zoom.us/j/111")
+        with patch.object(bot, "_acquire_browser", AsyncMock(side_effect=RuntimeError("boom"))):
+            await bot._launch_and_join(joined["session_id"])
+
+        await bot.leave_meeting(joined["session_id"])
+
+        assert bot._bots_in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_leave_during_context_creation_closes_context(self, bot, mock_agent):
+        """Test that a context created while the join is cancelled is not leaked."""
+        with patch.object(bot, "_launch_and_join", AsyncMock()):
+            joined = await bot.join_meeting_browser("https://zoom.us/j/111")
+
+        creating = asyncio.Event()
+        release = asyncio.Event()
+        context = AsyncMock()
+        browser = AsyncMock()
+
+        async def new_context(**kwargs):
+            creating.set()
+            await release.wait()
+            return context
+
+        browser.new_context.side_effect = new_context
+        bot._browser = browser
+        bot._browser_users[browser] = 1
+
+        with patch.object(bot, "_acquire_browser", AsyncMock(return_value=browser)):
+            join = asyncio.create_task(bot._launch_and_join(joined["session_id"]))
+            bot._join_tasks[joined["session_id"]] = join
+            await creating.wait()
+            await bot.leave_meeting(joined["session_id"])
+            release.set()
+            with pytest.raises(asyncio.CancelledError):
+                await join
+
+        context.close.assert_awaited_once()
+        assert browser not in bot._browser_users
+
+    @pytest.mark.asyncio
+    async def test_capacity_error_maps_to_429(self, async_client):
+        """Test that only the capacity error is reported as 429."""
+        with patch(
+            "src.api.v1.voice_agent.playwright_zoom_bot.join_meeting_browser",
+            AsyncMock(side_effect=BotCapacityError("full")),
+        ):
+            response = await async_client.post(
+                "/api/v1/voice/agent/zoom/browser/join",
+                json={"meeting_url": "https://zoom.us/j/111"},
+            )
+        assert response.status_code == 429
+
+        with patch(
+            "src.api.v1.voice_agent.playwright_zoom_bot.join_meeting_browser",
+            AsyncMock(side_effect=ValueError("bad")),
+        ):
+            response = await async_client.post(
+                "/api/v1/voice/agent/zoom/browser/join",
+                json={"meeting_url": "https://zoom.us/j/111"},
+            )
+        assert response.status_code == 500
+
+
+class TestPlaywrightZoomBotMemoryTrim:
+    """Tests for idle page memory trimming."""
+
+    @pytest.mark.asyncio
+    async def test_trim_skipped_while_speech_in_flight(self):
+        """Test that a dequeued utterance still playing blocks the trim."""
+        bot = PlaywrightZoomBot()
+        cdp = AsyncMock()
+        bot.active_bots["s1"] = {"session_id": "s1", "cdp": cdp}
+        playing = asyncio.Event()
+        finish = asyncio.Event()
+
+        async def speak_batch(session_id, batch):
+            playing.set()
+            await finish.wait()
+            for _, future in batch:
+                future.set_result({"status": "spoken"})
+
+        with patch.object(bot, "_speak_batch", side_effect=speak_batch):
+            queue = asyncio.Queue()
+            worker = asyncio.create_task(bot._speech_worker("s1", queue))
+            future = asyncio.get_running_loop().create_future()
+            await queue.put(("hello", future))
+            await playing.wait()
+
+            await bot._trim_page_memory("s1")
+            cdp.send.assert_not_awaited()
+
+            finish.set()
+            await future
+            await bot._trim_page_memory("s1")
+            worker.cancel()
+
+        assert cdp.send.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_each_request_resolves_when_its_own_speech_ends(self):
+        """Test that the first caller in a batch does not wait for the rest."""
+        bot = PlaywrightZoomBot()
+        bot.active_bots["s1"] = {"session_id": "s1", "page": object()}
+        second_started = asyncio.Event()
+        finish_second = asyncio.Event()
+
+        async def stream_speech(session, text):
+            if text == "second":
+                second_started.set()
+                await finish_second.wait()
+            return True
+
+        loop = asyncio.get_running_loop()
+        first, second = loop.create_future(), loop.create_future()
+        with patch.object(bot, "_stream_speech", side_effect=stream_speech):
+            speaking = asyncio.create_task(
+                bot._speak_batch("s1", [("first", first), ("second", second)])
+            )
+            await second_started.wait()
+
+            assert first.result() == {"status": "spoken", "text": "first"}
+            assert not second.done()
+
+            finish_second.set()
+            await speaking
+
+        assert second.result() == {"status": "spoken", "text": "second"}
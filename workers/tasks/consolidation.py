@@ -223,7 +223,7 @@ async def _cleanup_old_contexts(days_old: int):
         RETURN count(c) as archived_count
         """
 
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.write_session() as session:
             result = await session.run(query, cutoff=cutoff_date.isoformat())
             record = await result.single()
             archived_count = record["archived_count"] if record else 0
@@ -269,7 +269,7 @@ async def _rebuild_embeddings(collection: str):
         RETURN c.id as id, c.content as content, c.title as title
         """
 
-        async with neo4j_client.driver.session() as session:
+        async with neo4j_client.read_session() as session:
             result = await session.run(query)
             records = await result.data()
 